@@ -2,25 +2,286 @@
 """
 Tesla Robotaxi Monitor - Archive Script
 Archives old reports and creates backups of historical data
+
+Files are split into fixed-size chunks and each chunk is stored once,
+compressed, under its SHA-256 in archive/objects/. Each archive directory
+only holds metadata listing the chunks of every file, so unchanged files
+(and the unchanged start of append-only files) cost nothing to archive
+again. Chunks are compressed in parallel threads (lzma and zlib release
+the GIL).
+
+    python3 archive.py                       Archive the current outputs
+    python3 archive.py --codec gz            Faster, larger gzip chunks
+    python3 archive.py restore <id> [dir]    Rebuild an archive's files
+
+Every archive is also indexed in archive/catalog.db (SQLite): timestamp,
+score, total runs, bytes stored and the SHA-256 of each archived file.
+
+    python3 archive.py query --below 45                 Archives scored under 45
+    python3 archive.py query --before 2025-12-01 --latest
+    python3 archive.py query --file-hash <sha256>       Archives containing a file version
+    python3 archive.py catalog                          Rebuild the catalog from metadata
 """
 
+import gzip
+import hashlib
+import lzma
 import os
 import shutil
 import json
+import sqlite3
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from history_store import HistoryStore
 
 # Get script directory
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 OUTPUT_DIR = os.path.join(SCRIPT_DIR, 'output')
 ARCHIVE_DIR = os.path.join(SCRIPT_DIR, 'archive')
+OBJECTS_DIR = os.path.join(ARCHIVE_DIR, 'objects')
+CATALOG_PATH = os.path.join(ARCHIVE_DIR, 'catalog.db')
+
+CATALOG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS archives (
+    id TEXT PRIMARY KEY,
+    created TEXT NOT NULL,
+    latest_score REAL,
+    latest_date TEXT,
+    total_runs INTEGER,
+    new_bytes INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS archive_files (
+    archive_id TEXT NOT NULL REFERENCES archives(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    sha256 TEXT,
+    size INTEGER,
+    PRIMARY KEY (archive_id, name)
+);
+CREATE INDEX IF NOT EXISTS idx_archives_created ON archives(created);
+CREATE INDEX IF NOT EXISTS idx_archives_score ON archives(latest_score);
+CREATE INDEX IF NOT EXISTS idx_archive_files_sha ON archive_files(sha256);
+"""
+
+CHUNK_SIZE = 256 * 1024
+
+# Codec -> (compress, decompress); 'raw' is used when compression does not pay off (e.g. PNG)
+CODECS = {
+    'xz': (lambda data: lzma.compress(data, preset=6), lzma.decompress),
+    'gz': (lambda data: gzip.compress(data, compresslevel=6, mtime=0), gzip.decompress),
+    'raw': (lambda data: data, lambda data: data),
+}
+
+
+def _object_path(digest: str, codec: str) -> str:
+    return os.path.join(OBJECTS_DIR, digest[:2], f"{digest}.{codec}")
+
+
+def _stored_codec(digest: str):
+    """Codec of an already stored chunk, or None"""
+    for codec in CODECS:
+        if os.path.exists(_object_path(digest, codec)):
+            return codec
+    return None
+
+
+def _store_chunk(digest: str, data: bytes, codec: str):
+    """Compress and write one chunk; returns (codec used, bytes written)"""
+    compressed = CODECS[codec][0](data)
+    if len(compressed) >= len(data) * 0.95:
+        codec, compressed = 'raw', data
+    path = _object_path(digest, codec)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(compressed)
+    os.replace(tmp_path, path)
+    return codec, len(compressed)
+
+
+def store_files(paths, codec: str = 'xz'):
+    """Chunk, deduplicate and compress files in parallel.
+
+    Returns ({file name: {'size', 'sha256', 'chunks': [[digest, codec], ...]}}, new bytes written).
+    """
+    manifest, new_chunks = {}, {}
+    for path in paths:
+        file_hash = hashlib.sha256()
+        chunks = []
+        with open(path, 'rb') as f:
+            for data in iter(lambda: f.read(CHUNK_SIZE), b''):
+                digest = hashlib.sha256(data).hexdigest()
+                file_hash.update(data)
+                stored = _stored_codec(digest)
+                if stored is None and digest not in new_chunks:
+                    new_chunks[digest] = data
+                chunks.append([digest, stored])
+        manifest[os.path.basename(path)] = {
+            'size': os.path.getsize(path),
+            'sha256': file_hash.hexdigest(),
+            'chunks': chunks
+        }
+    
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+        written = dict(zip(new_chunks, executor.map(
+            lambda item: _store_chunk(item[0], item[1], codec), new_chunks.items())))
+    
+    for entry in manifest.values():
+        entry['chunks'] = [[digest, stored or written[digest][0]] for digest, stored in entry['chunks']]
+    return manifest, sum(size for _, size in written.values())
+
+
+def _read_chunk(digest: str, codec: str) -> bytes:
+    with open(_object_path(digest, codec), 'rb') as f:
+        return CODECS[codec][1](f.read())
+
+
+def restore(archive_id: str, destination: str = None):
+    """Rebuild an archive's files (verifying their SHA-256) into destination.
+
+    Every file that can be restored is; a ValueError naming the archive and each
+    broken file or chunk is raised afterwards if any could not be.
+    """
+    archive_subdir = os.path.join(ARCHIVE_DIR, archive_id)
+    destination = destination or os.path.join(archive_subdir, 'restored')
+    try:
+        with open(os.path.join(archive_subdir, 'archive_metadata.json'), 'r') as f:
+            metadata = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ValueError(f"Archive {archive_id}: no readable archive_metadata.json ({e})")
+    os.makedirs(destination, exist_ok=True)
+    broken = []
+    
+    files = metadata.get('files')
+    if files is None:
+        # Archives made before chunked storage hold plain copies
+        for name in metadata.get('archived_files', []):
+            if os.path.exists(os.path.join(archive_subdir, name)):
+                shutil.copy2(os.path.join(archive_subdir, name), os.path.join(destination, name))
+                print(f"✅ Restored: {name}")
+            else:
+                broken.append(f"{name}: copy missing from {archive_subdir}")
+        files = {}
+    
+    for name, entry in files.items():
+        file_hash = hashlib.sha256()
+        path = os.path.join(destination, name)
+        try:
+            with open(path, 'wb') as out:
+                for digest, codec in entry['chunks']:
+                    try:
+                        data = _read_chunk(digest, codec)
+                    except (OSError, EOFError, KeyError, lzma.LZMAError, zlib.error) as e:
+                        raise ValueError(f"chunk {digest} ({codec}) unreadable: {e}")
+                    file_hash.update(data)
+                    out.write(data)
+        except ValueError as e:
+            os.remove(path)
+            print(f"❌ Not restored: {name} - {e}")
+            broken.append(f"{name}: {e}")
+            continue
+        if file_hash.hexdigest() != entry['sha256']:
+            print(f"❌ Checksum mismatch: {name}")
+            broken.append(f"{name}: checksum mismatch")
+        else:
+            print(f"✅ Restored: {name} ({entry['size']:,} bytes)")
+    if broken:
+        raise ValueError(f"Archive {archive_id} is broken - " + "; ".join(broken))
+    return destination
+
+
+def open_catalog() -> sqlite3.Connection:
+    os.makedirs(ARCHIVE_DIR, exist_ok=True)
+    conn = sqlite3.connect(CATALOG_PATH)
+    conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA foreign_keys = ON')
+    conn.executescript(CATALOG_SCHEMA)
+    return conn
+
+
+def catalog_add(conn: sqlite3.Connection, archive_id: str, metadata: dict):
+    """Insert or replace one archive's catalog rows"""
+    files = metadata.get('files')
+    if files is None:
+        # Archives made before chunked storage hold plain copies
+        archive_subdir = os.path.join(ARCHIVE_DIR, archive_id)
+        files = {name: {'sha256': None, 'size': os.path.getsize(os.path.join(archive_subdir, name))}
+                 for name in metadata.get('archived_files', [])
+                 if os.path.isfile(os.path.join(archive_subdir, name))}
+        new_bytes = sum(entry['size'] for entry in files.values())
+    else:
+        new_bytes = metadata.get('new_bytes', 0)
+    with conn:
+        conn.execute('DELETE FROM archives WHERE id = ?', (archive_id,))
+        conn.execute(
+            'INSERT INTO archives (id, created, latest_score, latest_date, total_runs, new_bytes) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (archive_id, metadata.get('datetime') or datetime.strptime(archive_id, '%Y%m%d_%H%M%S').isoformat(),
+             metadata.get('latest_score'), metadata.get('latest_date'), metadata.get('total_runs'), new_bytes))
+        conn.executemany(
+            'INSERT INTO archive_files (archive_id, name, sha256, size) VALUES (?, ?, ?, ?)',
+            [(archive_id, name, entry.get('sha256'), entry.get('size')) for name, entry in files.items()])
+
 
-def archive():
+def rebuild_catalog():
+    """Re-index every archive_metadata.json (one-off, e.g. for archives made before the catalog)"""
+    conn = open_catalog()
+    count = 0
+    with conn:
+        conn.execute('DELETE FROM archives')
+    for entry in sorted(os.scandir(ARCHIVE_DIR), key=lambda e: e.name):
+        metadata_path = os.path.join(entry.path, 'archive_metadata.json')
+        if entry.is_dir() and os.path.exists(metadata_path):
+            try:
+                with open(metadata_path, 'r') as f:
+                    catalog_add(conn, entry.name, json.load(f))
+                count += 1
+            except Exception as e:
+                print(f"⚠️  Skipped {entry.name}: {e}")
+    conn.close()
+    print(f"✅ Catalogued {count} archives in {os.path.basename(CATALOG_PATH)}")
+
+
+def query_catalog(below=None, above=None, since=None, before=None, file_hash=None,
+                  latest=False, limit=None):
+    """Archives matching every given filter, newest first"""
+    clauses, params = [], []
+    if below is not None:
+        clauses.append('a.latest_score < ?')
+        params.append(below)
+    if above is not None:
+        clauses.append('a.latest_score > ?')
+        params.append(above)
+    if since:
+        clauses.append('a.created >= ?')
+        params.append(since)
+    if before:
+        clauses.append('a.created < ?')
+        params.append(before)
+    if file_hash:
+        clauses.append('a.id IN (SELECT archive_id FROM archive_files WHERE sha256 = ?)')
+        params.append(file_hash)
+    where = (' WHERE ' + ' AND '.join(clauses)) if clauses else ''
+    limit = 1 if latest else limit
+    sql = f'SELECT a.* FROM archives a{where} ORDER BY a.created DESC' + (f' LIMIT {int(limit)}' if limit else '')
+    conn = open_catalog()
+    try:
+        return [dict(row) for row in conn.execute(sql, params)]
+    finally:
+        conn.close()
+
+
+def archive(codec: str = 'xz'):
     """Archive old reports and create backups"""
     print("\n" + "="*80)
     print("TESLA MONITOR ARCHIVE SCRIPT")
     print("="*80 + "\n")
     
+    if codec not in ('xz', 'gz'):
+        print(f"❌ Unknown codec {codec!r} (use xz or gz)")
+        return
+    
     # Create archive directory structure
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     archive_subdir = os.path.join(ARCHIVE_DIR, timestamp)
@@ -42,19 +303,22 @@ def archive():
             'tesla_robotaxi_dashboard.html',
             'tesla_robotaxi_dashboard.png',
             'tesla_robotaxi_report.txt',
-            'tesla_robotaxi_history.json'
+            'tesla_robotaxi_history.json',
+            'tesla_robotaxi_history.rle.json',
+            'tesla_robotaxi_history.log'
         ]
         
-        for file in output_files:
-            src = os.path.join(OUTPUT_DIR, file)
-            if os.path.exists(src):
-                try:
-                    dst = os.path.join(archive_subdir, file)
-                    shutil.copy2(src, dst)
-                    file_size = os.path.getsize(src)
-                    archived_items.append(f"✅ Archived: {file} ({file_size:,} bytes)")
-                except Exception as e:
-                    errors.append(f"❌ Error archiving {file}: {e}")
+        sources = [os.path.join(OUTPUT_DIR, f) for f in output_files
+                   if os.path.exists(os.path.join(OUTPUT_DIR, f))]
+        files = {}
+        new_bytes = 0
+        try:
+            files, new_bytes = store_files(sources, codec)
+            for file, entry in files.items():
+                archived_items.append(f"✅ Archived: {file} ({entry['size']:,} bytes)")
+        except Exception as e:
+            errors.append(f"❌ Error archiving output files: {e}")
+        print(f"   {new_bytes:,} new compressed bytes stored (unchanged chunks are referenced)")
     
     # 2. Create metadata file
     print("📝 Creating archive metadata...")
@@ -63,18 +327,17 @@ def archive():
             'timestamp': timestamp,
             'datetime': datetime.now().isoformat(),
             'archived_files': [item.split(': ')[1].split(' (')[0] for item in archived_items if '✅' in item],
-            'archive_location': archive_subdir
+            'archive_location': archive_subdir,
+            'files': files,
+            'new_bytes': new_bytes
         }
         
         # Load history data if available
-        history_file = os.path.join(OUTPUT_DIR, 'tesla_robotaxi_history.json')
-        if os.path.exists(history_file):
-            with open(history_file, 'r') as f:
-                history_data = json.load(f)
-                if history_data.get('scores'):
-                    metadata['latest_score'] = history_data['scores'][-1]
-                    metadata['latest_date'] = history_data['dates'][-1]
-                    metadata['total_runs'] = len(history_data['scores'])
+        dates, scores = HistoryStore(os.path.join(OUTPUT_DIR, 'tesla_robotaxi_history.json')).load()
+        if scores:
+            metadata['latest_score'] = scores[-1]
+            metadata['latest_date'] = dates[-1].isoformat()
+            metadata['total_runs'] = len(scores)
         
         metadata_file = os.path.join(archive_subdir, 'archive_metadata.json')
         with open(metadata_file, 'w') as f:
@@ -84,6 +347,17 @@ def archive():
     except Exception as e:
         errors.append(f"❌ Error creating metadata: {e}")
     
+    try:
+        conn = open_catalog()
+        if conn.execute('SELECT COUNT(*) FROM archives').fetchone()[0] == 0:
+            conn.close()
+            rebuild_catalog()  # First catalogued run: index older archives too
+        else:
+            catalog_add(conn, timestamp, metadata)
+            conn.close()
+    except Exception as e:
+        errors.append(f"❌ Error updating archive catalog: {e}")
+    
     # 3. Create README for archive
     print("📄 Creating archive README...")
     try:
@@ -108,10 +382,12 @@ def archive():
 
 ## How to Use This Archive
 
-1. **View HTML Dashboard**: Open `tesla_robotaxi_dashboard.html` in any browser
-2. **View Report**: Open `tesla_robotaxi_report.txt` in any text editor
-3. **View Chart**: Open `tesla_robotaxi_dashboard.png` with any image viewer
-4. **Restore Data**: Copy `tesla_robotaxi_history.json` back to output directory
+1. **Restore Files**: `python3 archive.py restore {timestamp} [directory]` rebuilds every archived file
+   (checksummed) from the shared chunk store in `archive/objects/`
+2. **View HTML Dashboard**: Open the restored `tesla_robotaxi_dashboard.html` in any browser
+3. **View Report**: Open the restored `tesla_robotaxi_report.txt` in any text editor
+4. **View Chart**: Open the restored `tesla_robotaxi_dashboard.png` with any image viewer
+5. **Restore Data**: Copy `tesla_robotaxi_history.json` and `tesla_robotaxi_history.log` back to output directory
 
 ## Metadata
 
@@ -131,34 +407,21 @@ Generated by Tesla Robotaxi Monitor Archive Script
     
     # 4. List all archives
     print("\n📚 Existing archives:")
-    if os.path.exists(ARCHIVE_DIR):
-        archives = sorted([d for d in os.listdir(ARCHIVE_DIR) 
-                          if os.path.isdir(os.path.join(ARCHIVE_DIR, d))], 
-                         reverse=True)
-        for i, archive in enumerate(archives[:10], 1):
-            archive_path = os.path.join(ARCHIVE_DIR, archive)
-            # Try to get metadata
-            metadata_path = os.path.join(archive_path, 'archive_metadata.json')
-            if os.path.exists(metadata_path):
-                try:
-                    with open(metadata_path, 'r') as f:
-                        meta = json.load(f)
-                        score = meta.get('latest_score', 'N/A')
-                        print(f"   {i}. {archive} (Score: {score})")
-                except:
-                    print(f"   {i}. {archive}")
-            else:
-                print(f"   {i}. {archive}")
+    try:
+        conn = open_catalog()
+        count, total_size = conn.execute('SELECT COUNT(*), COALESCE(SUM(new_bytes), 0) FROM archives').fetchone()
+        for i, row in enumerate(conn.execute(
+                'SELECT id, latest_score FROM archives ORDER BY created DESC LIMIT 10'), 1):
+            score = row['latest_score'] if row['latest_score'] is not None else 'N/A'
+            print(f"   {i}. {row['id']} (Score: {score})")
+        conn.close()
         
-        if len(archives) > 10:
-            print(f"   ... and {len(archives) - 10} more archives")
+        if count > 10:
+            print(f"   ... and {count - 10} more archives")
         
-        total_size = sum(
-            sum(os.path.getsize(os.path.join(dp, f)) for f in files)
-            for archive in archives
-            for dp, dn, files in os.walk(os.path.join(ARCHIVE_DIR, archive))
-        )
-        print(f"\n   Total archive size: {total_size:,} bytes ({total_size / 1024 / 1024:.2f} MB)")
+        print(f"\n   Total archived data: {total_size:,} bytes ({total_size / 1024 / 1024:.2f} MB)")
+    except Exception as e:
+        print(f"   ⚠️  Could not read archive catalog: {e}")
     
     # Summary
     print("\n" + "="*80)
@@ -182,6 +445,47 @@ Generated by Tesla Robotaxi Monitor Archive Script
     
     return archive_subdir
 
-if __name__ == "__main__":
-    archive()
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Archive monitor outputs and query past archives')
+    parser.add_argument('--codec', choices=['xz', 'gz'], default='xz', help='Chunk compression (default: xz)')
+    commands = parser.add_subparsers(dest='command')
+    
+    restore_parser = commands.add_parser('restore', help="Rebuild an archive's files")
+    restore_parser.add_argument('archive_id')
+    restore_parser.add_argument('destination', nargs='?')
+    
+    query_parser = commands.add_parser('query', help='Search the archive catalog')
+    query_parser.add_argument('--below', type=float, help='Score below this value')
+    query_parser.add_argument('--above', type=float, help='Score above this value')
+    query_parser.add_argument('--since', help='Created at or after (ISO date/time)')
+    query_parser.add_argument('--before', help='Created before (ISO date/time)')
+    query_parser.add_argument('--file-hash', help='Contains a file with this SHA-256')
+    query_parser.add_argument('--latest', action='store_true', help='Only the newest match')
+    query_parser.add_argument('--limit', type=int)
+    
+    commands.add_parser('catalog', help='Rebuild the catalog from every archive_metadata.json')
+    args = parser.parse_args()
+    
+    if args.command == 'restore':
+        try:
+            print(f"📂 Restored to {restore(args.archive_id, args.destination)}")
+        except ValueError as e:
+            print(f"❌ {e}")
+            raise SystemExit(1)
+    elif args.command == 'query':
+        rows = query_catalog(args.below, args.above, args.since, args.before, args.file_hash,
+                             args.latest, args.limit)
+        for row in rows:
+            score = f"{row['latest_score']:.1f}" if row['latest_score'] is not None else 'N/A'
+            print(f"{row['id']}  {row['created']}  Score: {score:>5}  Runs: {row['total_runs'] or 'N/A':>5}  "
+                  f"New bytes: {row['new_bytes']:,}")
+        print(f"🔎 {len(rows)} matching archives")
+    elif args.command == 'catalog':
+        rebuild_catalog()
+    else:
+        archive(args.codec)
+
 
+if __name__ == "__main__":
+    main()
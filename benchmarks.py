@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Tesla Robotaxi Monitor - Benchmarks
+Performance budgets, checked in fresh interpreters so caches do not flatter them
+
+    python3 benchmarks.py              Run every benchmark
+    python3 benchmarks.py import       Run selected benchmarks by name
+
+    import     Start-up time of a score-only run (budgeted)
+    profiles   Render time and file size of each dashboard render profile
+    html       HTML dashboard render time and network calls (budgeted)
+    trends     Nine-panel indicator trends vs the single dashboard trend panel (budgeted)
+    animation  History replay frames: scaling across worker processes and frame reuse
+    history    Cost of saving a run with a short and a long history (budgeted)
+
+Exits non-zero when any budget is exceeded.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Importing the monitor and constructing it (what a score-only run pays before fetching)
+IMPORT_BUDGET_SECONDS = 0.5
+HEAVY_MODULES = ('pandas', 'matplotlib', 'seaborn')
+
+# Synthetic history length for rendering benchmarks
+BENCH_HISTORY_POINTS = 2000
+
+# Rendering the HTML page from a scored run: pure formatting, no fetches
+HTML_BUDGET_SECONDS = 0.01
+
+# Updating all indicator trend panels, relative to drawing the dashboard's one trend panel
+TRENDS_BUDGET_RATIO = 1.25
+
+# History replay: frames rendered cold, and the least speed-up per extra worker that counts as scaling
+ANIMATION_FRAMES = 120
+ANIMATION_SCALING = 0.5
+
+# Saving a run must not grow with history length: median save with a long history vs a short one
+HISTORY_SIZES = (100, 100_000)
+HISTORY_SAVES = 400  # Enough to pass COMPACT_BYTES once
+HISTORY_BUDGET_RATIO = 2.0
+
+
+def _run_python(code: str) -> dict:
+    """Run code in a fresh interpreter from the project directory; it must print one JSON line last"""
+    result = subprocess.run([sys.executable, '-c', code], cwd=SCRIPT_DIR,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def bench_import(repeats: int = 3) -> bool:
+    """Score-only start-up: import + construct without loading the plotting/dataframe stack"""
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "import tesla_robotaxi_monitor\n"
+        "imported = time.perf_counter() - start\n"
+        "tesla_robotaxi_monitor.TeslaRobotaxiMonitor()\n"
+        "total = time.perf_counter() - start\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps({'import': imported, 'total': total, 'heavy': heavy}))\n"
+    )
+    runs = []
+    for _ in range(repeats):
+        wall = time.perf_counter()
+        run = _run_python(code)
+        run['wall'] = time.perf_counter() - wall
+        runs.append(run)
+    best = min(runs, key=lambda r: r['total'])
+    ok = best['total'] <= IMPORT_BUDGET_SECONDS and not best['heavy']
+    print(f"{'✅' if ok else '❌'} import: {best['import'] * 1000:.0f} ms import, "
+          f"{best['total'] * 1000:.0f} ms with monitor construction, "
+          f"{best['wall'] * 1000:.0f} ms interpreter wall (budget {IMPORT_BUDGET_SECONDS * 1000:.0f} ms)")
+    if best['heavy']:
+        print(f"   ❌ Loaded eagerly: {', '.join(best['heavy'])}")
+    return ok
+
+
+def _bench_monitor(output_dir: str):
+    """Monitor writing to output_dir, with synthetic results and history (no network)"""
+    import numpy as np
+    import tesla_robotaxi_monitor
+    from indicator_details import LazyDetails, template
+    from real_data_monitor import DEFAULT_ENTITY
+    template('benchmark')(lambda fields: f"Synthetic benchmark details, score {fields['score']:.1f}")
+    tesla_robotaxi_monitor.OUTPUT_DIR = output_dir
+    monitor = tesla_robotaxi_monitor.TeslaRobotaxiMonitor(dict(DEFAULT_ENTITY, output_prefix='benchmark'),
+                                                          config={'trend_window_days': None})
+    rng = np.random.default_rng(0)
+    results, total = {}, 0
+    for plugin in monitor.registry:
+        score = float(rng.uniform(10, 90))
+        results[plugin.name] = {'score': score, 'weighted_score': score * plugin.weight, 'weight': plugin.weight,
+                                'details': LazyDetails('benchmark', {'score': score, 'dmv': True})}
+        total += score * plugin.weight
+    results['overall'] = {'success_score': total, 'failure_risk': 100 - total,
+                          'timestamp': datetime.now(), 'changed_indicators': []}
+    start = np.datetime64(datetime.now() - timedelta(days=BENCH_HISTORY_POINTS // 24), 'us')
+    times = start + np.arange(BENCH_HISTORY_POINTS) * np.timedelta64(1, 'h')
+    walk = lambda level: np.clip(level + np.cumsum(rng.normal(0, 0.5, BENCH_HISTORY_POINTS)), 0, 100)
+    columns = {name: walk(entry['score']) for name, entry in results.items() if name != 'overall'}
+    monitor.history_columns.extend(times, dict(columns, overall=walk(total)))
+    return monitor, results
+
+
+def bench_profiles() -> bool:
+    """Cold and unchanged render time plus file size per dashboard render profile"""
+    from io import StringIO
+    from contextlib import redirect_stdout
+    from panel_cache import RENDER_PROFILES
+    from tesla_robotaxi_monitor import _pyplot
+    _pyplot()  # Library import is not part of any profile's cost
+    output_dir = tempfile.mkdtemp(prefix='robotaxi_bench_')
+    ok = True
+    try:
+        monitor, results = _bench_monitor(output_dir)
+        print(f"   {'profile':<10} {'cold':>8} {'unchanged':>10} {'size':>12}")
+        for profile in RENDER_PROFILES:
+            monitor.config['dashboard_profiles'] = [profile]
+            timings = []
+            for _ in range(2):  # Cold (empty panel cache), then an unchanged re-run
+                started = time.perf_counter()
+                with redirect_stdout(StringIO()):
+                    saved = monitor.visualize_dashboard(results)
+                timings.append(time.perf_counter() - started)
+            path = monitor.dashboard_path(profile)
+            if not saved or not os.path.exists(path):
+                print(f"   ❌ {profile}: no dashboard written")
+                ok = False
+                continue
+            print(f"   {profile:<10} {timings[0]:>7.2f}s {timings[1] * 1000:>8.1f}ms "
+                  f"{os.path.getsize(path) / 1024:>9,.0f} KB")
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+    print(f"{'✅' if ok else '❌'} profiles: {BENCH_HISTORY_POINTS:,}-point history, "
+          f"{len(RENDER_PROFILES)} profiles")
+    return ok
+
+
+def bench_html(repeats: int = 200) -> bool:
+    """Mean HTML dashboard render time; the page must come from the run's data alone"""
+    from io import StringIO
+    from contextlib import redirect_stdout
+    import real_data_monitor
+    from html_dashboard import render_dashboard
+    from indicators import RENDER_HTML
+    output_dir = tempfile.mkdtemp(prefix='robotaxi_bench_')
+    try:
+        monitor, results = _bench_monitor(output_dir)
+        plugins = monitor.registry.with_renderer(RENDER_HTML)
+        with redirect_stdout(StringIO()):
+            history_html = monitor._history_html()
+        calls = real_data_monitor.NETWORK_STATS['calls']
+        started = time.perf_counter()
+        for _ in range(repeats):
+            page = render_dashboard(results, {}, monitor.config, plugins, history_html=history_html, goals=True)
+        seconds = (time.perf_counter() - started) / repeats
+        calls = real_data_monitor.NETWORK_STATS['calls'] - calls
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+    ok = seconds <= HTML_BUDGET_SECONDS and calls == 0
+    print(f"{'✅' if ok else '❌'} html: {seconds * 1000:.2f} ms per page ({len(page):,} bytes), "
+          f"{calls} network calls (budget {HTML_BUDGET_SECONDS * 1000:.0f} ms, 0 calls)")
+    return ok
+
+
+def bench_trends(repeats: int = 3) -> bool:
+    """Indicator small multiples, rendered cold as a run does, against today's single trend panel"""
+    from io import StringIO
+    from contextlib import redirect_stdout
+    from panel_cache import Panel, PanelCache
+    import small_multiples
+    from tesla_robotaxi_monitor import _pyplot
+    _pyplot()  # Library import is not part of either cost
+    output_dir = tempfile.mkdtemp(prefix='robotaxi_bench_')
+    try:
+        monitor, results = _bench_monitor(output_dir)
+        with redirect_stdout(StringIO()):
+            monitor.history_frame()  # Open the history outside the timings
+        cache = PanelCache(output_dir, 'publish')
+        os.makedirs(cache.directory, exist_ok=True)
+        single = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            cache._render(Panel('trend', 2, monitor._plot_time_series, (), None),
+                          os.path.join(cache.directory, 'trend.png'))
+            single.append(time.perf_counter() - started)
+        small_multiples._FIGURES.clear()  # Each run is a new process: the first render builds the figure
+        timings = []
+        for _ in range(repeats + 1):  # Later renders (reusing the figure) are reported for reference
+            started = time.perf_counter()
+            with redirect_stdout(StringIO()):
+                path = monitor.visualize_indicator_trends(results)
+            timings.append(time.perf_counter() - started)
+        panels = len(next(iter(small_multiples._FIGURES.values())).panels) if small_multiples._FIGURES else 0
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+    ok = path is not None and timings[0] <= TRENDS_BUDGET_RATIO * min(single)
+    print(f"{'✅' if ok else '❌'} trends: {panels} panels in {timings[0] * 1000:.0f} ms "
+          f"({min(timings[1:]) * 1000:.0f} ms with the figure reused) vs {min(single) * 1000:.0f} ms for the "
+          f"single trend panel (budget {TRENDS_BUDGET_RATIO:.2f}x)")
+    return ok
+
+
+def bench_animation() -> bool:
+    """Cold frame rendering with one worker and with one per core, then a re-export (all reused)"""
+    from io import StringIO
+    from contextlib import redirect_stdout
+    from indicators import RENDER_PNG
+    import history_animation
+    output_dir = tempfile.mkdtemp(prefix='robotaxi_bench_')
+    workers = min(os.cpu_count() or 1, 8)
+    try:
+        with redirect_stdout(StringIO()):
+            monitor, results = _bench_monitor(output_dir)
+            times, columns = monitor.history_frame()
+        plugins = list(monitor.registry.with_renderer(RENDER_PNG))
+        frames = history_animation.frame_inputs(times, columns, [p.name for p in plugins], ANIMATION_FRAMES)
+        titles = [p.title for p in plugins]
+        timings = {}
+        for count in sorted({1, workers}):
+            directory = os.path.join(output_dir, f'frames_{count}')
+            timings[count] = history_animation.render_frames(titles, frames, directory, count)['seconds']
+        again = history_animation.render_frames(titles, frames, directory, workers)
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+    speedup = timings[1] / timings[workers]
+    scales = workers == 1 or speedup >= 1 + ANIMATION_SCALING * (workers - 1)
+    ok = scales and again['rendered'] == 0
+    print(f"{'✅' if ok else '❌'} animation: {len(frames)} frames in {timings[1]:.1f}s with 1 worker"
+          + (f", {timings[workers]:.1f}s with {workers} ({speedup:.1f}x)" if workers > 1 else
+             " (1 core - scaling not measurable)")
+          + f"; re-export rendered {again['rendered']}, reused {again['reused']} in {again['seconds'] * 1000:.0f} ms")
+    return ok
+
+
+def bench_history() -> bool:
+    """Append + compact_if_due (what each monitor save does) on a short and a long recorded history"""
+    import statistics
+    from history_store import HistoryStore
+    output_dir = tempfile.mkdtemp(prefix='robotaxi_bench_')
+    medians, totals = {}, {}
+    try:
+        for size in HISTORY_SIZES:
+            store = HistoryStore(os.path.join(output_dir, f'history_{size}.json'))
+            start = datetime.now() - timedelta(hours=size)
+            dates = [start + timedelta(hours=i) for i in range(size)]
+            store._write_checkpoint(store.json_path, {'scores': [50.0] * size,
+                                                      'dates': [d.isoformat() for d in dates]})
+            timings = []
+            for i in range(HISTORY_SAVES):
+                started = time.perf_counter()
+                store.append(datetime.now() + timedelta(seconds=i), 50.0 + i % 7)
+                store.compact_if_due()
+                timings.append(time.perf_counter() - started)
+            medians[size], totals[size] = statistics.median(timings), sum(timings)
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+    small, large = HISTORY_SIZES
+    ok = medians[large] <= HISTORY_BUDGET_RATIO * medians[small]
+    print(f"{'✅' if ok else '❌'} history: median save {medians[large] * 1000:.2f} ms with {large:,} runs vs "
+          f"{medians[small] * 1000:.2f} ms with {small:,} (budget {HISTORY_BUDGET_RATIO:.1f}x); "
+          f"{HISTORY_SAVES} saves took {totals[large] * 1000:.0f} / {totals[small] * 1000:.0f} ms incl. compaction")
+    return ok
+
+
+BENCHMARKS = {
+    'import': bench_import,
+    'profiles': bench_profiles,
+    'html': bench_html,
+    'trends': bench_trends,
+    'animation': bench_animation,
+    'history': bench_history,
+}
+
+
+def main():
+    selected = sys.argv[1:] or list(BENCHMARKS)
+    unknown = [name for name in selected if name not in BENCHMARKS]
+    if unknown:
+        print(f"❌ Unknown benchmark(s): {', '.join(unknown)} (available: {', '.join(BENCHMARKS)})")
+        return 2
+    print("⏱️  BENCHMARKS")
+    print("-"*80)
+    results = [BENCHMARKS[name]() for name in selected]
+    print("-"*80)
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,85 +2,307 @@
 """
 Tesla Robotaxi Monitor - Cleanup Script
 Removes temporary files, caches, and old data
+
+One os.scandir pass over the project finds everything, then the retention
+policy is applied:
+    - Archives, payload manifests and run store rows (robotaxi_runs.db):
+      keep all for 7 days, the newest per day for 90 days, and the newest
+      per week after that
+    - Archive chunks and payload objects no longer referenced are removed
+    - Old indicator cost log lines. Indicator caches are left alone: they
+      hold one entry per indicator, overwritten every run, so they do not grow
+    - Python caches, .DS_Store, temporary files and Jupyter checkpoints.
+      .tmp/.temp files are only removed once older than a grace period:
+      younger ones may be atomic writes still in progress
+
+    python3 cleanup.py             Clean up
+    python3 cleanup.py --dry-run   Only report what would be removed
+
+Override the policy with RETENTION_POLICY in config.py.
 """
 
+import json
 import os
+import re
 import shutil
-from datetime import datetime
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Set
+
+from archive import ARCHIVE_DIR, OBJECTS_DIR, open_catalog
+from payload_store import PAYLOAD_DIR
+from run_store import RUNS_DB, RunStore
 
 # Get script directory
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_DIR = os.path.join(SCRIPT_DIR, 'output')
+MANIFESTS_DIR = os.path.join(PAYLOAD_DIR, 'manifests')
+PAYLOAD_OBJECTS_DIR = os.path.join(PAYLOAD_DIR, 'objects')
+
+RETENTION_POLICY = {
+    'keep_all_days': 7,       # Keep every archive / payload manifest / stored run this recent
+    'daily_until_days': 90,   # Then the newest per day up to this age, the newest per week after
+    'cost_log_days': 90,      # Indicator cost log lines older than this are dropped
+    'temp_grace_minutes': 60, # Temporary files younger than this may be writes in progress
+}
+
+JUNK_DIRS = {'__pycache__', '.ipynb_checkpoints'}
+JUNK_FILES = {'.DS_Store'}
+TEMP_SUFFIXES = ('.pyc', '.tmp', '.temp', '~')
+IN_PROGRESS_SUFFIXES = ('.tmp', '.temp')  # Atomic writes (path + '.tmp', then os.replace)
+SKIP_DIRS = {'.git'}
+ARCHIVE_ID = re.compile(r'^\d{8}_\d{6}$')
+MANIFEST_NAME = re.compile(r'^(\d{8}T\d{6})\d*\.json$')
+
+
+def load_policy() -> Dict:
+    policy = dict(RETENTION_POLICY)
+    try:
+        import config
+        policy.update(getattr(config, 'RETENTION_POLICY', {}))
+    except ImportError:
+        pass
+    return policy
+
+
+def scan(root: str, temp_cutoff: float = None) -> Dict:
+    """Single os.scandir pass classifying everything cleanup cares about.
+
+    Directories that may be removed as a whole are still descended into,
+    so their size is known without a second walk. .tmp/.temp files modified
+    after temp_cutoff (epoch seconds) are left alone.
+    """
+    found = {'junk': [], 'archives': [], 'manifests': {}, 'chunks': [], 'payload_objects': [],
+             'cost_logs': []}
+    sizes = {}
+    stack = [(root, None)]
+    while stack:
+        directory, owner = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in SKIP_DIRS:
+                    continue
+                child_owner = owner
+                if owner is None:
+                    if entry.name in JUNK_DIRS:
+                        found['junk'].append(entry.path)
+                        child_owner = entry.path
+                    elif directory == ARCHIVE_DIR and ARCHIVE_ID.match(entry.name):
+                        found['archives'].append((entry.path, datetime.strptime(entry.name, '%Y%m%d_%H%M%S')))
+                        child_owner = entry.path
+                stack.append((entry.path, child_owner))
+                continue
+
+            try:
+                stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            size = stat.st_size
+            sizes[entry.path] = size
+            if owner is not None:
+                sizes[owner] = sizes.get(owner, 0) + size
+                continue
+
+            name = entry.name
+            parent = os.path.dirname(directory)
+            if name in JUNK_FILES or name.endswith(TEMP_SUFFIXES):
+                if not (name.endswith(IN_PROGRESS_SUFFIXES) and temp_cutoff is not None
+                        and stat.st_mtime > temp_cutoff):
+                    found['junk'].append(entry.path)
+            elif parent == OBJECTS_DIR:
+                found['chunks'].append(entry.path)
+            elif parent == PAYLOAD_OBJECTS_DIR:
+                found['payload_objects'].append(entry.path)
+            elif os.path.dirname(directory) == MANIFESTS_DIR and MANIFEST_NAME.match(name):
+                stamp = datetime.strptime(MANIFEST_NAME.match(name).group(1), '%Y%m%dT%H%M%S')
+                found['manifests'].setdefault(directory, []).append((entry.path, stamp))
+            elif directory == OUTPUT_DIR and name.endswith('_indicator_costs.jsonl'):
+                found['cost_logs'].append(entry.path)
+    found['sizes'] = sizes
+    return found
+
+
+def expired_by_tier(items: List, now: datetime, policy: Dict) -> List[str]:
+    """Paths of (path, time) items outside the tiered retention policy"""
+    keep_all = timedelta(days=policy['keep_all_days'])
+    daily_until = timedelta(days=policy['daily_until_days'])
+    seen, expired = set(), []
+    for path, stamp in sorted(items, key=lambda item: item[1], reverse=True):
+        age = now - stamp
+        if age <= keep_all:
+            continue
+        bucket = ('day', stamp.date()) if age <= daily_until else ('week', stamp.isocalendar()[:2])
+        if bucket in seen:
+            expired.append(path)
+        else:
+            seen.add(bucket)  # Newest item of each day / week survives
+    return expired
+
+
+def _referenced_chunks(archive_paths) -> Set[str]:
+    """Chunk digests used by the given archives"""
+    referenced = set()
+    for path in archive_paths:
+        try:
+            with open(os.path.join(path, 'archive_metadata.json'), 'r') as f:
+                files = json.load(f).get('files') or {}
+        except (OSError, ValueError):
+            continue
+        for entry in files.values():
+            referenced.update(digest for digest, _ in entry['chunks'])
+    return referenced
 
-def cleanup():
-    """Clean up temporary files and caches"""
+
+def _referenced_payloads(manifest_paths) -> Set[str]:
+    referenced = set()
+    for path in manifest_paths:
+        try:
+            with open(path, 'r') as f:
+                referenced.update(entry['hash'] for entry in json.load(f)['sources'].values())
+        except (OSError, ValueError, KeyError):
+            continue
+    return referenced
+
+
+def _digest(path: str) -> str:
+    return os.path.basename(path).split('.')[0]
+
+
+def _prune_cost_log(path: str, cutoff: datetime, dry_run: bool) -> int:
+    """Drop cost log lines older than cutoff; returns bytes reclaimed"""
+    kept = []
+    with open(path, 'r') as f:
+        lines = f.readlines()
+    for line in lines:
+        try:
+            if datetime.fromisoformat(json.loads(line)['timestamp']) < cutoff:
+                continue
+        except (ValueError, KeyError):
+            continue
+        kept.append(line)
+    reclaimed = sum(len(line.encode('utf-8')) for line in lines) - sum(len(line.encode('utf-8')) for line in kept)
+    if reclaimed and not dry_run:
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            f.writelines(kept)
+        os.replace(tmp_path, path)
+    return reclaimed
+
+
+def cleanup(dry_run: bool = False):
+    """Clean up temporary files and caches, and apply the retention policy"""
     print("\n" + "="*80)
-    print("TESLA MONITOR CLEANUP SCRIPT")
+    print("TESLA MONITOR CLEANUP SCRIPT" + (" (DRY RUN)" if dry_run else ""))
     print("="*80 + "\n")
     
+    policy = load_policy()
+    now = datetime.now()
     cleaned_items = []
     errors = []
+    reclaimed = 0
+    verb = "Would remove" if dry_run else "Removed"
     
-    # 1. Remove Python cache
-    print("🧹 Cleaning Python cache files...")
-    pycache_dirs = [
-        os.path.join(SCRIPT_DIR, '__pycache__'),
-        os.path.join(SCRIPT_DIR, 'output', '__pycache__'),
-    ]
+    print("🔍 Scanning project tree...")
+    started = time.perf_counter()
+    found = scan(SCRIPT_DIR, time.time() - policy['temp_grace_minutes'] * 60)
+    sizes = found['sizes']
+    print(f"   {len(sizes):,} files scanned in {time.perf_counter() - started:.2f}s")
     
-    for cache_dir in pycache_dirs:
-        if os.path.exists(cache_dir):
-            try:
-                shutil.rmtree(cache_dir)
-                cleaned_items.append(f"✅ Removed: {cache_dir}")
-            except Exception as e:
-                errors.append(f"❌ Error removing {cache_dir}: {e}")
+    def remove(path):
+        nonlocal reclaimed
+        try:
+            if not dry_run:
+                if os.path.isdir(path):
+                    shutil.rmtree(path)
+                else:
+                    os.remove(path)
+                    if os.path.dirname(os.path.dirname(path)) in (OBJECTS_DIR, PAYLOAD_OBJECTS_DIR):
+                        try:
+                            os.rmdir(os.path.dirname(path))  # Only succeeds once the fan-out dir is empty
+                        except OSError:
+                            pass
+            reclaimed += sizes.get(path, 0)
+            cleaned_items.append(f"✅ {verb}: {os.path.relpath(path, SCRIPT_DIR)}")
+        except Exception as e:
+            errors.append(f"❌ Error removing {path}: {e}")
+    
+    # 1. Python caches, .DS_Store, temporary files, Jupyter checkpoints
+    print("🧹 Cleaning caches and temporary files...")
+    for path in found['junk']:
+        remove(path)
     
-    # 2. Remove .pyc files
-    print("🧹 Cleaning .pyc files...")
-    for root, dirs, files in os.walk(SCRIPT_DIR):
-        for file in files:
-            if file.endswith('.pyc'):
-                pyc_path = os.path.join(root, file)
-                try:
-                    os.remove(pyc_path)
-                    cleaned_items.append(f"✅ Removed: {pyc_path}")
-                except Exception as e:
-                    errors.append(f"❌ Error removing {pyc_path}: {e}")
+    # 2. Tiered retention for archives
+    print(f"🗄️  Applying archive retention (all {policy['keep_all_days']}d, "
+          f"daily {policy['daily_until_days']}d, weekly after)...")
+    expired_archives = set(expired_by_tier(found['archives'], now, policy))
+    for path in expired_archives:
+        remove(path)
+    if expired_archives and not dry_run:
+        try:
+            conn = open_catalog()
+            with conn:
+                conn.executemany('DELETE FROM archives WHERE id = ?',
+                                 [(os.path.basename(p),) for p in expired_archives])
+            conn.close()
+        except Exception as e:
+            errors.append(f"❌ Error updating archive catalog: {e}")
     
-    # 3. Remove .DS_Store files (macOS)
-    print("🧹 Cleaning .DS_Store files...")
-    for root, dirs, files in os.walk(SCRIPT_DIR):
-        for file in files:
-            if file == '.DS_Store':
-                ds_path = os.path.join(root, file)
-                try:
-                    os.remove(ds_path)
-                    cleaned_items.append(f"✅ Removed: {ds_path}")
-                except Exception as e:
-                    errors.append(f"❌ Error removing {ds_path}: {e}")
+    # Chunks no surviving archive refers to
+    if found['chunks']:
+        referenced = _referenced_chunks(p for p, _ in found['archives'] if p not in expired_archives)
+        for path in found['chunks']:
+            if _digest(path) not in referenced:
+                remove(path)
     
-    # 4. Clean up old temporary files
-    print("🧹 Cleaning temporary files...")
-    temp_patterns = ['.tmp', '.temp', '~']
-    for root, dirs, files in os.walk(SCRIPT_DIR):
-        for file in files:
-            if any(file.endswith(pattern) for pattern in temp_patterns):
-                temp_path = os.path.join(root, file)
-                try:
-                    os.remove(temp_path)
-                    cleaned_items.append(f"✅ Removed: {temp_path}")
-                except Exception as e:
-                    errors.append(f"❌ Error removing {temp_path}: {e}")
+    # 3. Tiered retention for source payload manifests, then unreferenced payloads
+    print("📦 Applying payload manifest retention...")
+    kept_manifests = []
+    for items in found['manifests'].values():
+        expired = set(expired_by_tier(items, now, policy))
+        for path in expired:
+            remove(path)
+        kept_manifests.extend(p for p, _ in items if p not in expired)
+    if found['payload_objects']:
+        referenced = _referenced_payloads(kept_manifests)
+        for path in found['payload_objects']:
+            if _digest(path) not in referenced:
+                remove(path)
     
-    # 5. Clean up Jupyter checkpoints
-    print("🧹 Cleaning Jupyter checkpoints...")
-    checkpoint_dir = os.path.join(SCRIPT_DIR, '.ipynb_checkpoints')
-    if os.path.exists(checkpoint_dir):
+    # 4. Old cost log lines
+    print(f"⏳ Dropping cost log lines older than {policy['cost_log_days']}d...")
+    for path in found['cost_logs']:
         try:
-            shutil.rmtree(checkpoint_dir)
-            cleaned_items.append(f"✅ Removed: {checkpoint_dir}")
+            freed = _prune_cost_log(path, now - timedelta(days=policy['cost_log_days']), dry_run)
+            if freed:
+                reclaimed += freed
+                cleaned_items.append(f"✅ {verb}: {freed:,} bytes of old entries from {os.path.basename(path)}")
         except Exception as e:
-            errors.append(f"❌ Error removing {checkpoint_dir}: {e}")
+            errors.append(f"❌ Error pruning {path}: {e}")
+    
+    # 5. Tiered retention for run store rows (payload bodies live in the payload store)
+    if os.path.exists(RUNS_DB):
+        print("🗃️  Applying run store retention...")
+        try:
+            with RunStore(RUNS_DB) as store:
+                by_entity = {}
+                for row in store.conn.execute('SELECT id, entity, timestamp FROM runs'):
+                    by_entity.setdefault(row['entity'], []).append(
+                        (row['id'], datetime.fromisoformat(row['timestamp'])))
+                expired_runs = [run_id for items in by_entity.values()
+                                for run_id in expired_by_tier(items, now, policy)]
+                if expired_runs:
+                    before = os.path.getsize(RUNS_DB)
+                    if not dry_run:
+                        store.delete_runs(expired_runs)
+                        reclaimed += max(before - os.path.getsize(RUNS_DB), 0)
+                    cleaned_items.append(f"✅ {verb}: {len(expired_runs)} old runs from {os.path.basename(RUNS_DB)}")
+        except Exception as e:
+            errors.append(f"❌ Error pruning {RUNS_DB}: {e}")
     
     # Summary
     print("\n" + "="*80)
@@ -88,11 +310,12 @@ def cleanup():
     print("="*80 + "\n")
     
     if cleaned_items:
-        print(f"✅ Cleaned {len(cleaned_items)} items:")
+        print(f"✅ {'Would clean' if dry_run else 'Cleaned'} {len(cleaned_items)} items:")
         for item in cleaned_items[:10]:  # Show first 10
             print(f"   {item}")
         if len(cleaned_items) > 10:
             print(f"   ... and {len(cleaned_items) - 10} more")
+        print(f"\n💾 {'Reclaimable' if dry_run else 'Reclaimed'}: {reclaimed:,} bytes ({reclaimed / 1024 / 1024:.2f} MB)")
     else:
         print("✅ System already clean - no items to remove")
     
@@ -106,7 +329,7 @@ def cleanup():
     print("\n" + "="*80)
     print(f"✅ CLEANUP COMPLETE - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("="*80 + "\n")
+    return reclaimed
 
 if __name__ == "__main__":
-    cleanup()
-
+    cleanup(dry_run='--dry-run' in sys.argv[1:])
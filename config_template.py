@@ -36,6 +36,30 @@ SEARCH_TERMS = {
     ]
 }
 
+# AV programs scored by `python3 tesla_robotaxi_monitor.py --all-entities`
+# The first entry gets the full dashboard/report; all share one fetch pool.
+# 'name' must match the company names used in the NHTSA/CPUC/DMV datasets.
+ENTITIES = [
+    {'name': 'Tesla', 'ticker': 'TSLA', 'cik': '0001318605',
+     'keywords': ['robotaxi', 'FSD', 'autonomous'], 'nhtsa_make': 'TESLA'},
+    {'name': 'Waymo', 'ticker': 'GOOGL', 'cik': '0001652044',
+     'keywords': ['robotaxi', 'driverless', 'autonomous']},
+    {'name': 'Zoox', 'ticker': 'AMZN', 'cik': '0001018724',
+     'keywords': ['robotaxi', 'driverless', 'autonomous']},
+    {'name': 'Baidu Apollo', 'ticker': 'BIDU', 'cik': '0001329099',
+     'keywords': ['robotaxi', 'Apollo Go', 'driverless']},
+]
+
+# Optional overrides for the scoring rule tables in scoring_rules.py (per indicator)
+# Each indicator maps to a list of if/elif chains; the first matching rule in a chain
+# sets score = clamp(score + delta, floor, ceiling). Example:
+# SCORING_RULES = {
+#     'insider_selling': [[
+#         {'input': 'activity', 'op': '==', 'value': 'HIGH', 'delta': -20, 'floor': 20},
+#         {'input': 'activity', 'op': '==', 'value': 'MODERATE', 'delta': -5, 'floor': 35},
+#     ]],
+# }
+
 # Risk thresholds
 RISK_THRESHOLDS = {
     'low': 30,
@@ -56,3 +80,30 @@ UPDATE_FREQUENCY = 7
 
 # Historical data storage
 HISTORICAL_DATA_FILE = 'tesla_robotaxi_history.json'
+
+# History compaction: 'full' (the history JSON, every score and date, is the checkpoint)
+# or 'rle' (<name>_history.rle.json replaces the history JSON as the checkpoint, with
+# repeated scores collapsed into (start, end, value, count) segments - lossless, size
+# grows with real score changes rather than the number of runs).
+HISTORY_COMPACTION = 'full'
+
+# Days of history shown in the trend charts (None = all history)
+TREND_WINDOW_DAYS = None
+
+# Render the PNG, report and HTML in parallel worker processes (False = one after another)
+PARALLEL_OUTPUTS = True
+
+# Dashboard render profiles to write each run (override with --profile):
+#   'preview' low-DPI PNG, 'publish' 300 DPI PNG, 'vector' SVG, 'tiny' palette PNG
+DASHBOARD_PROFILES = ['publish']
+
+# Minify the HTML dashboard (it is always written with .gz/.br siblings and hashed in output/assets.json)
+MINIFY_HTML = True
+
+# cleanup.py retention policy (defaults shown)
+# RETENTION_POLICY = {
+#     'keep_all_days': 7,       # Keep every archive / payload manifest / stored run this recent
+#     'daily_until_days': 90,   # Then the newest per day up to this age, the newest per week after
+#     'cost_log_days': 90,      # Indicator cost log lines older than this are dropped
+#     'temp_grace_minutes': 60, # Temporary files younger than this may be writes in progress
+# }
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tesla Robotaxi Monitor - Downsampling
+Level-of-detail helpers that keep trend charts fast and readable as history grows
+
+    lttb()    Largest-Triangle-Three-Buckets: picks the points that best
+              preserve the visual shape of a line
+    rollup()  min/max/mean/count per hourly, daily or weekly bucket
+"""
+
+from typing import Dict
+
+import numpy as np
+
+# Rollup level -> datetime64 unit used to bucket timestamps
+ROLLUP_LEVELS = {'hourly': 'h', 'daily': 'D', 'weekly': 'W'}
+
+# Most points a trend chart draws before it switches to downsampled data
+MAX_CHART_POINTS = 300
+
+
+def lttb(x, y, threshold: int = MAX_CHART_POINTS) -> np.ndarray:
+    """Indices of at most `threshold` points chosen by Largest-Triangle-Three-Buckets.
+
+    x may be datetime64 or numeric and must be sorted. The first and last
+    points are always kept.
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    xs = np.asarray(x)
+    if np.issubdtype(xs.dtype, np.datetime64):
+        xs = xs.astype('datetime64[us]').astype('int64')
+    xs = xs.astype(float)
+    ys = np.nan_to_num(np.asarray(y, dtype=float))
+
+    # Interior points split into threshold - 2 buckets
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    selected = np.empty(threshold, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Average of the next bucket (or the last point) is the third triangle vertex
+        if i + 2 < len(edges):
+            nxt = slice(edges[i + 1], edges[i + 2])
+            cx, cy = xs[nxt].mean(), ys[nxt].mean()
+        else:
+            cx, cy = xs[-1], ys[-1]
+        area = np.abs((xs[a] - cx) * (ys[lo:hi] - ys[a]) - (xs[a] - xs[lo:hi]) * (cy - ys[a]))
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def rollup(times, values, level: str) -> Dict[str, np.ndarray]:
+    """Bucket a sorted series by hour/day/week: {'time', 'min', 'max', 'mean', 'count'}"""
+    unit = ROLLUP_LEVELS[level]
+    times = np.asarray(times, dtype='datetime64[us]')
+    values = np.asarray(values, dtype=float)
+    if len(times) == 0:
+        empty = np.empty(0)
+        return {'time': times, 'min': empty, 'max': empty, 'mean': empty, 'count': np.empty(0, dtype=int)}
+
+    buckets = times.astype(f'datetime64[{unit}]')
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    valid = ~np.isnan(values)
+    count = np.add.reduceat(valid.astype(int), starts)
+    total = np.add.reduceat(np.where(valid, values, 0.0), starts)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(count > 0, total / count, np.nan)
+    return {
+        'time': buckets[starts].astype('datetime64[us]'),
+        'min': np.fmin.reduceat(values, starts),
+        'max': np.fmax.reduceat(values, starts),
+        'mean': mean,
+        'count': count,
+    }
+
+
+def rollup_level_for(times, max_points: int = MAX_CHART_POINTS) -> str:
+    """Finest rollup level that yields at most max_points buckets (weekly if none do)"""
+    times = np.asarray(times, dtype='datetime64[us]')
+    for level, unit in ROLLUP_LEVELS.items():
+        buckets = times.astype(f'datetime64[{unit}]')
+        if len(buckets) == 0 or np.count_nonzero(buckets[1:] != buckets[:-1]) + 1 <= max_points:
+            return level
+    return 'weekly'
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Tesla Robotaxi Monitor - History Animation
+Animated replay of the dashboard across every recorded run (GIF, plus MP4 when ffmpeg is installed)
+
+Each run in the columnar history becomes one frame: the success gauge, the
+indicator breakdown and the trend over the runs leading up to it. Frames are
+rendered in a process pool, one contiguous chunk of frames per worker. Each
+worker draws its figure's static parts (axes, ticks, zones, labels) once
+and blits every frame: restore that background, update the bars, texts and
+trend line in place, and draw only those.
+
+Every frame is cached as <prefix>_animation_frames/<key>.png, where the key
+hashes what the frame shows (day, scores, trend) and the drawing code. Frames
+whose inputs did not change are reused instead of drawn: every earlier run
+when the animation is exported again, and runs that repeat the previous
+run's scores on the same day.
+
+    python3 history_animation.py                       GIF of every recorded run
+    python3 history_animation.py --mp4 --fps 12        Also an MP4 (needs ffmpeg)
+    python3 history_animation.py --max-frames 200 --workers 4
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from indicator_cache import code_fingerprint, payload_hash
+
+DEFAULT_FPS = 8
+DEFAULT_MAX_FRAMES = 300   # Longer histories are sampled evenly (first and last run always kept)
+GIF_MAX_FRAMES = 300       # Pillow keeps every GIF frame (palettized) until the file is written
+HOLD_LAST_SECONDS = 2.0    # The latest run stays on screen before the animation loops
+
+# Runs shown in each frame's trend panel
+TRAIL_RUNS = 60
+
+FRAME_WIDTH, FRAME_HEIGHT = 12.0, 7.0
+FRAME_DPI = 80
+
+# One figure per set of indicator titles in each worker process
+_RENDERERS = {}
+
+
+def _score_color(score: float) -> str:
+    return 'green' if score >= 70 else 'yellow' if score >= 50 else 'orange' if score >= 30 else 'red'
+
+
+def _rounded(value) -> float:
+    return None if value is None or np.isnan(value) else round(float(value), 1)
+
+
+def frame_inputs(times, columns: Dict[str, np.ndarray], names: List[str], max_frames: int = DEFAULT_MAX_FRAMES) -> List[Dict]:
+    """What each frame shows, one dict per (sampled) run; scores rounded to their display precision"""
+    overall = np.asarray(columns['overall'], dtype=float)
+    runs = np.flatnonzero(~np.isnan(overall))
+    if max_frames and len(runs) > max_frames:
+        runs = runs[np.unique(np.linspace(0, len(runs) - 1, max_frames).round().astype(int))]
+    frames = []
+    for i in runs:
+        trail = overall[max(i - TRAIL_RUNS + 1, 0):i + 1]
+        frames.append({
+            'day': str(np.datetime64(times[i], 'D')),
+            'overall': _rounded(overall[i]),
+            'indicators': [_rounded(columns[name][i]) if name in columns else None for name in names],
+            'trail': [_rounded(score) for score in trail[~np.isnan(trail)]],
+        })
+    return frames
+
+
+class FrameRenderer:
+    """One figure per worker process; frames update the animated artists and are blitted"""
+
+    def __init__(self, titles: List[str]):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        self.figure = Figure(figsize=(FRAME_WIDTH, FRAME_HEIGHT), dpi=FRAME_DPI)
+        self.canvas = FigureCanvasAgg(self.figure)
+        grid = self.figure.add_gridspec(2, 2, height_ratios=[1, 2.4], width_ratios=[1.1, 1], left=0.16,
+                                        right=0.98, top=0.88, bottom=0.1, hspace=0.45, wspace=0.12)
+
+        gauge = self.figure.add_subplot(grid[0, :])
+        self.score_bar, = gauge.barh([0], [0], height=0.5, alpha=0.7, animated=True)
+        self.rest_bar, = gauge.barh([0], [100], height=0.5, color='lightgray', alpha=0.3, animated=True)
+        # Thresholds are redrawn over the bars each frame
+        thresholds = [gauge.axvline(threshold, color=color, linestyle='--', alpha=0.5, linewidth=2, animated=True)
+                      for threshold, color in ((30, 'red'), (50, 'orange'), (70, 'green'))]
+        gauge.set_xlim(0, 100)
+        gauge.set_ylim(-0.5, 0.5)
+        gauge.set_yticks([])
+        self.score_text = gauge.text(0, 0, '', ha='center', va='center', fontsize=18, fontweight='bold',
+                                     animated=True)
+        self.title = self.figure.text(0.57, 0.9, '', ha='center', va='bottom', fontsize=13, fontweight='bold',
+                                      animated=True)
+
+        breakdown = self.figure.add_subplot(grid[1, 0])
+        y_pos = np.arange(len(titles))
+        self.bars = breakdown.barh(y_pos, np.zeros(len(titles)), alpha=0.7, animated=True)
+        self.bar_labels = [breakdown.text(0, i, '', va='center', fontweight='bold', fontsize=9, animated=True)
+                           for i in y_pos]
+        breakdown.set_yticks(y_pos, titles, fontsize=9)
+        breakdown.set_xlim(0, 105)
+        breakdown.axvline(50, color='black', linestyle='--', alpha=0.3)
+        breakdown.set_title('Individual Indicator Scores', fontsize=11, fontweight='bold')
+
+        trend = self.figure.add_subplot(grid[1, 1])
+        for low, high, color in ((70, 100, 'green'), (50, 70, 'yellow'), (30, 50, 'orange'), (0, 30, 'red')):
+            trend.axhspan(low, high, alpha=0.1, color=color, linewidth=0)
+        self.trend_line, = trend.plot([], [], color='#2E86DE', linewidth=2, animated=True)
+        self.trend_point, = trend.plot([], [], 'o', color='#2E86DE', markersize=6, animated=True)
+        trend.set_xlim(-TRAIL_RUNS + 1, 0)
+        trend.set_ylim(0, 100)
+        trend.set_xlabel(f'Runs before this one (last {TRAIL_RUNS})', fontsize=9)
+        trend.set_title('Success Score Trend', fontsize=11, fontweight='bold')
+
+        self.day_text = self.figure.text(0.98, 0.02, '', ha='right', va='bottom', fontsize=12, fontweight='bold',
+                                         animated=True)
+
+        # Drawing order of everything that changes between frames
+        self.animated = ([self.score_bar, self.rest_bar] + thresholds + [self.score_text, self.title] +
+                         list(self.bars) + self.bar_labels + [self.trend_line, self.trend_point, self.day_text])
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+
+    def draw(self, frame: Dict):
+        """The frame as an RGB PIL image"""
+        from PIL import Image
+        score = frame['overall']
+        self.score_bar.set_width(score)
+        self.score_bar.set_color(_score_color(score))
+        self.rest_bar.set_x(score)
+        self.rest_bar.set_width(100 - score)
+        self.score_text.set_position((score / 2, 0))
+        self.score_text.set_text(f'{score:.1f}')
+        self.title.set_text(f'Success Probability: {score:.1f}% | Failure Risk: {100 - score:.1f}%')
+        for bar, label, value in zip(self.bars, self.bar_labels, frame['indicators']):
+            bar.set_width(value or 0)
+            bar.set_color(_score_color(value or 0))
+            label.set_position(((value or 0) + 2, label.get_position()[1]))
+            label.set_text('-' if value is None else f'{value:.0f}')
+        trail = frame['trail']
+        self.trend_line.set_data(np.arange(-len(trail) + 1, 1), trail)
+        self.trend_point.set_data([0], trail[-1:])
+        self.day_text.set_text(frame['day'])
+        self.canvas.restore_region(self.background)
+        for artist in self.animated:
+            self.figure.draw_artist(artist)
+        self.canvas.blit(self.figure.bbox)
+        width, height = self.canvas.get_width_height(physical=True)
+        return Image.frombuffer('RGBA', (width, height), self.canvas.buffer_rgba(), 'raw', 'RGBA', 0, 1).convert('RGB')
+
+
+# Frames are keyed by their inputs and by the code that draws them; code_fingerprint also
+# hashes this module's source, so _score_color, TRAIL_RUNS and the zone colours count too
+FRAME_CODE = code_fingerprint(FrameRenderer.__init__) + code_fingerprint(FrameRenderer.draw)
+
+
+def frame_key(frame: Dict, titles: List[str]) -> str:
+    return payload_hash({'frame': frame, 'titles': titles, 'code': FRAME_CODE,
+                         'size': [FRAME_WIDTH, FRAME_HEIGHT, FRAME_DPI]})[:16]
+
+
+def render_chunk(titles: List[str], frames: List[Tuple[str, Dict]], directory: str) -> Tuple[int, float]:
+    """Worker: draw one chunk of frames on this process's figure; returns (frames, seconds)"""
+    started = time.perf_counter()
+    layout = tuple(titles)
+    if layout not in _RENDERERS:
+        from tesla_robotaxi_monitor import _pyplot
+        _pyplot()  # Same style as the dashboard
+        _RENDERERS[layout] = FrameRenderer(titles)
+    renderer = _RENDERERS[layout]
+    for key, frame in frames:
+        path = os.path.join(directory, f'{key}.png')
+        renderer.draw(frame).save(path + '.tmp', format='PNG', compress_level=1)
+        os.replace(path + '.tmp', path)
+    return len(frames), time.perf_counter() - started
+
+
+def render_frames(titles: List[str], frames: List[Dict], directory: str, workers: int = None) -> Dict:
+    """Make sure every frame is on disk; returns {'keys': [...], 'rendered', 'reused', 'seconds'}"""
+    os.makedirs(directory, exist_ok=True)
+    keys = [frame_key(frame, titles) for frame in frames]
+    missing = {}
+    for key, frame in zip(keys, frames):
+        if key not in missing and not os.path.exists(os.path.join(directory, f'{key}.png')):
+            missing[key] = frame
+    todo = list(missing.items())
+    workers = max(1, min(workers or os.cpu_count() or 1, len(todo)))
+    started = time.perf_counter()
+    if todo:
+        # One contiguous chunk per worker
+        bounds = np.linspace(0, len(todo), workers + 1).astype(int)
+        chunks = [todo[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:])]
+        if workers == 1:
+            render_chunk(titles, todo, directory)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(render_chunk, [titles] * len(chunks), chunks, [directory] * len(chunks)))
+    # Only frames of the current history are kept
+    current = {f'{key}.png' for key in keys}
+    for name in os.listdir(directory):
+        if name.endswith('.png') and name not in current:
+            os.remove(os.path.join(directory, name))
+    return {'keys': keys, 'rendered': len(todo), 'reused': len(keys) - len(todo),
+            'workers': workers if todo else 0, 'seconds': time.perf_counter() - started}
+
+
+def write_gif(paths: List[str], output_path: str, fps: int = DEFAULT_FPS):
+    """Frames are decoded one at a time; past GIF_MAX_FRAMES they are sampled evenly (last run kept)"""
+    from PIL import Image
+    if len(paths) > GIF_MAX_FRAMES:
+        paths = [paths[i] for i in np.unique(np.linspace(0, len(paths) - 1, GIF_MAX_FRAMES).round().astype(int))]
+
+    def frames(rest):
+        for path in rest:
+            with Image.open(path) as image:
+                yield image.convert('RGB')
+
+    durations = [int(1000 / fps)] * len(paths)
+    durations[-1] = int(HOLD_LAST_SECONDS * 1000)
+    tmp_path = output_path + '.tmp'
+    with Image.open(paths[0]) as first:
+        first.convert('RGB').save(tmp_path, format='GIF', save_all=True, append_images=frames(paths[1:]),
+                                  duration=durations, loop=0)
+    os.replace(tmp_path, output_path)
+
+
+def write_mp4(paths: List[str], output_path: str, fps: int = DEFAULT_FPS) -> bool:
+    """Encode with ffmpeg (raw frames on stdin); False when ffmpeg is not installed"""
+    ffmpeg = shutil.which('ffmpeg')
+    if ffmpeg is None:
+        return False
+    from PIL import Image
+    with Image.open(paths[0]) as first:
+        width, height = first.size
+    hold = [paths[-1]] * int(HOLD_LAST_SECONDS * fps)
+    tmp_path = output_path + '.tmp.mp4'
+    process = subprocess.Popen([ffmpeg, '-y', '-loglevel', 'error', '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+                                '-s', f'{width}x{height}', '-r', str(fps), '-i', '-',
+                                '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-pix_fmt', 'yuv420p', tmp_path],
+                               stdin=subprocess.PIPE)
+    for path in paths + hold:
+        with Image.open(path) as image:
+            process.stdin.write(image.convert('RGB').tobytes())
+    process.stdin.close()
+    if process.wait() != 0:
+        raise RuntimeError(f"ffmpeg exited with status {process.returncode}")
+    os.replace(tmp_path, output_path)
+    return True
+
+
+def export_animation(monitor, fps: int = DEFAULT_FPS, max_frames: int = DEFAULT_MAX_FRAMES,
+                     workers: int = None, mp4: bool = False) -> List[str]:
+    """Render (or reuse) a frame per recorded run and write the GIF (and MP4); returns saved paths"""
+    from indicators import RENDER_PNG
+    times, columns = monitor.history_frame()
+    plugins = list(monitor.registry.with_renderer(RENDER_PNG))
+    frames = frame_inputs(times, columns, [plugin.name for plugin in plugins], max_frames)
+    if len(frames) < 2:
+        print("ℹ️  Need 2+ recorded runs to animate the history")
+        return []
+    titles = [plugin.title for plugin in plugins]
+    directory = monitor._output_path('animation_frames')
+    print(f"🎞️  Rendering {len(frames)} frames ({len(times)} recorded runs)...")
+    built = render_frames(titles, frames, directory, workers)
+    print(f"   Rendered {built['rendered']} frames with {built['workers']} worker(s) in {built['seconds']:.1f}s, "
+          f"reused {built['reused']}")
+    paths = [os.path.join(directory, f'{key}.png') for key in built['keys']]
+
+    saved = []
+    gif_path = monitor._output_path('history_replay.gif')
+    write_gif(paths, gif_path, fps)
+    print(f"✅ GIF saved: {gif_path} ({os.path.getsize(gif_path) / 1024:,.0f} KB)")
+    saved.append(gif_path)
+    if mp4:
+        mp4_path = monitor._output_path('history_replay.mp4')
+        if write_mp4(paths, mp4_path, fps):
+            print(f"✅ MP4 saved: {mp4_path} ({os.path.getsize(mp4_path) / 1024:,.0f} KB)")
+            saved.append(mp4_path)
+        else:
+            print("⚠️  ffmpeg not found - MP4 skipped (GIF only)")
+    return saved
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Animated replay of the dashboard across recorded runs')
+    parser.add_argument('--fps', type=int, default=DEFAULT_FPS, help=f'Frames per second (default {DEFAULT_FPS})')
+    parser.add_argument('--max-frames', type=int, default=DEFAULT_MAX_FRAMES,
+                        help=f'Sample longer histories down to this many frames (0 = every run, default {DEFAULT_MAX_FRAMES})')
+    parser.add_argument('--workers', type=int, help='Frame render processes (default: one per core)')
+    parser.add_argument('--mp4', action='store_true', help='Also write an MP4 (requires ffmpeg)')
+    args = parser.parse_args()
+
+    from tesla_robotaxi_monitor import TeslaRobotaxiMonitor
+    print("\n" + "="*80)
+    print("TESLA ROBOTAXI HISTORY REPLAY")
+    print("="*80 + "\n")
+    saved = export_animation(TeslaRobotaxiMonitor(), args.fps, args.max_frames, args.workers, args.mp4)
+    return 0 if saved else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
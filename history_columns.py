@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Tesla Robotaxi Monitor - Columnar History
+Memory-mapped per-column history arrays for near-instant loading and plotting
+
+Layout (one directory per entity, e.g. output/tesla_robotaxi_history_columns/):
+    timestamps.datetime64   int64 microseconds since the epoch, one per run
+    overall.float32         Overall success score
+    <indicator>.float32     One file per indicator score
+
+Every file is a raw little-endian array, so loading is an np.memmap (no
+parsing, no copies) and appending a run writes a few bytes to each file.
+Timestamps are written last and define the row count. A crash mid-append
+leaves a longer column that is trimmed on the next append. Columns added
+later, such as a new indicator, are NaN for earlier runs.
+
+Hourly/daily/weekly rollups are cached next to the columns
+(<column>.<level>.rollup, raw records of bucket start, rows, count, min,
+max and sum). They are updated like the columns: after a save only the
+last bucket is rewritten in place and any new buckets are appended. The
+trend chart and the HTML history table read them instead of bucketing the
+raw columns again. They are derived data, so deleting them is safe.
+"""
+
+import os
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from downsample import ROLLUP_LEVELS, rollup
+
+TIME_DTYPE = np.dtype('<i8')
+TIME_UNIT = 'datetime64[us]'
+VALUE_DTYPE = np.dtype('<f4')
+TIME_FILE = 'timestamps.datetime64'
+COLUMN_SUFFIX = '.float32'
+ROLLUP_SUFFIX = '.rollup'
+ROLLUP_DTYPE = np.dtype([('time', '<i8'), ('rows', '<i8'), ('count', '<i8'),
+                         ('min', '<f8'), ('max', '<f8'), ('sum', '<f8')])
+
+
+def _memmap(path: str, dtype: np.dtype, rows: int) -> np.ndarray:
+    """Read-only view of the first `rows` items of a raw array file"""
+    if rows == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', shape=(rows,))
+
+
+class ColumnarHistory:
+    """Append-only, memory-mapped timestamp + float32 score columns"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.time_path = os.path.join(directory, TIME_FILE)
+
+    def _column_path(self, name: str) -> str:
+        return os.path.join(self.directory, name + COLUMN_SUFFIX)
+
+    def __len__(self) -> int:
+        if not os.path.exists(self.time_path):
+            return 0
+        return os.path.getsize(self.time_path) // TIME_DTYPE.itemsize
+
+    def columns(self) -> List[str]:
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(f[:-len(COLUMN_SUFFIX)] for f in os.listdir(self.directory) if f.endswith(COLUMN_SUFFIX))
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """datetime64[us] array of run times (zero-copy view)"""
+        return _memmap(self.time_path, TIME_DTYPE, len(self)).view(TIME_UNIT)
+
+    def column(self, name: str) -> np.ndarray:
+        """float32 scores for every run; NaN where the column did not exist yet"""
+        rows = len(self)
+        path = self._column_path(name)
+        stored = os.path.getsize(path) // VALUE_DTYPE.itemsize if os.path.exists(path) else 0
+        if stored >= rows:
+            return _memmap(path, VALUE_DTYPE, rows)
+        # Unknown or lagging column (not written by extend) - pad with NaN (this one copies)
+        padded = np.full(rows, np.nan, dtype=VALUE_DTYPE)
+        padded[:stored] = _memmap(path, VALUE_DTYPE, stored)
+        return padded
+
+    def between(self, start=None, end=None, columns: List[str] = None) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Rows with start <= timestamp <= end, located by binary search"""
+        times = self.timestamps
+        lo = 0 if start is None else int(np.searchsorted(times, np.datetime64(start, 'us'), side='left'))
+        hi = len(times) if end is None else int(np.searchsorted(times, np.datetime64(end, 'us'), side='right'))
+        names = self.columns() if columns is None else columns
+        return times[lo:hi], {name: self.column(name)[lo:hi] for name in names}
+
+    def tail(self, n: int, columns: List[str] = None) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Last n rows - mapping is lazy, so only the pages at the end of each file are read"""
+        start = max(len(self) - n, 0)
+        names = self.columns() if columns is None else columns
+        return self.timestamps[start:], {name: self.column(name)[start:] for name in names}
+
+    def append(self, when: datetime, values: Dict[str, float]):
+        """Append one run - a few bytes per file, independent of history length"""
+        self.extend(np.array([np.datetime64(when, 'us')]), {k: [v] for k, v in values.items()})
+
+    def extend(self, times, values: Dict[str, object]):
+        """Append many runs at once (used to migrate legacy history)"""
+        os.makedirs(self.directory, exist_ok=True)
+        rows = len(self)
+        count = len(times)
+        for name in set(self.columns()) | set(values):
+            path = self._column_path(name)
+            column = np.full(count, np.nan, dtype=VALUE_DTYPE)
+            if name in values:
+                column[:] = np.asarray(values[name], dtype=float)
+            with open(path, 'ab') as f:
+                stored = f.tell() // VALUE_DTYPE.itemsize
+                if stored > rows:
+                    f.truncate(rows * VALUE_DTYPE.itemsize)  # Torn append from an earlier crash
+                elif stored < rows:
+                    # New column (e.g. a new indicator): NaN for the earlier runs
+                    f.write(np.full(rows - stored, np.nan, dtype=VALUE_DTYPE).tobytes())
+                f.write(column.tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+        # Timestamps go last: they commit the row
+        with open(self.time_path, 'ab') as f:
+            f.truncate(rows * TIME_DTYPE.itemsize)  # Drop a torn partial timestamp
+            f.write(np.asarray(times, dtype=TIME_UNIT).astype(TIME_DTYPE).tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _rollup_path(self, name: str, level: str) -> str:
+        return os.path.join(self.directory, f'{name}.{level}{ROLLUP_SUFFIX}')
+
+    def _rollup_records(self, path: str) -> np.ndarray:
+        records = os.path.getsize(path) // ROLLUP_DTYPE.itemsize if os.path.exists(path) else 0
+        return _memmap(path, ROLLUP_DTYPE, records)
+
+    def update_rollup(self, name: str, level: str) -> np.ndarray:
+        """Bring one cached rollup up to date: rewrite its last bucket and append new ones"""
+        path = self._rollup_path(name, level)
+        stored = self._rollup_records(path)
+        rows = len(self)
+        covered = int(stored['rows'].sum())
+        if covered == rows:
+            return stored
+        if covered > rows:
+            stored, covered = stored[:0], 0  # History was rebuilt - start over
+        # The last bucket may still be filling, so it is recomputed from its first row
+        kept = max(len(stored) - 1, 0)
+        start = covered - int(stored['rows'][-1]) if len(stored) else 0
+        del stored
+        times = self.timestamps[start:]
+        buckets = rollup(times, self.column(name)[start:], level)
+        records = np.zeros(len(buckets['time']), dtype=ROLLUP_DTYPE)
+        records['time'] = buckets['time'].astype(TIME_DTYPE)
+        records['rows'] = np.unique(times.astype(f'datetime64[{ROLLUP_LEVELS[level]}]'), return_counts=True)[1]
+        records['count'] = buckets['count']
+        records['min'], records['max'] = buckets['min'], buckets['max']
+        records['sum'] = np.where(buckets['count'] > 0, buckets['mean'] * buckets['count'], 0.0)
+        with open(path, 'r+b' if os.path.exists(path) else 'wb') as f:
+            f.seek(kept * ROLLUP_DTYPE.itemsize)
+            f.write(records.tobytes())
+            f.truncate()
+        return self._rollup_records(path)
+
+    def rollup(self, name: str, level: str, start=None) -> Dict[str, np.ndarray]:
+        """Cached {'time', 'min', 'max', 'mean', 'count'} per bucket, from the bucket holding start"""
+        records = self.update_rollup(name, level)
+        times = records['time'].astype(TIME_UNIT)
+        lo = 0
+        if start is not None:
+            first = np.datetime64(start, 'us').astype(f'datetime64[{ROLLUP_LEVELS[level]}]').astype(TIME_UNIT)
+            lo = int(np.searchsorted(times, first, side='left'))
+        count = records['count'][lo:]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(count > 0, records['sum'][lo:] / count, np.nan)
+        return {'time': times[lo:], 'min': np.array(records['min'][lo:]), 'max': np.array(records['max'][lo:]),
+                'mean': mean, 'count': np.array(count)}
+
+    def refresh_rollups(self, columns: List[str] = None):
+        """Bring these columns' rollups (default: all) up to date (called after each saved run)"""
+        for name in self.columns() if columns is None else columns:
+            for level in ROLLUP_LEVELS:
+                self.update_rollup(name, level)
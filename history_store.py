@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Tesla Robotaxi Monitor - History Store
+Append-only, crash-safe history of overall success scores
+
+Layout (for output/tesla_robotaxi_history.json):
+    tesla_robotaxi_history.json  Checkpoint ('full' mode) in the original
+                                 {'scores': [...], 'dates': [...]} format, so
+                                 existing readers keep working
+    tesla_robotaxi_history.rle.json
+                                 Run-length encoded checkpoint ('rle' mode),
+                                 written instead of the JSON file
+    tesla_robotaxi_history.log   One fsync'd JSON line per run since the
+                                 log was last truncated
+
+Recording a run is a single O(1) durable append; load() returns the
+checkpoint plus the log. The checkpoint is only rewritten (atomic rename)
+by compact(), which runs once the log grows past COMPACT_BYTES, so the JSON
+file may lag the latest runs until then. Consumers of the JSON file itself
+compact first (update_and_push.py does before publishing). A crash at any
+point loses at most the record being written: torn log lines are skipped,
+and log records already covered by the checkpoint are ignored on load.
+
+Compaction modes:
+    'full'  The JSON file is the checkpoint
+    'rle'   <name>.rle.json is the checkpoint: repeated consecutive scores
+            are collapsed into (start, end, value, count) segments and run
+            times stored as integer microsecond deltas, themselves run-length
+            encoded. This is lossless, and the size tracks real score changes
+            rather than the number of cron runs.
+
+Each store loads its own mode's checkpoint only. After the mode is switched
+the other mode's file is read until the next compaction replaces it.
+"""
+
+import json
+import os
+import sys
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+COMPACT_BYTES = 16 * 1024  # ~300 runs
+COMPACTION_MODES = ('full', 'rle')
+
+
+def _fsync_dir(path: str):
+    """Persist a rename by syncing its directory (no-op where unsupported)"""
+    try:
+        fd = os.open(os.path.dirname(path) or '.', os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _run_lengths(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Start index and length of each run of equal consecutive values"""
+    starts = np.flatnonzero(np.r_[True, values[1:] != values[:-1]])
+    return starts, np.diff(np.r_[starts, len(values)])
+
+
+def encode_segments(dates: List[datetime], scores: List[float]) -> Dict:
+    """Lossless run-length/delta encoding of a score history"""
+    times = np.array(dates, dtype='datetime64[us]')
+    values = np.asarray(scores, dtype=float)
+    if len(values) == 0:
+        return {'format': 'rle', 'segments': [], 'time_deltas': []}
+    starts, counts = _run_lengths(values)
+    ends = starts + counts - 1
+    # Microseconds between consecutive runs; regular cron intervals collapse to one pair
+    deltas = np.diff(times.astype('int64'))
+    delta_starts, delta_counts = _run_lengths(deltas) if len(deltas) else (np.empty(0, int), np.empty(0, int))
+    return {
+        'format': 'rle',
+        'segments': [[dates[s].isoformat(), dates[e].isoformat(), scores[s], int(c)]
+                     for s, e, c in zip(starts, ends, counts)],
+        'time_deltas': [[int(deltas[s]), int(c)] for s, c in zip(delta_starts, delta_counts)]
+    }
+
+
+def decode_segments(data: Dict) -> Tuple[np.ndarray, np.ndarray]:
+    """(datetime64[us] times, float scores) from encode_segments output"""
+    segments = data.get('segments', [])
+    if not segments:
+        return np.empty(0, dtype='datetime64[us]'), np.empty(0)
+    values = np.repeat([seg[2] for seg in segments], [seg[3] for seg in segments])
+    pairs = np.array(data['time_deltas'], dtype='int64').reshape(-1, 2)
+    deltas = np.repeat(pairs[:, 0], pairs[:, 1])
+    origin = np.datetime64(segments[0][0], 'us').astype('int64')
+    times = (origin + np.r_[0, np.cumsum(deltas)]).astype('datetime64[us]')
+    return times, values
+
+
+class HistoryStore:
+    """Checkpoint + append-only log of (date, score) records"""
+
+    def __init__(self, json_path: str, compaction: str = 'full'):
+        if compaction not in COMPACTION_MODES:
+            raise ValueError(f"Unknown history compaction mode {compaction!r} (expected one of {COMPACTION_MODES})")
+        self.json_path = json_path
+        self.log_path = os.path.splitext(json_path)[0] + '.log'
+        self.rle_path = os.path.splitext(json_path)[0] + '.rle.json'
+        self.compaction = compaction
+
+    @property
+    def checkpoint_path(self) -> str:
+        return self.rle_path if self.compaction == 'rle' else self.json_path
+
+    def _read_checkpoint(self) -> Tuple[List[datetime], List[float]]:
+        """This mode's checkpoint, or the other mode's until the first compaction after a switch"""
+        other = self.json_path if self.compaction == 'rle' else self.rle_path
+        path = self.checkpoint_path if os.path.exists(self.checkpoint_path) else other
+        if not os.path.exists(path):
+            return [], []
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if path == self.rle_path:
+            times, values = decode_segments(data)
+            return times.tolist(), values.tolist()
+        return [datetime.fromisoformat(d) for d in data.get('dates', [])], list(data.get('scores', []))
+
+    def _read_log(self, after: datetime = None) -> Tuple[List[datetime], List[float]]:
+        dates, scores = [], []
+        if not os.path.exists(self.log_path):
+            return dates, scores
+        with open(self.log_path, 'r') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    when = datetime.fromisoformat(record['date'])
+                    score = record['score']
+                except (ValueError, KeyError, TypeError):
+                    continue  # Torn write from a crash
+                if after is not None and when <= after:
+                    continue  # Already folded into the checkpoint
+                dates.append(when)
+                scores.append(score)
+        return dates, scores
+
+    def load(self) -> Tuple[List[datetime], List[float]]:
+        """Return all recorded (dates, scores)"""
+        dates, scores = self._read_checkpoint()
+        log_dates, log_scores = self._read_log(after=dates[-1] if dates else None)
+        return dates + log_dates, scores + log_scores
+
+    def append(self, when: datetime, score: float):
+        """Durably append one run - constant time regardless of history length"""
+        record = json.dumps({'date': when.isoformat(), 'score': score}) + '\n'
+        with open(self.log_path, 'a+b') as f:
+            # Terminate a torn line left by a crash so this record parses cleanly
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    record = '\n' + record
+            f.write(record.encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def compact_if_due(self) -> bool:
+        """Compact once the log passes COMPACT_BYTES; True if it did"""
+        if os.path.exists(self.log_path) and os.path.getsize(self.log_path) >= COMPACT_BYTES:
+            self.compact()
+            return True
+        return False
+
+    def compact(self):
+        """Fold the log into this store's checkpoint, then truncate the log"""
+        dates, scores = self.load()
+        if self.compaction == 'rle':
+            self._write_checkpoint(self.rle_path, encode_segments(dates, scores))
+            stale = self.json_path
+        else:
+            self._write_checkpoint(self.json_path, {'scores': scores, 'dates': [d.isoformat() for d in dates]})
+            stale = self.rle_path
+        if os.path.exists(stale):
+            os.remove(stale)  # Superseded by the new checkpoint after a mode switch
+        # Safe to crash here: on load, log records <= the checkpoint's last date are skipped
+        with open(self.log_path, 'w') as f:
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _write_checkpoint(self, path: str, data: Dict):
+        data['last_updated'] = datetime.now().isoformat()
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        _fsync_dir(path)
+
+
+if __name__ == "__main__":
+    # python3 history_store.py [--rle] [history.json]  - compact the log into the checkpoint
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    args = [a for a in sys.argv[1:] if a != '--rle']
+    path = args[0] if args else os.path.join(script_dir, 'output', 'tesla_robotaxi_history.json')
+    store = HistoryStore(path, compaction='rle' if '--rle' in sys.argv[1:] else 'full')
+    store.compact()
+    target = store.checkpoint_path
+    print(f"✅ Compacted {len(store.load()[1])} records into {os.path.basename(target)} "
+          f"({store.compaction}: {os.path.getsize(target):,} bytes)")
@@ -0,0 +1,1351 @@
+#!/usr/bin/env python3
+"""
+Tesla Robotaxi Monitor - HTML Dashboard
+Precompiled templates for the HTML dashboard
+
+Each template is compiled once, at import, into its static text chunks and
+the named slots between them. The stylesheet, the decision framework, the
+DMV card and the rest of the markup are never rebuilt. Rendering only
+formats the slot values and joins the chunks.
+
+render_dashboard() is a pure function of the scored results, the source
+payloads the run already fetched and the config. It does no network I/O
+and renders in about a millisecond. Slot values are HTML-escaped, unless
+the slot is marked {{name|raw}} for fragments rendered from other
+templates.
+
+The score history is embedded as delta-encoded JSON (every run in the
+trend window, overall and per indicator) and drawn by a small script on
+a canvas: drag to select a range, scroll to zoom, hover for the scores
+of the nearest run.
+"""
+
+import html
+import json
+import re
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from downsample import rollup
+
+_SLOT = re.compile(r'\{\{(\w+)(\|raw)?\}\}')
+
+
+class Template:
+    """Text with {{name}} slots, split once into static chunks and slots"""
+    __slots__ = ('chunks', 'slots')
+
+    def __init__(self, text: str):
+        self.chunks, self.slots = [], []
+        pos = 0
+        for match in _SLOT.finditer(text):
+            self.chunks.append(text[pos:match.start()])
+            self.slots.append((match.group(1), bool(match.group(2))))
+            pos = match.end()
+        self.chunks.append(text[pos:])
+
+    def render(self, **values) -> str:
+        out = [self.chunks[0]]
+        for (name, raw), chunk in zip(self.slots, self.chunks[1:]):
+            value = str(values[name])
+            out.append(value if raw else html.escape(value, quote=False))
+            out.append(chunk)
+        return ''.join(out)
+
+
+GOALS_CARD = Template("""
+                <div class="indicator-card journey-card">
+                    <div class="indicator-header">
+                        <h3>🗺️ Robotaxi Journey Progress</h3>
+                        <span class="badge badge-journey">ROADMAP</span>
+                    </div>
+                    <div class="journey-progress">
+                        <div class="journey-phase">
+                            <span class="phase-label">CURRENT PHASE</span>
+                            <span class="phase-value">{{current_phase}}</span>
+                            <span class="phase-desc">{{phase_desc}}</span>
+                        </div>
+                        <div class="progress-bar journey-bar">
+                            <div class="progress-fill" style="width: {{progress_pct}}%; background: linear-gradient(90deg, #e74c3c 0%, #f39c12 50%, #27ae60 100%);"></div>
+                        </div>
+                        <div class="progress-label">{{progress_pct}}% to Year 1-2 Goals (2026-2027)</div>
+                    </div>
+                    <div class="indicator-details">
+                        <pre>
+ROBOTAXI JOURNEY - WHERE ARE WE? (Based on input/goals.txt)
+
+CURRENT STATUS (2024):
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+Phase: {{current_phase}}
+Overall Progress: {{progress_pct}}%
+
+YEAR 1-2 GOALS (2026-2027) - Target in 2-3 years:
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+📋 GOAL: Limited regulatory approval (2-3 jurisdictions)
+   STATUS: {{regulatory_status}}
+   REALITY: High regulatory concerns detected
+
+📋 GOAL: Launch in Austin, Phoenix
+   STATUS: {{service_status}}
+   REALITY: No CPUC permit, no DMV testing participation
+
+📋 GOAL: Fleet of 5,000-10,000 vehicles
+   STATUS: {{fleet_status}}
+   REALITY: 0 commercial robotaxis deployed
+
+📋 GOAL: Supervised service, geofenced operations
+   STATUS: ⚠️ Technology status unclear
+   REALITY: FSD beta exists but not approved for unsupervised operation
+
+KEY GAPS TO YEAR 1-2 GOALS:
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+🚨 NO REGULATORY APPROVALS (Need 2-3 jurisdictions)
+🚨 NO COMMERCIAL DEPLOYMENT (Need Austin or Phoenix launch)
+🚨 NO FLEET OPERATIONS (Need 5,000-10,000 vehicles)
+🚨 NO DMV TESTING (0 miles vs Waymo's 2.3M+ miles)
+🚨 NO CPUC PERMIT (Can't operate commercially in CA)
+
+TIMELINE REALITY CHECK:
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+Current Year: 2024
+Target Year: 2026-2027 (2-3 years away)
+Time Remaining: ~24-36 months
+
+WHAT NEEDS TO HAPPEN:
+✓ Pass regulatory approval in at least 2 states
+✓ Obtain commercial permits (CPUC or equivalent)
+✓ Build/convert 5,000-10,000 vehicle fleet
+✓ Launch supervised service in 1-2 cities
+✓ Establish operational infrastructure
+✓ Demonstrate safety record to regulators
+
+COMPARISON TO COMPETITION:
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+WAYMO (Today):
+✅ Operating commercially in 3+ cities
+✅ 150,000+ paid rides per week
+✅ ~300 vehicle fleet (already operational)
+✅ 2.3M+ test miles logged
+✅ Full regulatory approval
+
+TESLA (Today):
+❌ 0 commercial operations
+❌ 0 paid rides
+❌ 0 commercial vehicles
+❌ 0 DMV test miles
+❌ No commercial permits
+
+BOTTOM LINE:
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+Tesla is currently in PRE-LAUNCH phase with significant gaps to even
+the most conservative "middle-of-the-road" Year 1-2 goals. Achieving
+5,000-10,000 deployed robotaxis by 2026-2027 appears highly unlikely
+given current regulatory, safety, and deployment status.
+
+Source: input/goals.txt + real-time monitoring data</pre>
+                    </div>
+                </div>
+                """)
+
+NHTSA_CARD = Template("""
+                <div class="indicator-card">
+                    <div class="indicator-header">
+                        <h3>NHTSA Crash Data (Nationwide)</h3>
+                        <span class="badge badge-tier1">TIER 1</span>
+                    </div>
+                    <div class="indicator-score">
+                        <span class="score-value">{{tesla_total_crashes}}</span>
+                        <span class="score-label">Tesla Crashes</span>
+                        <span class="comparison-text">vs {{waymo_total_crashes}} Waymo</span>
+                    </div>
+                    <div class="progress-bar">
+                        <div class="progress-fill" style="width: 100%; background-color: #dc3545;"></div>
+                    </div>
+                    <div class="indicator-details">
+                        <pre>
+NHTSA Crash Data (12 months - Nationwide):
+
+TESLA (HIGH RISK):
+• Total Crashes: {{tesla_total_crashes}}
+• Fatalities: {{tesla_fatalities}}
+• Serious Injuries: {{tesla_serious_injury}}
+• Status: {{tesla_status}}
+
+WAYMO (LOW RISK):
+• Total Crashes: {{waymo_total_crashes}}
+• Fatalities: {{waymo_fatalities}}
+• Serious Injuries: {{waymo_serious_injury}}
+• Status: {{waymo_status}}
+
+KEY FINDING:
+🚨 {{tesla_concerns}}
+
+Note: {{note}}
+Source: {{source}}</pre>
+                    </div>
+                </div>
+                """)
+
+CPUC_CARD = Template("""
+                <div class="indicator-card">
+                    <div class="indicator-header">
+                        <h3>CPUC Commercial Deployment</h3>
+                        <span class="badge badge-tier1">TIER 1</span>
+                    </div>
+                    <div class="indicator-score">
+                        <span class="score-value">0</span>
+                        <span class="score-label">Tesla Rides/Week</span>
+                        <span class="comparison-text">vs {{waymo_weekly_rides}} Waymo</span>
+                    </div>
+                    <div class="progress-bar">
+                        <div class="progress-fill" style="width: 0%; background-color: #dc3545;"></div>
+                    </div>
+                    <div class="indicator-details">
+                        <pre>
+CPUC Commercial Deployment (2024 Q3):
+
+WAYMO (FULLY OPERATIONAL):
+• Commercial Status: {{waymo_commercial_status}}
+• Weekly Rides: {{waymo_weekly_rides}}
+• Fleet Size: {{waymo_fleet_size}}
+• Service Area: {{waymo_service_area}}
+• Safety Score: {{waymo_safety_score}}
+
+TESLA (NO PERMIT):
+• Commercial Status: {{tesla_commercial_status}}
+• Weekly Rides: {{tesla_weekly_rides}}
+• Fleet Size: {{tesla_fleet_size}}
+• Note: {{tesla_notes}}
+
+KEY FINDING:
+🚨 {{gap}}
+🚨 {{regulatory}}
+
+Source: {{source}}</pre>
+                    </div>
+                </div>
+                """)
+
+PRICE_TARGET_SECTION = Template("""
+            <div class="tier2-section">
+                <h3>🎯 Price Target Analysis (TIER 2)</h3>
+                <div class="price-targets">
+                    <div class="pt-row">
+                        <span>Target High:</span> <strong>${{target_high}}</strong>
+                    </div>
+                    <div class="pt-row">
+                        <span>Target Mean:</span> <strong>${{target_mean}}</strong>
+                    </div>
+                    <div class="pt-row">
+                        <span>Target Low:</span> <strong>${{target_low}}</strong>
+                    </div>
+                    <div class="pt-row">
+                        <span>Upside/Downside:</span> <strong class="{{upside_class}}">{{upside}}%</strong>
+                    </div>
+                    <div class="pt-row">
+                        <span>Analyst Trend:</span> <strong>{{trend_icon}} {{trend}}</strong>
+                    </div>
+                    <div class="pt-row">
+                        <span>Recent Changes:</span> {{upgrades_3m}} upgrades, {{downgrades_3m}} downgrades
+                    </div>
+                </div>
+            </div>
+            """)
+
+INDICATOR_CARD = Template("""
+                <div class="indicator-card">
+                    <div class="indicator-header">
+                        <h3>{{title}}</h3>
+                        {{badge|raw}}
+                    </div>
+                    <div class="indicator-score">
+                        <span class="score-value">{{score}}</span>
+                        <span class="score-max">/100</span>
+                        <span class="weight">Weight: {{weight}}%</span>
+                    </div>
+                    <div class="progress-bar">
+                        <div class="progress-fill" style="width: {{score_pct}}%; background-color: {{bar_color}};"></div>
+                    </div>
+                    <div class="indicator-details">
+                        <pre>{{details}}</pre>
+                    </div>
+                </div>
+                """)
+
+PAGE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Tesla Robotaxi Monitor - Risk Assessment Dashboard</title>
+    <style>
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+        
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: #333;
+            padding: 20px;
+            line-height: 1.6;
+        }
+        
+        .container {
+            max-width: 1400px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 20px;
+            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
+            overflow: hidden;
+        }
+        
+        .header {
+            background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
+            color: white;
+            padding: 40px;
+            text-align: center;
+        }
+        
+        .header h1 {
+            font-size: 2.5em;
+            margin-bottom: 10px;
+            font-weight: 700;
+        }
+        
+        .header .subtitle {
+            font-size: 1.1em;
+            opacity: 0.9;
+            margin-bottom: 5px;
+        }
+        
+        .header .timestamp {
+            font-size: 0.9em;
+            opacity: 0.7;
+        }
+        
+        .risk-overview {
+            background: linear-gradient(135deg, {{status_color}}15 0%, {{status_color}}05 100%);
+            border-left: 5px solid {{status_color}};
+            padding: 30px;
+            margin: 30px;
+            border-radius: 10px;
+        }
+        
+        .risk-score {
+            display: flex;
+            justify-content: space-around;
+            align-items: center;
+            flex-wrap: wrap;
+            gap: 20px;
+            margin-bottom: 20px;
+        }
+        
+        .score-item {
+            text-align: center;
+        }
+        
+        .score-item .label {
+            font-size: 0.9em;
+            color: #666;
+            text-transform: uppercase;
+            letter-spacing: 1px;
+            margin-bottom: 5px;
+        }
+        
+        .score-item .value {
+            font-size: 3em;
+            font-weight: 700;
+            color: {{status_color}};
+        }
+        
+        .status-badge {
+            display: inline-block;
+            background: {{status_color}};
+            color: white;
+            padding: 10px 30px;
+            border-radius: 50px;
+            font-size: 1.2em;
+            font-weight: 600;
+        }
+        
+        .recommendation {
+            text-align: center;
+            font-size: 1.1em;
+            color: #666;
+            margin-top: 15px;
+        }
+        
+        .data-sources {
+            background: #f8f9fa;
+            padding: 20px 30px;
+            margin: 0 30px 30px 30px;
+            border-radius: 10px;
+            border-left: 5px solid #007bff;
+        }
+        
+        .data-sources h2 {
+            font-size: 1.3em;
+            margin-bottom: 15px;
+            color: #007bff;
+        }
+        
+        .source-list {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+            gap: 10px;
+        }
+        
+        .source-item {
+            display: flex;
+            align-items: center;
+            gap: 10px;
+            padding: 10px;
+            background: white;
+            border-radius: 5px;
+        }
+        
+        .source-active {
+            color: #28a745;
+            font-weight: 600;
+        }
+        
+        .source-inactive {
+            color: #dc3545;
+        }
+        
+        .indicators {
+            padding: 0 30px 30px 30px;
+        }
+        
+        .indicators h2 {
+            font-size: 1.8em;
+            margin-bottom: 20px;
+            color: #1e3c72;
+        }
+        
+        .indicator-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(500px, 1fr));
+            gap: 20px;
+        }
+        
+        .indicator-card {
+            background: #f8f9fa;
+            border-radius: 10px;
+            padding: 20px;
+            border: 2px solid #e9ecef;
+            transition: transform 0.2s, box-shadow 0.2s;
+        }
+        
+        .indicator-card:hover {
+            transform: translateY(-5px);
+            box-shadow: 0 5px 20px rgba(0,0,0,0.1);
+        }
+        
+        .indicator-header {
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            margin-bottom: 15px;
+        }
+        
+        .indicator-header h3 {
+            font-size: 1.2em;
+            color: #1e3c72;
+        }
+        
+        .badge {
+            background: #007bff;
+            color: white;
+            padding: 3px 10px;
+            border-radius: 12px;
+            font-size: 0.7em;
+            font-weight: 600;
+            text-transform: uppercase;
+        }
+        
+        .badge-tier1 {
+            background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%);
+            box-shadow: 0 2px 6px rgba(231, 76, 60, 0.3);
+        }
+        
+        .badge-tier2 {
+            background: linear-gradient(135deg, #9b59b6 0%, #8e44ad 100%);
+            box-shadow: 0 2px 6px rgba(155, 89, 182, 0.3);
+        }
+        
+        .badge-journey {
+            background: linear-gradient(135deg, #3498db 0%, #2980b9 100%);
+            box-shadow: 0 2px 6px rgba(52, 152, 219, 0.3);
+        }
+        
+        .journey-card {
+            grid-column: 1 / -1;
+            background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
+            border-left: 5px solid #3498db;
+        }
+        
+        .journey-progress {
+            padding: 20px 0;
+        }
+        
+        .journey-phase {
+            text-align: center;
+            margin-bottom: 20px;
+        }
+        
+        .phase-label {
+            display: block;
+            font-size: 0.75em;
+            color: #666;
+            text-transform: uppercase;
+            letter-spacing: 1px;
+            margin-bottom: 5px;
+        }
+        
+        .phase-value {
+            display: block;
+            font-size: 2em;
+            font-weight: bold;
+            color: #2c3e50;
+            margin-bottom: 5px;
+        }
+        
+        .phase-desc {
+            display: block;
+            font-size: 0.9em;
+            color: #7f8c8d;
+            font-style: italic;
+        }
+        
+        .journey-bar {
+            height: 30px;
+            margin: 20px 0 10px 0;
+        }
+        
+        .progress-label {
+            text-align: center;
+            color: #666;
+            font-size: 0.9em;
+            margin-top: 10px;
+        }
+        
+        .comparison-text {
+            font-size: 0.85em;
+            color: #666;
+            margin-left: 8px;
+        }
+        
+        .score-label {
+            font-size: 0.85em;
+            color: #888;
+        }
+        
+        .indicator-score {
+            display: flex;
+            align-items: baseline;
+            gap: 5px;
+            margin-bottom: 10px;
+        }
+        
+        .score-value {
+            font-size: 2.5em;
+            font-weight: 700;
+            color: #1e3c72;
+        }
+        
+        .score-max {
+            font-size: 1.2em;
+            color: #666;
+        }
+        
+        .weight {
+            margin-left: auto;
+            color: #666;
+            font-size: 0.9em;
+        }
+        
+        .progress-bar {
+            background: #e9ecef;
+            height: 10px;
+            border-radius: 5px;
+            overflow: hidden;
+            margin-bottom: 15px;
+        }
+        
+        .progress-fill {
+            height: 100%;
+            transition: width 0.3s ease;
+        }
+        
+        .indicator-details {
+            font-size: 0.85em;
+            color: #666;
+            max-height: 200px;
+            overflow-y: auto;
+        }
+        
+        .indicator-details pre {
+            white-space: pre-wrap;
+            font-family: 'Courier New', monospace;
+            line-height: 1.4;
+        }
+        
+        .decision-framework {
+            background: #f8f9fa;
+            padding: 30px;
+            margin: 30px;
+            border-radius: 10px;
+        }
+        
+        .decision-framework h2 {
+            font-size: 1.8em;
+            margin-bottom: 20px;
+            color: #1e3c72;
+        }
+        
+        .framework-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+            gap: 20px;
+        }
+        
+        .framework-card {
+            background: white;
+            padding: 20px;
+            border-radius: 10px;
+            border-left: 5px solid;
+        }
+        
+        .framework-exit {
+            border-left-color: #dc3545;
+        }
+        
+        .framework-hold {
+            border-left-color: #ffc107;
+        }
+        
+        .framework-add {
+            border-left-color: #28a745;
+        }
+        
+        .framework-card h3 {
+            margin-bottom: 15px;
+            font-size: 1.2em;
+        }
+        
+        .framework-card ul {
+            list-style: none;
+            padding-left: 0;
+        }
+        
+        .framework-card li {
+            padding: 5px 0;
+            padding-left: 20px;
+            position: relative;
+        }
+        
+        .framework-card li:before {
+            content: "•";
+            position: absolute;
+            left: 0;
+            font-weight: bold;
+        }
+        
+        .footer {
+            background: #1e3c72;
+            color: white;
+            text-align: center;
+            padding: 20px;
+            font-size: 0.9em;
+        }
+
+        .history-controls button, .history-series {
+            background: white;
+            border: 1px solid #ccc;
+            border-radius: 4px;
+            padding: 4px 10px;
+            margin: 0 4px 8px 0;
+            cursor: pointer;
+        }
+        
+        .history-hint {
+            color: #999;
+            font-size: 0.85em;
+        }
+        
+        .history-series {
+            border-width: 0 0 0 4px;
+            background: #f8f9fa;
+        }
+        
+        .history-series.off {
+            opacity: 0.4;
+        }
+        
+        .history-plot {
+            position: relative;
+        }
+        
+        #history-chart {
+            width: 100%;
+            height: 260px;
+            background: #f8f9fa;
+            border-radius: 8px;
+            cursor: crosshair;
+        }
+        
+        .history-tooltip {
+            display: none;
+            position: absolute;
+            pointer-events: none;
+            white-space: pre;
+            background: rgba(30, 60, 114, 0.9);
+            color: white;
+            font-size: 0.85em;
+            padding: 6px 8px;
+            border-radius: 4px;
+        }
+        
+        .history-note {
+            color: #666;
+            font-size: 0.9em;
+        }
+        
+        .history-table {
+            width: 100%;
+            border-collapse: collapse;
+            text-align: left;
+        }
+        
+        @media (max-width: 768px) {
+            .indicator-grid {
+                grid-template-columns: 1fr;
+            }
+            
+            .header h1 {
+                font-size: 1.8em;
+            }
+            
+            .score-item .value {
+                font-size: 2em;
+            }
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🚗 Tesla Robotaxi Monitor</h1>
+            <div class="subtitle">Risk Assessment Dashboard - Powered by Real-Time Data</div>
+            <div class="timestamp">Generated: {{generated}}</div>
+        </div>
+        
+        <div class="risk-overview">
+            <div class="risk-score">
+                <div class="score-item">
+                    <div class="label">Success Probability</div>
+                    <div class="value">{{success_score}}%</div>
+                </div>
+                <div class="score-item">
+                    <div class="label">Status</div>
+                    <div class="status-badge">{{status_icon}} {{status}}</div>
+                </div>
+                <div class="score-item">
+                    <div class="label">Failure Risk</div>
+                    <div class="value">{{failure_risk}}%</div>
+                </div>
+            </div>
+            <div class="recommendation">
+                <strong>Recommendation:</strong> {{recommendation}}
+            </div>
+        </div>
+        
+        <div class="data-sources">
+            <h2>📊 Data Sources Status</h2>
+            <div class="source-list">
+                <div class="source-item">
+                    <span class="source-{{news_class}}">{{news_icon}}</span>
+                    <span>News API (Real-time News)</span>
+                </div>
+                <div class="source-item">
+                    <span class="source-{{finnhub_class}}">{{finnhub_icon}}</span>
+                    <span>Finnhub API (Stock Data)</span>
+                </div>
+                <div class="source-item">
+                    <span class="source-active">✅</span>
+                    <span>SEC Edgar (Insider Trading)</span>
+                </div>
+                <div class="source-item">
+                    <span class="source-active">✅</span>
+                    <span>NHTSA Safety Data</span>
+                </div>
+                <div class="source-item">
+                    <span class="source-active">✅</span>
+                    <span>Competitor Progress</span>
+                </div>
+                <div class="source-item">
+                    <span class="source-active">✅</span>
+                    <span>Red Flag Scorecard</span>
+                </div>
+            </div>
+        </div>
+        
+        <div class="indicators">
+            <h2>📈 Indicator Analysis</h2>
+            <div class="indicator-grid">
+                {{indicators_html|raw}}
+            </div>
+        </div>
+        
+        {{history_html|raw}}
+        
+        {{goals_html|raw}}
+        
+        <div class="indicators">
+            <h2>🎯 Tier 1 & Tier 2 Enhanced Data</h2>
+            <div class="indicator-grid">
+                {{nhtsa_html|raw}}
+                {{cpuc_html|raw}}
+                {{dmv_html|raw}}
+                {{price_target_html|raw}}
+            </div>
+        </div>
+        
+        <div class="decision-framework">
+            <h2>🎯 Decision Framework</h2>
+            <div class="framework-grid">
+                <div class="framework-card framework-exit">
+                    <h3>🚫 EXIT TRIGGERS</h3>
+                    <p style="margin-bottom: 10px; font-size: 0.9em; color: #666;">Consider selling if:</p>
+                    <ul>
+                        <li>Failure Risk > 75% for 2+ consecutive checks</li>
+                        <li>Major safety incident with regulatory crackdown</li>
+                        <li>Competitors achieve 10x scale vs Tesla</li>
+                        <li>Stock falls below $300</li>
+                    </ul>
+                </div>
+                
+                <div class="framework-card framework-hold">
+                    <h3>⏸️ HOLD TRIGGERS</h3>
+                    <p style="margin-bottom: 10px; font-size: 0.9em; color: #666;">Maintain position if:</p>
+                    <ul>
+                        <li>Failure Risk < 50%</li>
+                        <li>Genuine regulatory approvals received</li>
+                        <li>Unsupervised operation launches</li>
+                        <li>Timeline promises met</li>
+                    </ul>
+                </div>
+                
+                <div class="framework-card framework-add">
+                    <h3>✅ ADD TRIGGERS</h3>
+                    <p style="margin-bottom: 10px; font-size: 0.9em; color: #666;">Increase position if:</p>
+                    <ul>
+                        <li>Failure Risk < 30%</li>
+                        <li>Commercial service launches successfully</li>
+                        <li>Multiple city approvals</li>
+                        <li>Safety data proves superior</li>
+                    </ul>
+                </div>
+            </div>
+        </div>
+        
+        <div class="footer">
+            <p>⚠️ NOT FINANCIAL ADVICE - This is a monitoring tool. Always do your own research.</p>
+            <p style="margin-top: 10px; opacity: 0.7;">Tesla Robotaxi Monitor v2.0 | Real-Time Data Integration</p>
+        </div>
+    </div>
+</body>
+</html>""")
+
+# No slots - the same fragment every run
+DMV_CARD = """
+                <div class="indicator-card">
+                    <div class="indicator-header">
+                        <h3>CA DMV Disengagement Data</h3>
+                        <span class="badge badge-tier2">TIER 2</span>
+                    </div>
+                    <div class="indicator-score">
+                        <span class="score-value">0</span>
+                        <span class="score-label">Tesla Miles Tested</span>
+                        <span class="comparison-text">vs 16,938 mi/disengagement Waymo</span>
+                    </div>
+                    <div class="progress-bar">
+                        <div class="progress-fill" style="width: 0%; background-color: #dc3545;"></div>
+                    </div>
+                    <div class="indicator-details">
+                        <pre>
+CA DMV Autonomous Vehicle Testing (2023 Report):
+
+WAYMO (LEADER):
+• Miles Driven: 2,303,542
+• Disengagements: 136
+• Miles per Disengagement: 16,938 (BEST)
+
+CRUISE:
+• Miles Driven: 1,236,849
+• Disengagements: 2,350
+• Miles per Disengagement: 526
+
+TESLA:
+• Status: NO DMV TESTING
+• Note: Tesla does not participate in CA DMV autonomous testing program
+
+GAP ANALYSIS:
+🚨 Waymo has 2.3M+ autonomous miles, Tesla has 0 reported
+🚨 Cannot compare safety - Tesla not in program
+🚨 Concern: Tesla bypassing regulatory testing requirements
+
+Source: CA DMV Autonomous Vehicle Disengagement Reports (2023)</pre>
+                    </div>
+                </div>
+                """
+
+
+def _status(failure_risk: float) -> Tuple[str, str, str, str]:
+    """(status, colour, icon, recommendation) for a failure risk"""
+    if failure_risk >= 70:
+        return "CRITICAL", "#dc3545", "🚨", "Consider exit strategy"
+    if failure_risk >= 50:
+        return "HIGH RISK", "#ffc107", "⚠️", "Review position sizing"
+    if failure_risk >= 30:
+        return "MODERATE RISK", "#ff8c00", "🔶", "Stay vigilant"
+    return "LOW RISK", "#28a745", "✅", "Continue monitoring"
+
+
+def _bar_color(score: float) -> str:
+    if score >= 70:
+        return "#28a745"
+    if score >= 50:
+        return "#ffc107"
+    if score >= 30:
+        return "#ff8c00"
+    return "#dc3545"
+
+
+def _payload(payloads: Dict, name: str) -> Dict:
+    """A source payload from this run, or {} if it is missing or failed"""
+    payload = payloads.get(name) or {}
+    return {} if 'error' in payload else payload
+
+
+def _score(results: Dict, name: str) -> float:
+    return results.get(name, {}).get('score', 100)
+
+
+def goals_card(results: Dict, payloads: Dict) -> str:
+    """Journey progress against the Year 1-2 goals in input/goals.txt"""
+    regulatory_status = "❌ No Approvals" if _score(results, 'regulatory_sentiment') > 60 else "⚠️ Unclear"
+    service_status = "❌ Not Operational" if _score(results, 'competitor_progress') > 70 else "⚠️ Testing"
+    tesla_deploy = _payload(payloads, 'cpuc_deployment').get('companies', {}).get('Tesla', {})
+    if tesla_deploy.get('commercial_status') == "No permit":
+        service_status = "❌ No Commercial Permit"
+
+    # Overall progress percentage (LOW scores = GOOD progress)
+    progress_pct = 0
+    if _score(results, 'technical_progress') < 30:
+        progress_pct += 15
+    if _score(results, 'regulatory_sentiment') < 40:
+        progress_pct += 20
+    if _score(results, 'competitor_progress') < 40:
+        progress_pct += 25
+    if _score(results, 'safety_incidents') < 30:
+        progress_pct += 20
+    if _score(results, 'timeline_slippage') < 40:
+        progress_pct += 20
+
+    if progress_pct < 25:
+        current_phase, phase_desc = "Pre-Launch", "Early development, no commercial deployment"
+    elif progress_pct < 50:
+        current_phase, phase_desc = "Testing Phase", "Technology testing, regulatory preparation"
+    elif progress_pct < 75:
+        current_phase, phase_desc = "Limited Launch", "Initial deployment in select markets"
+    else:
+        current_phase, phase_desc = "Scaling Phase", "Multi-market expansion underway"
+
+    return GOALS_CARD.render(
+        current_phase=current_phase, phase_desc=phase_desc, progress_pct=progress_pct,
+        regulatory_status=regulatory_status, service_status=service_status,
+        fleet_status="❌ 0 Vehicles (Goal: 5,000-10,000)")
+
+
+def nhtsa_card(results: Dict, payloads: Dict) -> str:
+    """TIER 1: NHTSA crash data, when the safety indicator used it"""
+    details = results.get('safety_incidents', {}).get('details')
+    crash_data = _payload(payloads, 'nhtsa_crashes')
+    if details is None or not details.fields.get('crash_data') or not crash_data:
+        return ""
+    companies = crash_data.get('companies', {})
+    values = {'tesla_concerns': crash_data['analysis']['tesla_concerns'],
+              'note': crash_data.get('note', ''), 'source': crash_data.get('source', 'NHTSA')}
+    for company in ('tesla', 'waymo'):
+        stats = companies.get(company.title(), {})
+        for field in ('total_crashes', 'fatalities', 'serious_injury'):
+            values[f'{company}_{field}'] = stats.get(field, 0)
+        values[f'{company}_status'] = stats.get('status', 'N/A')
+    return NHTSA_CARD.render(**values)
+
+
+def cpuc_card(results: Dict, payloads: Dict) -> str:
+    """TIER 1: CPUC commercial deployment, when the competitor indicator used it"""
+    details = results.get('competitor_progress', {}).get('details')
+    cpuc_data = _payload(payloads, 'cpuc_deployment')
+    if details is None or not details.fields.get('cpuc') or not cpuc_data:
+        return ""
+    companies = cpuc_data.get('companies', {})
+    values = {'gap': cpuc_data['key_findings']['gap'], 'regulatory': cpuc_data['key_findings']['regulatory'],
+              'source': cpuc_data.get('source', 'CPUC')}
+    waymo, tesla = companies.get('Waymo', {}), companies.get('Tesla', {})
+    for field in ('commercial_status', 'weekly_rides', 'fleet_size', 'service_area', 'safety_score'):
+        values[f'waymo_{field}'] = waymo.get(field, 'N/A')
+    for field in ('commercial_status', 'weekly_rides', 'fleet_size', 'notes'):
+        values[f'tesla_{field}'] = tesla.get(field, 'N/A')
+    return CPUC_CARD.render(**values)
+
+
+def dmv_card(results: Dict) -> str:
+    """TIER 2: CA DMV disengagement comparison (static text)"""
+    details = results.get('competitor_progress', {}).get('details')
+    return DMV_CARD if details is not None and details.fields.get('dmv') else ""
+
+
+def price_target_section(payloads: Dict) -> str:
+    """TIER 2: analyst price targets, when Finnhub data was fetched this run"""
+    pt_data = _payload(payloads, 'price_targets')
+    if not pt_data:
+        return ""
+    upside = pt_data.get('upside_percent', 0)
+    return PRICE_TARGET_SECTION.render(
+        target_high=pt_data.get('target_high', 'N/A'), target_mean=pt_data.get('target_mean', 'N/A'),
+        target_low=pt_data.get('target_low', 'N/A'),
+        upside_class='highlight-green' if upside > 0 else 'highlight-red', upside=f"{upside:+.1f}",
+        trend_icon=pt_data.get('trend_icon', '→'), trend=pt_data.get('trend', 'NEUTRAL'),
+        upgrades_3m=pt_data.get('upgrades_3m', 0), downgrades_3m=pt_data.get('downgrades_3m', 0))
+
+
+def indicator_cards(results: Dict, plugins: List) -> str:
+    cards = []
+    for plugin in plugins:
+        data = results[plugin.name]
+        score = data['score']
+        cards.append(INDICATOR_CARD.render(
+            title=plugin.title,
+            badge='<span class="badge">LIVE DATA</span>' if data['details'].live else '',
+            score=f"{score:.0f}", score_pct=score, weight=f"{data['weight'] * 100:.0f}",
+            bar_color=_bar_color(score), details=data['details'].render()))
+    return "".join(cards)
+
+
+def _key_configured(config: Dict, name: str, placeholder: str) -> bool:
+    return bool(config.get(name)) and config.get(name) != placeholder
+
+
+def render_dashboard(results: Dict, payloads: Dict, config: Dict, plugins: List,
+                     history_html: str = "", goals: bool = False) -> str:
+    """The dashboard page for one scored run.
+
+    plugins are the indicators shown as cards (registry.with_renderer(RENDER_HTML)),
+    history_html an already rendered history section and goals whether
+    input/goals.txt exists.
+    """
+    overall = results['overall']
+    status, status_color, status_icon, recommendation = _status(overall['failure_risk'])
+    news = _key_configured(config, 'news_api_key', 'your_news_api_key_here')
+    finnhub = _key_configured(config, 'finnhub_api_key', 'your_finnhub_api_key_here')
+
+    goals_html = ""
+    if goals:
+        try:
+            goals_html = goals_card(results, payloads)
+        except Exception as e:
+            print(f"Note: Could not load goals: {e}")
+
+    sections = {}
+    for name, build in (('nhtsa_html', lambda: nhtsa_card(results, payloads)),
+                        ('cpuc_html', lambda: cpuc_card(results, payloads)),
+                        ('dmv_html', lambda: dmv_card(results)),
+                        ('price_target_html', lambda: price_target_section(payloads))):
+        try:
+            sections[name] = build()
+        except Exception:
+            sections[name] = ""  # A malformed payload drops its card, not the page
+
+    return PAGE.render(
+        status=status, status_color=status_color, status_icon=status_icon, recommendation=recommendation,
+        generated=overall['timestamp'].strftime('%Y-%m-%d %H:%M:%S'),
+        success_score=f"{overall['success_score']:.1f}", failure_risk=f"{overall['failure_risk']:.1f}",
+        news_class='active' if news else 'inactive', news_icon='✅' if news else '❌',
+        finnhub_class='active' if finnhub else 'inactive', finnhub_icon='✅' if finnhub else '❌',
+        indicators_html=indicator_cards(results, plugins), history_html=history_html,
+        goals_html=goals_html, **sections)
+
+
+# Scores are embedded as integer tenths of a point
+HISTORY_SCALE = 10
+HISTORY_COLORS = ['#2E86DE', '#e74c3c', '#27ae60', '#f39c12', '#8e44ad',
+                  '#16a085', '#d35400', '#2c3e50', '#c0392b', '#7f8c8d']
+
+
+def encode_history(times, columns: Dict, labels: Dict) -> Dict:
+    """Delta-encode history for embedding.
+
+    {'start': first run (epoch seconds of the naive local run time, which the
+     chart's UTC formatting shows unchanged), 'dt': seconds since the previous
+     run, 'scale': 10, 'series': {name: {'label', 'from', 'd'}}}. A series starts at
+    run index 'from' (indicators added later have no earlier scores); d holds
+    each run's score in tenths minus the previous non-null score (null = no
+    score). The overall score comes first; series without any score are left out.
+    """
+    seconds = np.asarray(times, dtype='datetime64[s]').astype(np.int64)
+    encoded = {}
+    for name in sorted(columns, key=lambda name: name != 'overall'):
+        tenths = np.round(np.asarray(columns[name], dtype=float) * HISTORY_SCALE)
+        valid = np.flatnonzero(~np.isnan(tenths))
+        if not len(valid):
+            continue
+        first = int(valid[0])
+        deltas = [None] * (len(tenths) - first)
+        for i, delta in zip(valid.tolist(), np.diff(tenths[valid].astype(np.int64), prepend=0).tolist()):
+            deltas[i - first] = delta
+        encoded[name] = {'label': labels.get(name, name), 'from': first, 'd': deltas}
+    return {
+        'start': int(seconds[0]) if len(seconds) else 0,
+        'dt': np.diff(seconds, prepend=seconds[:1]).tolist(),
+        'scale': HISTORY_SCALE,
+        'series': encoded,
+    }
+
+
+def history_section(times, columns: Dict, labels: Dict, daily: Dict = None) -> str:
+    """Interactive history chart (drawn in the browser) plus the last 7 daily rollups
+    (daily: the overall score's cached daily rollup, computed here if not given)"""
+    data = json.dumps(encode_history(times, columns, labels), separators=(',', ':')).replace('</', '<\\/')
+    if daily is None:
+        daily = rollup(times, columns['overall'], 'daily')
+    rows = "".join(
+        HISTORY_ROW.render(day=str(day)[:10], mean=f"{mean:.1f}", low=f"{low:.1f}", high=f"{high:.1f}", count=count)
+        for day, mean, low, high, count in list(zip(daily['time'], daily['mean'], daily['min'],
+                                                    daily['max'], daily['count']))[-7:][::-1])
+    return HISTORY_SECTION.render(runs=f"{len(times):,}", payload_kb=f"{len(data) / 1024:.1f}",
+                                  rows=rows, data=data, script=HISTORY_SCRIPT)
+
+
+HISTORY_ROW = Template(
+    "<tr><td>{{day}}</td><td>{{mean}}</td><td>{{low}}</td><td>{{high}}</td><td>{{count}}</td></tr>")
+
+HISTORY_SECTION = Template("""
+        <div class="indicators">
+            <h2>📈 Score History</h2>
+            <div class="history-controls">
+                <button type="button" data-days="7">7D</button>
+                <button type="button" data-days="30">30D</button>
+                <button type="button" data-days="90">90D</button>
+                <button type="button" data-days="365">1Y</button>
+                <button type="button" data-days="0">All</button>
+                <span class="history-hint">Drag to select a range · scroll to zoom · double-click to reset</span>
+            </div>
+            <div class="history-legend" id="history-legend"></div>
+            <div class="history-plot">
+                <canvas id="history-chart"></canvas>
+                <div class="history-tooltip" id="history-tooltip"></div>
+            </div>
+            <p class="history-note">{{runs}} runs embedded ({{payload_kb}} KB delta-encoded) - click a series to show or hide it</p>
+            <table class="history-table">
+                <tr><th>Day</th><th>Mean</th><th>Min</th><th>Max</th><th>Runs</th></tr>
+                {{rows|raw}}
+            </table>
+        </div>
+        <script type="application/json" id="history-data">{{data|raw}}</script>
+        <script>{{script|raw}}</script>
+""")
+
+# Vanilla canvas chart: decodes the embedded history, then zoom, range select and hover
+HISTORY_SCRIPT = """
+(function () {
+    var COLORS = %s;
+    var ZONES = [[70, 100, 'rgba(40,167,69,0.08)'], [50, 70, 'rgba(255,193,7,0.10)'],
+                 [30, 50, 'rgba(255,140,0,0.08)'], [0, 30, 'rgba(220,53,69,0.08)']];
+    var PAD = {left: 40, right: 12, top: 10, bottom: 26};
+    var DAY = 864e5;
+
+    var raw = JSON.parse(document.getElementById('history-data').textContent);
+    var n = raw.dt.length, times = new Float64Array(n), t = raw.start;
+    for (var i = 0; i < n; i++) { t += raw.dt[i]; times[i] = t * 1000; }
+    var series = Object.keys(raw.series).map(function (name, k) {
+        var first = raw.series[name].from, deltas = raw.series[name].d, values = new Float64Array(n), v = 0;
+        values.fill(NaN);
+        for (var i = 0; i < deltas.length; i++) {
+            if (deltas[i] !== null) { v += deltas[i]; values[first + i] = v / raw.scale; }
+        }
+        return {label: raw.series[name].label, values: values, color: COLORS[k %% COLORS.length],
+                visible: name === 'overall'};
+    });
+
+    var canvas = document.getElementById('history-chart'), ctx = canvas.getContext('2d');
+    var tooltip = document.getElementById('history-tooltip');
+    var full = [times[0], Math.max(times[n - 1], times[0] + 1)], view = full.slice();
+    var drag = null, hover = null;
+
+    function width() { return canvas.clientWidth - PAD.left - PAD.right; }
+    function height() { return canvas.clientHeight - PAD.top - PAD.bottom; }
+    function xOf(t) { return PAD.left + (t - view[0]) / (view[1] - view[0]) * width(); }
+    function tOf(x) { return view[0] + (x - PAD.left) / width() * (view[1] - view[0]); }
+    function yOf(v) { return PAD.top + (1 - v / 100) * height(); }
+    function lowerBound(t) {
+        var lo = 0, hi = n;
+        while (lo < hi) { var mid = (lo + hi) >> 1; if (times[mid] < t) { lo = mid + 1; } else { hi = mid; } }
+        return lo;
+    }
+    function setView(start, end) {
+        var span = Math.max(end - start, 60e3);
+        start = Math.max(full[0], Math.min(start, full[1] - span));
+        view = [start, Math.min(full[1], start + span)];
+        draw();
+    }
+    function label(t, span) {
+        var iso = new Date(t).toISOString();
+        return span < 2 * DAY ? iso.slice(5, 16).replace('T', ' ') : iso.slice(0, 10);
+    }
+
+    function drawSeries(s) {
+        var lo = Math.max(lowerBound(view[0]) - 1, 0), hi = Math.min(lowerBound(view[1]) + 1, n);
+        var dense = hi - lo > width() * 2, pen = false, column = null, min = 0, max = 0;
+        ctx.strokeStyle = s.color;
+        ctx.lineWidth = 1.5;
+        ctx.beginPath();
+        for (var i = lo; i < hi; i++) {
+            var v = s.values[i];
+            if (isNaN(v)) { if (!dense) { pen = false; } continue; }
+            var x = xOf(times[i]);
+            if (dense) {
+                // More runs than pixels: one min-max stroke per pixel column
+                var c = Math.round(x);
+                if (c !== column) {
+                    if (column !== null) { ctx.lineTo(column, yOf(min)); ctx.lineTo(column, yOf(max)); }
+                    column = c; min = max = v;
+                } else { min = Math.min(min, v); max = Math.max(max, v); }
+                if (!pen) { ctx.moveTo(c, yOf(v)); pen = true; }
+            } else if (pen) { ctx.lineTo(x, yOf(v)); } else { ctx.moveTo(x, yOf(v)); pen = true; }
+        }
+        if (dense && column !== null) { ctx.lineTo(column, yOf(min)); ctx.lineTo(column, yOf(max)); }
+        ctx.stroke();
+        if (!dense && hi - lo < width() / 8) {
+            ctx.fillStyle = s.color;
+            for (i = lo; i < hi; i++) {
+                if (!isNaN(s.values[i])) { ctx.beginPath(); ctx.arc(xOf(times[i]), yOf(s.values[i]), 3, 0, 2 * Math.PI); ctx.fill(); }
+            }
+        }
+    }
+
+    function draw() {
+        var w = canvas.clientWidth, h = canvas.clientHeight, span = view[1] - view[0];
+        ctx.clearRect(0, 0, w, h);
+        ZONES.forEach(function (z) {
+            ctx.fillStyle = z[2];
+            ctx.fillRect(PAD.left, yOf(z[1]), width(), yOf(z[0]) - yOf(z[1]));
+        });
+        ctx.fillStyle = '#666';
+        ctx.strokeStyle = '#e0e0e0';
+        ctx.lineWidth = 1;
+        ctx.font = '11px sans-serif';
+        ctx.textAlign = 'right';
+        ctx.textBaseline = 'middle';
+        for (var v = 0; v <= 100; v += 20) {
+            ctx.beginPath(); ctx.moveTo(PAD.left, yOf(v)); ctx.lineTo(w - PAD.right, yOf(v)); ctx.stroke();
+            ctx.fillText(v, PAD.left - 6, yOf(v));
+        }
+        ctx.textAlign = 'center';
+        ctx.textBaseline = 'top';
+        var ticks = Math.max(2, Math.floor(width() / 110));
+        for (var k = 0; k <= ticks; k++) {
+            var tick = view[0] + span * k / ticks;
+            ctx.fillText(label(tick, span), xOf(tick), h - PAD.bottom + 6);
+        }
+        ctx.save();
+        ctx.beginPath();
+        ctx.rect(PAD.left, PAD.top, width(), height());
+        ctx.clip();
+        series.forEach(function (s) { if (s.visible) { drawSeries(s); } });
+        if (drag) {
+            ctx.fillStyle = 'rgba(46,134,222,0.15)';
+            ctx.fillRect(Math.min(drag[0], drag[1]), PAD.top, Math.abs(drag[1] - drag[0]), height());
+        }
+        if (hover !== null) {
+            ctx.strokeStyle = '#999';
+            ctx.beginPath(); ctx.moveTo(xOf(times[hover]), PAD.top); ctx.lineTo(xOf(times[hover]), PAD.top + height()); ctx.stroke();
+        }
+        ctx.restore();
+    }
+
+    function resize() {
+        var ratio = window.devicePixelRatio || 1;
+        canvas.width = canvas.clientWidth * ratio;
+        canvas.height = canvas.clientHeight * ratio;
+        ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+        draw();
+    }
+
+    function showTooltip(x, y) {
+        var i = lowerBound(tOf(x));
+        if (i > 0 && (i === n || tOf(x) - times[i - 1] < times[i] - tOf(x))) { i -= 1; }
+        hover = i;
+        var lines = [new Date(times[i]).toISOString().slice(0, 16).replace('T', ' ')];
+        series.forEach(function (s) {
+            if (s.visible && !isNaN(s.values[i])) { lines.push(s.label + ': ' + s.values[i].toFixed(1)); }
+        });
+        tooltip.textContent = lines.join('\\n');
+        tooltip.style.display = 'block';
+        tooltip.style.left = Math.min(x + 12, canvas.clientWidth - tooltip.offsetWidth) + 'px';
+        tooltip.style.top = Math.max(y - 10, 0) + 'px';
+        draw();
+    }
+
+    function plotX(event) { return event.clientX - canvas.getBoundingClientRect().left; }
+    canvas.addEventListener('mousedown', function (event) { drag = [plotX(event), plotX(event)]; });
+    canvas.addEventListener('mousemove', function (event) {
+        var x = plotX(event);
+        if (drag) { drag[1] = x; draw(); }
+        showTooltip(x, event.clientY - canvas.getBoundingClientRect().top);
+    });
+    window.addEventListener('mouseup', function () {
+        if (!drag) { return; }
+        var a = Math.min(drag[0], drag[1]), b = Math.max(drag[0], drag[1]);
+        drag = null;
+        if (b - a > 5) { setView(tOf(a), tOf(b)); } else { draw(); }
+    });
+    canvas.addEventListener('mouseleave', function () { hover = null; tooltip.style.display = 'none'; draw(); });
+    canvas.addEventListener('dblclick', function () { setView(full[0], full[1]); });
+    canvas.addEventListener('wheel', function (event) {
+        event.preventDefault();
+        var at = tOf(plotX(event)), factor = event.deltaY < 0 ? 0.8 : 1.25;
+        setView(at - (at - view[0]) * factor, at + (view[1] - at) * factor);
+    }, {passive: false});
+    Array.prototype.forEach.call(document.querySelectorAll('.history-controls button'), function (button) {
+        button.addEventListener('click', function () {
+            var days = +button.getAttribute('data-days');
+            setView(days ? full[1] - days * DAY : full[0], full[1]);
+        });
+    });
+
+    var legend = document.getElementById('history-legend');
+    series.forEach(function (s) {
+        var item = document.createElement('button');
+        item.type = 'button';
+        item.className = 'history-series' + (s.visible ? '' : ' off');
+        item.style.borderColor = s.color;
+        item.textContent = s.label;
+        item.addEventListener('click', function () {
+            s.visible = !s.visible;
+            item.className = 'history-series' + (s.visible ? '' : ' off');
+            draw();
+        });
+        legend.appendChild(item);
+    });
+    window.addEventListener('resize', resize);
+    resize();
+})();
+""" % json.dumps(HISTORY_COLORS)
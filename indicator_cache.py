@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Tesla Robotaxi Monitor - Indicator Cache
+Reuses indicator results between runs when their input payloads are unchanged
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+import sysconfig
+from typing import Dict, Optional, Set
+
+CACHE_VERSION = 3
+
+# Fields that change on every fetch without the underlying data changing
+VOLATILE_KEYS = {'last_updated', 'last_check', 'check_date', 'timestamp'}
+
+
+def _strip_volatile(obj):
+    """Drop per-fetch timestamps so identical data hashes identically"""
+    if isinstance(obj, dict):
+        return {k: _strip_volatile(v) for k, v in obj.items() if k not in VOLATILE_KEYS}
+    if isinstance(obj, (list, tuple)):
+        return [_strip_volatile(v) for v in obj]
+    return obj
+
+
+def payload_hash(payload) -> str:
+    """Stable SHA-256 of a JSON-like payload, ignoring volatile fields"""
+    canonical = json.dumps(_strip_volatile(payload), sort_keys=True, default=str,
+                           separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+# Installed libraries only change with requirements.txt, so their sources are not hashed
+_LIBRARY_DIRS = tuple({os.path.realpath(sysconfig.get_paths()[key]) for key in ('stdlib', 'purelib', 'platlib')})
+_module_digests = {}
+
+
+def _module_digest(name: str) -> str:
+    """SHA-256 of a project module's source ('' for libraries and built-ins), once per process"""
+    if name not in _module_digests:
+        path = getattr(sys.modules.get(name), '__file__', None)
+        digest = ''
+        if path and not os.path.realpath(path).startswith(_LIBRARY_DIRS):
+            try:
+                with open(path, 'rb') as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()
+            except OSError:
+                pass
+        _module_digests[name] = digest
+    return _module_digests[name]
+
+
+def _referenced_names(code) -> Set[str]:
+    """Global and attribute names used by a code object and the functions nested in it"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _referenced_names(const)
+    return names
+
+
+def code_fingerprint(func) -> str:
+    """Fingerprint a function's bytecode and the source of the project modules it draws on.
+
+    That is its own module (helpers, module-level thresholds) plus the modules
+    of the globals it references, so editing any of them invalidates the cache.
+    """
+    func = getattr(func, '__func__', func)
+    code = getattr(func, '__code__', None)
+    if code is None:
+        return ''
+    consts = [c for c in code.co_consts if isinstance(c, (str, int, float))]
+    modules = {func.__module__}
+    func_globals = getattr(func, '__globals__', {})
+    for name in _referenced_names(code):
+        value = func_globals.get(name)
+        module = value.__name__ if inspect.ismodule(value) else getattr(value, '__module__', None)
+        if isinstance(module, str):
+            modules.add(module)
+    sources = ''.join(_module_digest(name) for name in sorted(modules))
+    return hashlib.sha256(code.co_code + repr(consts).encode('utf-8') + sources.encode('utf-8')).hexdigest()[:16]
+
+
+class IndicatorCache:
+    """JSON-backed map of indicator name -> last input hash and result"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries = {}
+        self.dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r') as f:
+                    data = json.load(f)
+                if data.get('version') == CACHE_VERSION:
+                    self.entries = data.get('indicators', {})
+        except Exception as e:
+            print(f"⚠️  Could not load indicator cache: {e}")
+            self.entries = {}
+
+    def get(self, name: str, input_hash: str) -> Optional[Dict]:
+        """Return the cached result if the inputs hash matches, else None"""
+        entry = self.entries.get(name)
+        if entry and entry.get('input_hash') == input_hash:
+            return entry
+        return None
+
+    def put(self, name: str, input_hash: str, score: float, details):
+        """Store a result; details are kept as structured fields, not rendered text"""
+        self.entries[name] = {
+            'input_hash': input_hash,
+            'score': score,
+            'details': details.to_dict()
+        }
+        self.dirty = True
+
+    def save(self):
+        """Write the cache atomically so a crash never leaves a partial file"""
+        if not self.dirty:
+            return
+        try:
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump({'version': CACHE_VERSION, 'indicators': self.entries}, f)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except Exception as e:
+            print(f"⚠️  Could not save indicator cache: {e}")
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Tesla Robotaxi Monitor - Indicator Details
+Detail text is rendered from structured fields only when a report asks for it
+"""
+
+from typing import Callable, Dict
+
+# Template name -> function(fields) returning the detail text
+# Indicator plugins register their own templates (see indicators/)
+TEMPLATES: Dict[str, Callable[[Dict], str]] = {}
+
+
+def template(name: str):
+    """Register a detail text template"""
+    def register(func):
+        TEMPLATES[name] = func
+        return func
+    return register
+
+
+class LazyDetails:
+    """Indicator details held as structured fields and rendered to text on first use"""
+    __slots__ = ('template', 'fields', 'live', '_text')
+
+    def __init__(self, template_name: str, fields: Dict, live: bool = False):
+        self.template = template_name
+        self.fields = fields
+        self.live = live  # True when built from real (non-default) source data
+        self._text = None
+
+    def render(self) -> str:
+        if self._text is None:
+            self._text = TEMPLATES[self.template](self.fields)
+        return self._text
+
+    def __str__(self):
+        return self.render()
+
+    def __contains__(self, item):
+        return item in self.render()
+
+    def __repr__(self):
+        return f"LazyDetails({self.template!r}, live={self.live})"
+
+    def to_dict(self) -> Dict:
+        return {'template': self.template, 'fields': self.fields, 'live': self.live}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'LazyDetails':
+        return cls(data['template'], data['fields'], data.get('live', False))
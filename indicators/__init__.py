@@ -0,0 +1,146 @@
+"""
+Tesla Robotaxi Monitor - Indicator Plugins
+
+Every module in this package defines one indicator and registers it with
+@register. Adding an indicator means dropping a new module here - the
+monitor picks up its weight, sources, cache policy and renderers from the
+class attributes below.
+
+Indicators built on one program's own record (Tesla's timeline promises,
+FSD capability, Tesla-vs-competitor position) list the entities they apply
+to. For any other entity they are not applicable: they are left out of its
+run and the remaining weights are scaled up to the same total.
+"""
+
+import importlib
+import json
+import pkgutil
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+# Output renderers an indicator can appear in
+RENDER_REPORT = 'report'   # Text report
+RENDER_HTML = 'html'       # HTML dashboard indicator card
+RENDER_PNG = 'png'         # Matplotlib breakdown / contribution panels
+
+# Cache policies
+CACHE_INPUTS = 'inputs'    # Reuse the last result while the input payloads hash the same
+CACHE_NEVER = 'never'      # Always recompute
+
+_PLUGINS = {}
+
+
+class Indicator:
+    """Base class for indicator plugins"""
+    name = None
+    weight = 0.0
+    sources = ()                 # Source names from real_data_monitor.SOURCE_FETCHERS
+    cache_policy = CACHE_INPUTS
+    renderers = (RENDER_REPORT, RENDER_HTML, RENDER_PNG)
+    order = 100                  # Display order in reports and charts
+    budget_seconds = None        # Warn when a run of this indicator takes longer
+    entities = None              # Entity names this indicator applies to (None = every entity)
+
+    @property
+    def title(self) -> str:
+        return self.name.replace('_', ' ').title()
+
+    def applies_to(self, entity: Dict) -> bool:
+        return self.entities is None or (entity or {}).get('name') in self.entities
+
+    def check(self, monitor) -> Tuple[float, object]:
+        """Return (score, LazyDetails) using monitor._fetch_source() and monitor.config"""
+        raise NotImplementedError
+
+
+def register(cls):
+    """Class decorator registering an indicator plugin"""
+    _PLUGINS[cls.name] = cls
+    return cls
+
+
+def discover() -> List[Indicator]:
+    """Import every module in this package and return the plugins in display order"""
+    for module in pkgutil.iter_modules(__path__):
+        importlib.import_module(f'{__name__}.{module.name}')
+    return sorted((cls() for cls in _PLUGINS.values()), key=lambda p: (p.order, p.name))
+
+
+def _network_totals() -> Dict:
+    from real_data_monitor import NETWORK_STATS
+    return dict(NETWORK_STATS)
+
+
+class IndicatorRegistry:
+    """Discovered indicator plugins (those applying to the entity) plus per-run cost accounting"""
+
+    def __init__(self, entity: Dict = None):
+        plugins = discover()
+        self.plugins = [p for p in plugins if p.applies_to(entity)]
+        self.not_applicable = [p for p in plugins if not p.applies_to(entity)]
+        # Applicable weights are scaled to the total of all indicators
+        applicable = sum(p.weight for p in self.plugins)
+        self.weight_scale = sum(p.weight for p in plugins) / applicable if applicable else 1.0
+        self.costs = {}
+
+    def __iter__(self):
+        return iter(self.plugins)
+
+    def get(self, name: str) -> Indicator:
+        return next(p for p in self.plugins if p.name == name)
+
+    def weights(self) -> Dict[str, float]:
+        return {p.name: p.weight * self.weight_scale for p in self.plugins}
+
+    def with_renderer(self, renderer: str) -> List[Indicator]:
+        return [p for p in self.plugins if renderer in p.renderers]
+
+    @contextmanager
+    def measure(self, name: str, prefetched: List[Dict] = ()):
+        """Record wall time, network calls and bytes spent inside the block.
+
+        Sources are prefetched concurrently before scoring, so their cost is
+        passed in as `prefetched` (this indicator's share of each source it
+        declares, see SourcePool.prefetched_cost) and added to the block's own.
+        """
+        before = _network_totals()
+        start = time.perf_counter()
+        cost = {'seconds': 0.0, 'network_calls': 0, 'network_bytes': 0, 'cached': False}
+        self.costs[name] = cost
+        try:
+            yield cost
+        finally:
+            after = _network_totals()
+            cost['seconds'] = time.perf_counter() - start
+            cost['network_calls'] = after['calls'] - before['calls']
+            cost['network_bytes'] = after['bytes'] - before['bytes']
+            for share in prefetched:
+                for key in ('seconds', 'network_calls', 'network_bytes'):
+                    cost[key] += share[key]
+            cost['network_calls'] = round(cost['network_calls'], 2)
+            cost['network_bytes'] = round(cost['network_bytes'])
+
+    def print_costs(self):
+        """Print this run's cost table, most expensive first"""
+        print("\n⏱️  INDICATOR COST (this run)")
+        print("-"*80)
+        print(f"   {'Indicator':<26}{'Time (ms)':>10}{'Calls':>8}{'Bytes':>12}  Cache")
+        for name, cost in sorted(self.costs.items(), key=lambda kv: -kv[1]['seconds']):
+            flag = '♻️' if cost['cached'] else ''
+            print(f"   {name:<26}{cost['seconds']*1000:>10.1f}{cost['network_calls']:>8g}"
+                  f"{cost['network_bytes']:>12,}  {flag}")
+            budget = self.get(name).budget_seconds
+            if budget is not None and cost['seconds'] > budget:
+                print(f"   ⚠️  {name} exceeded its {budget:.1f}s budget")
+        print("-"*80)
+
+    def save_costs(self, path: str):
+        """Append this run's costs as one JSON line so expensive indicators can be tracked over time"""
+        try:
+            record = {'timestamp': datetime.now().isoformat(), 'indicators': self.costs}
+            with open(path, 'a') as f:
+                f.write(json.dumps(record) + '\n')
+        except Exception as e:
+            print(f"⚠️  Could not save indicator costs: {e}")
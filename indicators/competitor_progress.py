@@ -0,0 +1,166 @@
+"""
+Tesla Robotaxi Monitor - Competitor Progress indicator plugin
+"""
+
+from typing import Tuple
+
+from indicators import Indicator, register
+from indicator_details import LazyDetails, template
+
+
+@register
+class CompetitorProgress(Indicator):
+    """Compare Tesla to competitors - NOW WITH DMV DISENGAGEMENT DATA (TIER 2)"""
+    name = 'competitor_progress'
+    weight = 0.10
+    sources = ('competitors', 'dmv_data', 'cpuc_deployment')
+    order = 40
+    entities = ('Tesla',)
+
+    def check(self, monitor) -> Tuple[float, LazyDetails]:
+        score = 25
+
+        # Try to get real competitor data
+        try:
+            comp_data = monitor._fetch_source('competitors')
+            dmv_data = monitor._fetch_source('dmv_data')
+
+            if 'error' not in comp_data:
+                competitors = comp_data.get('competitors', {})
+                competitor_fields = {
+                    name: {key: competitors[name][key] for key in ('cities', 'weekly_rides', 'status')}
+                    for name in ('Waymo', 'Baidu Apollo', 'Cruise', 'Tesla')
+                }
+
+                # DMV section
+                dmv = None
+                if 'error' not in dmv_data:
+                    companies = dmv_data.get('companies', {})
+                    dmv = {
+                        'waymo_miles': companies['Waymo']['miles_driven'],
+                        'waymo_disengagements': companies['Waymo']['disengagements'],
+                        'waymo_mpd': companies['Waymo']['miles_per_disengagement'],
+                        'cruise_miles': companies['Cruise']['miles_driven'],
+                        'cruise_disengagements': companies['Cruise']['disengagements'],
+                        'cruise_mpd': companies['Cruise']['miles_per_disengagement'],
+                        'tesla_status': companies['Tesla']['status'],
+                        'tesla_note': companies['Tesla']['note'],
+                        'waymo_vs_tesla': dmv_data['gap_analysis']['waymo_vs_tesla'],
+                        'safety_gap': dmv_data['gap_analysis']['safety_gap'],
+                        'concern': dmv_data['gap_analysis']['concern']
+                    }
+
+                # Add CPUC deployment data (TIER 1)
+                cpuc = None
+                try:
+                    cpuc_data = monitor._fetch_source('cpuc_deployment')
+
+                    if 'error' not in cpuc_data:
+                        companies_cpuc = cpuc_data.get('companies', {})
+                        waymo_cpuc = companies_cpuc.get('Waymo', {})
+                        tesla_cpuc = companies_cpuc.get('Tesla', {})
+
+                        cpuc = {
+                            'waymo_status': waymo_cpuc.get('commercial_status', 'N/A'),
+                            'waymo_weekly_rides': waymo_cpuc.get('weekly_rides', 'N/A'),
+                            'waymo_fleet_size': waymo_cpuc.get('fleet_size', 'N/A'),
+                            'waymo_service_area': waymo_cpuc.get('service_area', 'N/A'),
+                            'tesla_status': tesla_cpuc.get('commercial_status', 'N/A'),
+                            'tesla_weekly_rides': tesla_cpuc.get('weekly_rides', 'N/A'),
+                            'tesla_notes': tesla_cpuc.get('notes', ''),
+                            'gap': cpuc_data['key_findings']['gap'],
+                            'regulatory': cpuc_data['key_findings']['regulatory']
+                        }
+                except Exception as e:
+                    print(f"⚠️  Could not fetch CPUC deployment data: {e}")
+
+                fields = {
+                    'score': score,
+                    'competitors': competitor_fields,
+                    'dmv': dmv,
+                    'cpuc': cpuc,
+                    'tesla_rank': comp_data.get('tesla_rank', 'UNKNOWN'),
+                    'gap_assessment': comp_data.get('gap_assessment', 'Unknown'),
+                    'source': comp_data.get('source', 'Unknown')
+                }
+                return score, LazyDetails('competitor_progress', fields, live=True)
+        except Exception as e:
+            print(f"⚠️  Could not fetch competitor data: {e}")
+
+        # Fallback to default
+        return score, LazyDetails('competitor_progress', {'score': score})
+
+
+@template('competitor_progress')
+def _competitor_progress(f):
+    competitors = f.get('competitors')
+    if not competitors:
+        return f"""
+        Competitive Position Analysis:
+
+        OPERATIONAL ROBOTAXIS TODAY:
+        • Waymo: 4 cities, 150K+ weekly rides, FULLY DRIVERLESS
+        • Baidu: 11 cities (China), 60K+ weekly rides, FULLY DRIVERLESS
+        • Tesla: 0 cities, 0 rides, SUPERVISED ONLY
+
+        Score: {f['score']}/100 (Tesla is 5+ years behind in deployment)
+
+        🚨 CRITICAL: Competitors have actual robotaxis operating TODAY
+        """
+
+    dmv_section = ""
+    dmv = f.get('dmv')
+    if dmv:
+        dmv_section = f"""
+
+        CA DMV DISENGAGEMENT DATA (2023 Report):
+        • Waymo: {dmv['waymo_miles']:,} miles, {dmv['waymo_disengagements']} disengagements
+          → {dmv['waymo_mpd']:,} miles per disengagement (LEADER)
+        • Cruise: {dmv['cruise_miles']:,} miles, {dmv['cruise_disengagements']:,} disengagements
+          → {dmv['cruise_mpd']:,} miles per disengagement
+        • Tesla: {dmv['tesla_status']}
+          → {dmv['tesla_note']}
+
+        GAP ANALYSIS:
+        • {dmv['waymo_vs_tesla']}
+        • {dmv['safety_gap']}
+        • 🚨 {dmv['concern']}
+        """
+
+    details = f"""
+        Competitive Position Analysis (REAL DATA + DMV):
+
+        OPERATIONAL ROBOTAXIS TODAY:
+        • Waymo: {competitors['Waymo']['cities']} cities, {competitors['Waymo']['weekly_rides']} weekly rides, {competitors['Waymo']['status']}
+        • Baidu Apollo: {competitors['Baidu Apollo']['cities']} cities (China), {competitors['Baidu Apollo']['weekly_rides']} weekly rides, {competitors['Baidu Apollo']['status']}
+        • Cruise: {competitors['Cruise']['cities']} cities, {competitors['Cruise']['weekly_rides']} weekly rides, {competitors['Cruise']['status']}
+        • Tesla: {competitors['Tesla']['cities']} cities, {competitors['Tesla']['weekly_rides']} weekly rides, {competitors['Tesla']['status']}
+        {dmv_section}
+
+        Tesla Ranking: {f['tesla_rank']}
+        Gap Assessment: {f['gap_assessment']}
+        """
+
+    cpuc_section = ""
+    cpuc = f.get('cpuc')
+    if cpuc:
+        cpuc_section = f"""
+
+        CPUC COMMERCIAL DEPLOYMENT (TIER 1 - 2024 Q3):
+        • Waymo: {cpuc['waymo_status']} - {cpuc['waymo_weekly_rides']} weekly rides
+          Fleet: {cpuc['waymo_fleet_size']} | Area: {cpuc['waymo_service_area']}
+        • Tesla: {cpuc['tesla_status']} - {cpuc['tesla_weekly_rides']} rides
+          {cpuc['tesla_notes']}
+
+        KEY FINDING:
+        • {cpuc['gap']}
+        • {cpuc['regulatory']}
+        """
+
+    return details + cpuc_section + f"""
+
+        Score: {f['score']}/100 (Tesla is 5+ years behind in deployment)
+
+        🚨 CRITICAL: Competitors have actual robotaxis operating TODAY
+        Source: {f['source']} + CA DMV + CPUC
+        """
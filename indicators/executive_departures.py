@@ -0,0 +1,72 @@
+"""
+Tesla Robotaxi Monitor - Executive Departures indicator plugin
+"""
+
+from typing import Tuple
+
+from indicators import Indicator, register, RENDER_REPORT, RENDER_PNG
+from indicator_details import LazyDetails, template
+
+
+@register
+class ExecutiveDepartures(Indicator):
+    """Track executive departures - TIER 1 FEATURE"""
+    name = 'executive_departures'
+    weight = 0.00
+    sources = ('executive_departures',)
+    order = 90
+    renderers = (RENDER_REPORT, RENDER_PNG)  # Red flag indicator, no HTML card
+
+    def check(self, monitor) -> Tuple[int, LazyDetails]:
+        red_flag_points = 0
+
+        # Try to get real executive departure data
+        try:
+            if monitor.config.get('news_api_key'):
+                exec_data = monitor._fetch_source('executive_departures')
+
+                if 'error' not in exec_data:
+                    departures = exec_data.get('potential_departures', 0)
+                    recent = exec_data.get('recent_departures', [])
+
+                    # Red flag: 3 points per key executive departure
+                    red_flag_points = departures * 3
+
+                    fields = {
+                        'departures': departures,
+                        'recent_titles': [d['title'] for d in recent[:3]],
+                        'red_flag_points': red_flag_points
+                    }
+                    return red_flag_points, LazyDetails('executive_departures', fields)
+        except Exception as e:
+            print(f"⚠️  Could not fetch executive departure data: {e}")
+
+        # Fallback
+        return 0, LazyDetails('executive_departures', {})
+
+
+@template('executive_departures')
+def _executive_departures(f):
+    if 'departures' not in f:
+        return """
+        Executive Departure Tracking:
+
+        • No automated tracking available
+        • Add NEWS_API_KEY to config.py for real-time monitoring
+
+        RED FLAG POINTS: 0 (Manual tracking required)
+        """
+    departures = f['departures']
+    recent_list = "\n".join([f"        • {title}" for title in f['recent_titles']])
+    return f"""
+        Executive Departure Tracking (Last 90 days):
+
+        • Total potential departures detected: {departures}
+        • Recent departures (key roles):
+{recent_list if recent_list else '        (None detected)'}
+
+        RED FLAG POINTS: {f['red_flag_points']} ({departures} departures × 3 points)
+
+        {'🚨 WARNING: Key personnel leaving' if departures > 0 else '✅ No major departures detected'}
+        Source: News API (Real-time tracking)
+        """
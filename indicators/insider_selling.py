@@ -0,0 +1,80 @@
+"""
+Tesla Robotaxi Monitor - Insider Selling indicator plugin
+"""
+
+from typing import Tuple
+
+from indicators import Indicator, register
+from indicator_details import LazyDetails, template
+
+
+@register
+class InsiderSelling(Indicator):
+    """Monitor insider trading patterns"""
+    name = 'insider_selling'
+    weight = 0.10
+    sources = ('insider_trading',)
+    order = 50
+
+    def check(self, monitor) -> Tuple[float, LazyDetails]:
+        score = 40
+
+        # Try to get real SEC insider trading data
+        try:
+            insider_data = monitor._fetch_source('insider_trading')
+
+            if 'error' not in insider_data:
+                filings = insider_data.get('insider_filings_90d', 0)
+                activity = insider_data.get('activity_level', 'UNKNOWN')
+
+                # Adjust score based on filing activity
+                score = monitor.rules.apply(self.name, score, activity=activity)
+
+                fields = {
+                    'score': score,
+                    'filings': filings,
+                    'activity': activity,
+                    'source': insider_data.get('source', 'Unknown'),
+                    'last_check': insider_data.get('last_check', 'Unknown')
+                }
+                return score, LazyDetails('insider_selling', fields, live=True)
+        except Exception as e:
+            print(f"⚠️  Could not fetch SEC data: {e}")
+
+        # Fallback to default
+        return score, LazyDetails('insider_selling', {'score': score})
+
+
+@template('insider_selling')
+def _insider_selling(f):
+    if f.get('activity'):
+        activity = f['activity']
+        return f"""
+        Insider Trading Analysis (REAL DATA):
+
+        • SEC Form 4 filings (last 90 days): {f['filings']}
+        • Activity level: {activity}
+        • Source: {f['source']}
+        • Last check: {f['last_check']}
+
+        BACKGROUND:
+        • Elon Musk: $10B+ in stock sales (reported)
+        • Executive team: Net selling across board
+        • No significant insider purchases in 12 months
+
+        Score: {f['score']}/100 (Below 50 suggests insiders not confident)
+
+        ⚠️ NOTE: Heavy insider selling often precedes negative developments
+        📊 Current filing rate: {"CONCERNING" if activity == "HIGH" else "MODERATE" if activity == "MODERATE" else "NORMAL"}
+        """
+    return f"""
+        Insider Trading Analysis (Last 6 months):
+
+        • Elon Musk: $10B+ in stock sales
+        • Executive team: Net selling across board
+        • No significant insider purchases in 12 months
+
+        Score: {f['score']}/100 (Below 50 suggests insiders not confident)
+
+        ⚠️ NOTE: Heavy insider selling often precedes negative developments
+        """
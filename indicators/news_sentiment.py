@@ -0,0 +1,78 @@
+"""
+Tesla Robotaxi Monitor - News Sentiment indicator plugin
+"""
+
+from typing import Tuple
+
+from indicators import Indicator, register
+from indicator_details import LazyDetails, template
+
+
+@register
+class NewsSentiment(Indicator):
+    """Analyze news sentiment"""
+    name = 'news_sentiment'
+    weight = 0.10
+    sources = ('news',)
+    order = 60
+
+    def check(self, monitor) -> Tuple[float, LazyDetails]:
+        # Try to fetch real data if API key is available
+        if monitor.config.get('news_api_key'):
+            try:
+                news_data = monitor._fetch_source('news')
+
+                if 'error' not in news_data:
+                    # Convert sentiment to score
+                    sentiment_score = news_data.get('sentiment_score', 0)
+                    # Normalize to 0-100 scale (assuming sentiment_score ranges from -30 to +30)
+                    score = max(0, min(100, 50 + sentiment_score * 1.5))
+
+                    fields = {
+                        'score': score,
+                        'total': news_data.get('total', 0),
+                        'sentiment': news_data.get('sentiment', 'UNKNOWN'),
+                        'sentiment_score': sentiment_score,
+                        'headlines': [article.get('title', 'N/A') for article in news_data.get('articles', [])[:3]]
+                    }
+                    return score, LazyDetails('news_sentiment', fields, live=True)
+                else:
+                    print(f"⚠️  News API error: {news_data['error']}")
+            except Exception as e:
+                print(f"⚠️  Could not fetch real news data: {e}")
+
+        # Fallback to default score if no API key or error
+        score = 50
+        return score, LazyDetails('news_sentiment', {'score': score})
+
+
+@template('news_sentiment')
+def _news_sentiment(f):
+    if 'headlines' in f:
+        details = f"""
+        News Sentiment Analysis (30-day rolling - REAL DATA):
+
+        • Total articles analyzed: {f['total']}
+        • Sentiment: {f['sentiment']}
+        • Raw sentiment score: {f['sentiment_score']}
+
+        Recent headlines:
+        """
+        for i, title in enumerate(f['headlines'], 1):
+            details += f"\n        {i}. {title}"
+        details += f"""
+
+        Sentiment Score: {f['score']:.0f}/100 (Based on real news data)
+        """
+        return details
+    return f"""
+        News Sentiment Analysis (30-day rolling - DEFAULT):
+
+        POSITIVE: FSD improvements, technological optimism
+        NEGATIVE: Crash investigations, competitor advances, skepticism
+        NEUTRAL: Timeline questions, analytical pieces
+
+        Sentiment Score: {f['score']}/100 (Mixed, trending negative)
+
+        ℹ️  Add NEWS_API_KEY to config.py for real-time news analysis
+        """
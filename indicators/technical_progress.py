@@ -0,0 +1,40 @@
+"""
+Tesla Robotaxi Monitor - Technical Progress indicator plugin
+"""
+
+from typing import Tuple
+
+from indicators import Indicator, register
+from indicator_details import LazyDetails, template
+
+
+@register
+class TechnicalProgress(Indicator):
+    """Evaluate FSD capability improvements"""
+    name = 'technical_progress'
+    weight = 0.10
+    sources = ()
+    order = 70
+    entities = ('Tesla',)
+
+    def check(self, monitor) -> Tuple[float, LazyDetails]:
+        score = 60
+        return score, LazyDetails('technical_progress', {'score': score})
+
+
+@template('technical_progress')
+def _technical_progress(f):
+    return f"""
+        Technical Progress Assessment:
+
+        CAPABILITIES TODAY:
+        ✓ Highway driving (mostly reliable)
+        ✓ Simple intersections (good)
+        ✗ Complex urban environments (struggles)
+        ✗ Adverse weather (poor)
+        ✗ Construction zones (unreliable)
+
+        Score: {f['score']}/100 (Progress continuing but slowing)
+
+        ⚠️ CONCERN: Improvement rate insufficient to meet 2026-2027 timeline
+        """
@@ -0,0 +1,94 @@
+"""
+Tesla Robotaxi Monitor - Timeline Slippage indicator plugin
+"""
+
+from typing import Tuple
+
+from indicators import Indicator, register
+from indicator_details import LazyDetails, template
+
+
+@register
+class TimelineSlippage(Indicator):
+    """Track Musk's robotaxi promises vs reality - NOW WITH EARNINGS CALL TRACKING"""
+    name = 'timeline_slippage'
+    weight = 0.15
+    sources = ('earnings_timeline',)
+    order = 30
+    entities = ('Tesla',)
+
+    def check(self, monitor) -> Tuple[float, LazyDetails]:
+        timeline_history = [
+            ("2015", "Full autonomy in 2 years", "MISSED"),
+            ("2016", "Autonomous coast-to-coast drive by end of 2017", "MISSED"),
+            ("2019", "Robotaxis by 2020", "MISSED"),
+            ("2021", "FSD feature complete by end of year", "MISSED"),
+            ("2022", "Wide release FSD Beta", "PARTIALLY MET"),
+            ("2023", "Unsupervised FSD this year", "MISSED"),
+            ("2024", "Robotaxi reveal and 2025 deployment", "DELAYED"),
+            ("2025", "Cybercab production 2026/2027", "TBD")
+        ]
+
+        missed_count = sum(1 for _, _, status in timeline_history if status == "MISSED")
+        total_predictions = len(timeline_history)
+
+        score = max(0, 100 - (missed_count / total_predictions * 100))
+
+        # Try to get earnings call timeline data
+        earnings = None
+        try:
+            if monitor.config.get('news_api_key'):
+                earnings_data = monitor._fetch_source('earnings_timeline')
+
+                if 'error' not in earnings_data:
+                    delay_mentions = earnings_data.get('delay_mentions', 0)
+                    new_promises = earnings_data.get('new_promises', 0)
+                    credibility_concern = earnings_data.get('credibility_concern', False)
+
+                    # Adjust score based on earnings data
+                    score = monitor.rules.apply(self.name, score, credibility_concern=credibility_concern,
+                                                delay_mentions=delay_mentions)
+
+                    earnings = {
+                        'total_articles': earnings_data.get('total_articles', 0),
+                        'delay_mentions': delay_mentions,
+                        'new_promises': new_promises,
+                        'credibility_concern': credibility_concern
+                    }
+        except Exception as e:
+            print(f"⚠️  Could not fetch earnings data: {e}")
+
+        fields = {
+            'score': score,
+            'total_predictions': total_predictions,
+            'missed_count': missed_count,
+            'earnings': earnings
+        }
+        return score, LazyDetails('timeline_slippage', fields)
+
+
+@template('timeline_slippage')
+def _timeline_slippage(f):
+    earnings_info = ""
+    earnings = f.get('earnings')
+    if earnings:
+        earnings_info = f"""
+
+        RECENT EARNINGS CALL TRACKING (Last 120 days):
+        • Articles mentioning timeline: {earnings['total_articles']}
+        • Delay mentions: {earnings['delay_mentions']}
+        • New promises made: {earnings['new_promises']}
+        • Credibility concern: {'YES' if earnings['credibility_concern'] else 'NO'}
+        """
+    return f"""
+        Timeline Credibility Analysis:
+        • Total predictions tracked: {f['total_predictions']}
+        • Predictions missed: {f['missed_count']}
+        • Current status: "2026/2027 production" (already delayed from 2025)
+        • Pattern: Consistent 2-3 year delays on all major milestones
+        {earnings_info}
+
+        Track Record Score: {f['score']:.1f}/100
+
+        🚨 RED FLAG: After 10 years of promises, zero cities with unsupervised robotaxis
+        """
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tesla Robotaxi Monitor - Output Stage
+Renders the PNG dashboard, indicator trends, text report and HTML dashboard concurrently
+
+Every output is rendered in its own worker process from one read-only
+RenderJob: the entity, config, scored results and the source payloads the
+run used. Workers rebuild a monitor from the job with its fetch pool seeded
+from those payloads, so rendering never goes back to the network for data
+the run already has. Wall time is that of the slowest renderer, and an
+output that raises (or takes its worker process down) is reported without
+affecting the others.
+
+Each worker's console output is captured and printed in output order once
+it finishes, so logs from concurrent renderers do not interleave.
+"""
+
+import io
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import redirect_stdout
+from typing import Dict, List, Tuple
+
+# Output name -> TeslaRobotaxiMonitor renderer method
+OUTPUTS = {
+    'png': 'visualize_dashboard',
+    'trends': 'visualize_indicator_trends',
+    'report': 'generate_report',
+    'html': 'generate_html_dashboard',
+}
+
+
+class RenderJob:
+    """Read-only snapshot of one scored run - everything a renderer needs"""
+    __slots__ = ('entity', 'config', 'results', 'indicators', 'source_payloads')
+
+    def __init__(self, entity: Dict, config: Dict, results: Dict, indicators: Dict, source_payloads: Dict):
+        for name, value in zip(self.__slots__, (entity, config, results, indicators, source_payloads)):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("RenderJob is read-only")
+
+    def __reduce__(self):
+        return RenderJob, tuple(getattr(self, name) for name in self.__slots__)
+
+    @classmethod
+    def from_monitor(cls, monitor, results: Dict) -> 'RenderJob':
+        return cls(monitor.entity, monitor.config, results, dict(monitor.indicators), dict(monitor.source_payloads))
+
+    def monitor(self):
+        """A monitor for this job whose sources resolve to the run's payloads"""
+        from tesla_robotaxi_monitor import TeslaRobotaxiMonitor
+        monitor = TeslaRobotaxiMonitor(self.entity, config=self.config)
+        monitor.indicators = dict(self.indicators)
+        monitor.source_payloads = dict(self.source_payloads)
+        for name, payload in self.source_payloads.items():
+            monitor.pool.seed(name, self.entity, payload)
+        return monitor
+
+
+def render_output(job: RenderJob, name: str) -> Tuple[bool, str, float]:
+    """Render one output; returns (succeeded, captured console output, seconds)"""
+    started = time.perf_counter()
+    log = io.StringIO()
+    with redirect_stdout(log):
+        try:
+            getattr(job.monitor(), OUTPUTS[name])(job.results)
+            ok = True
+        except Exception as e:
+            print(f"❌ ERROR rendering {name}: {e}")
+            ok = False
+    return ok, log.getvalue(), time.perf_counter() - started
+
+
+def _report(name: str, ok: bool, log: str, seconds: float):
+    if log.strip():
+        print(log.rstrip())
+    print(f"{'✅' if ok else '⚠️ '} {name} output {'rendered' if ok else 'failed'} in {seconds:.1f}s")
+
+
+def run_output_stage(monitor, results: Dict, outputs: List[str] = None, parallel: bool = True) -> Dict[str, bool]:
+    """Render outputs concurrently from one snapshot; returns {output: succeeded}.
+
+    Each output gets a process of its own, so a renderer that crashes its
+    interpreter cannot break the others. With parallel=False, or where
+    processes are unavailable, outputs render one after another in this
+    process, still isolated from each other's exceptions.
+    """
+    names = list(outputs or OUTPUTS)
+    job = RenderJob.from_monitor(monitor, results)
+    status = {}
+    started = time.perf_counter()
+
+    futures = {}
+    if parallel and len(names) > 1:
+        print(f"🖨️  Rendering {', '.join(names)} in parallel worker processes...")
+        for name in names:
+            executor = ProcessPoolExecutor(max_workers=1)
+            try:
+                futures[name] = (executor, executor.submit(render_output, job, name))
+            except (OSError, RuntimeError) as e:
+                print(f"⚠️  No worker process for {name} ({e}) - rendering it here")
+                executor.shutdown()
+
+    for name in names:
+        if name not in futures:
+            ok, log, seconds = render_output(job, name)
+        else:
+            executor, future = futures[name]
+            try:
+                ok, log, seconds = future.result()
+            except BrokenProcessPool:
+                ok, log, seconds = False, f"❌ Worker process for {name} exited unexpectedly", 0.0
+            except Exception as e:
+                ok, log, seconds = False, f"❌ ERROR rendering {name}: {e}", 0.0
+            executor.shutdown()
+        _report(name, ok, log, seconds)
+        status[name] = ok
+
+    print(f"🖨️  Output stage finished in {time.perf_counter() - started:.1f}s "
+          f"({sum(status.values())}/{len(status)} outputs)")
+    return status
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Tesla Robotaxi Monitor - Panel Cache
+Per-panel raster cache for the PNG dashboard
+
+Each dashboard panel (gauge, indicator breakdown, risk dial, weighted pie,
+trend) is drawn on a figure of its own, with axes the size they have in
+the 18x12in dashboard grid, and saved tight-cropped as
+<directory>/<profile>/<panel>-<key>.png. The key hashes everything the panel shows
+plus the plotting code. The dashboard is composited from those rasters,
+row by row.
+
+Panels whose key is unchanged are reused without drawing. When every key
+matches the ones the current dashboard PNG was built from, the dashboard
+is left as it is and no matplotlib work happens at all.
+
+Render profiles trade fidelity for speed and size:
+    preview   Low-DPI PNG, fast to encode
+    publish   300 DPI PNG (the default)
+    vector    SVG of the whole dashboard, drawn as one figure
+    tiny      Palette-quantized (256-colour) PNG at a moderate DPI
+Raster profiles keep their panels in a subdirectory per profile.
+"""
+
+import hashlib
+import json
+import os
+from typing import Callable, Dict, List, Sequence
+
+from indicator_cache import code_fingerprint, payload_hash
+
+DPI = 300
+
+# Profile name -> output format and encoding
+RENDER_PROFILES = {
+    'preview': {'format': 'png', 'dpi': 80, 'compress_level': 1},
+    'publish': {'format': 'png', 'dpi': DPI, 'compress_level': 6},
+    'vector': {'format': 'svg'},
+    'tiny': {'format': 'png', 'dpi': 120, 'compress_level': 9, 'colors': 256},
+}
+DEFAULT_PROFILE = 'publish'
+
+# Axes size (inches) of one cell of the dashboard's 3x3 grid (18x12in figure, 0.3 spacing)
+CELL_WIDTH, CELL_HEIGHT = 3.875, 2.567
+CELL_SPACING = 0.3
+
+# Room around the axes for titles, labels and legends before the tight crop
+MARGIN = 2.0
+# Whitespace between and around panels in the composite
+PANEL_PAD = 0.25
+
+
+def array_digest(*arrays) -> str:
+    """Hash numpy arrays by content (for panel inputs such as history columns)"""
+    h = hashlib.sha256()
+    for array in arrays:
+        h.update(str(array.dtype).encode('utf-8'))
+        h.update(array.tobytes())
+    return h.hexdigest()
+
+
+class Panel:
+    """One dashboard panel: how to draw it and what it depends on"""
+    __slots__ = ('name', 'columns', 'plot', 'args', 'key')
+
+    def __init__(self, name: str, columns: int, plot: Callable, args: Sequence, inputs):
+        self.name = name
+        self.columns = columns  # Grid cells spanned horizontally
+        self.plot = plot        # plot(ax, *args)
+        self.args = tuple(args)
+        self.key = payload_hash({
+            'inputs': inputs,
+            'code': code_fingerprint(plot),
+            'columns': columns,
+        })[:16]
+
+    def axes_size(self):
+        return CELL_WIDTH * (self.columns + CELL_SPACING * (self.columns - 1)), CELL_HEIGHT
+
+
+class PanelCache:
+    """Panel rasters on disk plus the keys the last composite was built from"""
+
+    def __init__(self, directory: str, profile: str = DEFAULT_PROFILE, setup: Callable = None):
+        self.profile = RENDER_PROFILES[profile]
+        self.directory = os.path.join(directory, profile)
+        self.index_path = os.path.join(self.directory, 'index.json')
+        self.setup = setup  # Called once before the first figure is drawn (imports, styles)
+
+    def _panel_path(self, panel: Panel) -> str:
+        return os.path.join(self.directory, f'{panel.name}-{panel.key}.png')
+
+    def _setup(self):
+        if self.setup is not None:
+            self.setup()
+            self.setup = None
+
+    def _load_index(self) -> Dict:
+        try:
+            with open(self.index_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _render(self, panel: Panel, path: str):
+        self._setup()
+        from matplotlib.figure import Figure
+        width, height = panel.axes_size()
+        fig_width, fig_height = width + 2 * MARGIN, height + 2 * MARGIN
+        fig = Figure(figsize=(fig_width, fig_height))
+        ax = fig.add_axes([MARGIN / fig_width, MARGIN / fig_height, width / fig_width, height / fig_height])
+        panel.plot(ax, *panel.args)
+        tmp_path = path + '.tmp'
+        fig.savefig(tmp_path, format='png', dpi=self.profile['dpi'], bbox_inches='tight', facecolor='white')
+        os.replace(tmp_path, path)
+        # Only the current raster of each panel is kept
+        for name in os.listdir(self.directory):
+            if name.startswith(panel.name + '-') and name.endswith('.png') and \
+                    os.path.join(self.directory, name) != path:
+                os.remove(os.path.join(self.directory, name))
+
+    def dashboard(self, rows: List[List[Panel]], output_path: str) -> Dict:
+        """Build output_path from cached or freshly drawn panels.
+
+        Returns {'rendered': [names], 'reused': [names], 'composited': bool}.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        panels = [panel for row in rows for panel in row]
+        layout = [[panel.name for panel in row] for row in rows]
+        composite_key = payload_hash({'layout': layout, 'panels': [p.key for p in panels], 'pad': PANEL_PAD,
+                                      'profile': self.profile})
+        index = self._load_index()
+        paths = {panel.name: self._panel_path(panel) for panel in panels}
+        vector = self.profile['format'] == 'svg'  # Drawn whole, no panel rasters
+        if index.get('composite') == composite_key and os.path.exists(output_path) and \
+                (vector or all(os.path.exists(path) for path in paths.values())):
+            return {'rendered': [], 'reused': [p.name for p in panels], 'composited': False}
+
+        if vector:
+            self._render_vector(rows, output_path)
+            self._save_index(composite_key, panels)
+            return {'rendered': [p.name for p in panels], 'reused': [], 'composited': True}
+
+        rendered, reused = [], []
+        for panel in panels:
+            if os.path.exists(paths[panel.name]):
+                reused.append(panel.name)
+            else:
+                self._render(panel, paths[panel.name])
+                rendered.append(panel.name)
+
+        self._composite([[paths[panel.name] for panel in row] for row in rows], output_path)
+        self._save_index(composite_key, panels)
+        return {'rendered': rendered, 'reused': reused, 'composited': True}
+
+    def _save_index(self, composite_key: str, panels: List[Panel]):
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'composite': composite_key, 'panels': {p.name: p.key for p in panels}}, f)
+        os.replace(tmp_path, self.index_path)
+
+    def _render_vector(self, rows: List[List[Panel]], output_path: str):
+        """Whole dashboard as one vector figure, laid out on the original 3x3 grid"""
+        self._setup()
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=(18, 12))
+        gs = fig.add_gridspec(len(rows), 3, hspace=CELL_SPACING, wspace=CELL_SPACING)
+        for r, row in enumerate(rows):
+            column = 0
+            for panel in row:
+                ax = fig.add_subplot(gs[r, column:column + panel.columns])
+                panel.plot(ax, *panel.args)
+                column += panel.columns
+        tmp_path = output_path + '.tmp'
+        fig.savefig(tmp_path, format='svg', bbox_inches='tight', facecolor='white')
+        os.replace(tmp_path, output_path)
+
+    def _composite(self, rows: List[List[str]], output_path: str):
+        """Paste panel rasters into one image: rows stacked, panels in a row side by side"""
+        from PIL import Image
+        dpi = self.profile['dpi']
+        pad = int(PANEL_PAD * dpi)
+        images = [[Image.open(path).convert('RGB') for path in row] for row in rows]
+        row_sizes = [(sum(im.width for im in row) + pad * (len(row) - 1), max(im.height for im in row))
+                     for row in images]
+        width = max(w for w, _ in row_sizes) + 2 * pad
+        height = sum(h for _, h in row_sizes) + pad * (len(rows) + 1)
+        canvas = Image.new('RGB', (width, height), 'white')
+        y = pad
+        for row, (row_width, row_height) in zip(images, row_sizes):
+            x = (width - row_width) // 2
+            for im in row:
+                canvas.paste(im, (x, y))
+                x += im.width + pad
+            y += row_height + pad
+        if self.profile.get('colors'):
+            canvas = canvas.quantize(colors=self.profile['colors'], method=Image.Quantize.MEDIANCUT)
+        tmp_path = output_path + '.tmp'
+        canvas.save(tmp_path, format='PNG', dpi=(dpi, dpi), optimize=bool(self.profile.get('colors')),
+                    compress_level=self.profile['compress_level'])
+        os.replace(tmp_path, output_path)
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Tesla Robotaxi Monitor - Payload Store
+Content-addressed store of raw source payloads with one manifest per run
+
+Layout (output/payloads/):
+    objects/ab/abcdef....json.gz      A payload with its volatile fields removed,
+                                      stored once under its content hash
+    manifests/<prefix>/<time>.json    The entity and, for each source, the object
+                                      hash plus that run's volatile field values
+
+Volatile fields (fetch timestamps, see indicator_cache.VOLATILE_KEYS) change on
+every run. They live in the manifest, so the objects only change when the
+data does. load_run() merges them back to give the exact payloads of a past
+run, which `tesla_robotaxi_monitor.py --replay <manifest>` can score again.
+
+    python3 payload_store.py list [prefix]
+    python3 payload_store.py show <manifest> [source]
+    python3 payload_store.py stats
+"""
+
+import gzip
+import json
+import os
+import sys
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from indicator_cache import VOLATILE_KEYS, payload_hash
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PAYLOAD_DIR = os.path.join(SCRIPT_DIR, 'output', 'payloads')
+
+
+def split_volatile(obj, path=()) -> Tuple[object, List]:
+    """(payload without volatile fields, [[path, value], ...] needed to restore them)"""
+    if isinstance(obj, dict):
+        stable, patch = {}, []
+        for key, value in obj.items():
+            if key in VOLATILE_KEYS:
+                patch.append([list(path) + [key], value])
+            else:
+                stable[key], sub = split_volatile(value, path + (key,))
+                patch.extend(sub)
+        return stable, patch
+    if isinstance(obj, (list, tuple)):
+        stable, patch = [], []
+        for i, value in enumerate(obj):
+            item, sub = split_volatile(value, path + (i,))
+            stable.append(item)
+            patch.extend(sub)
+        return stable, patch
+    return obj, []
+
+
+def apply_volatile(stable, patch: List):
+    """Put volatile fields recorded by split_volatile back in place"""
+    for path, value in patch:
+        target = stable
+        for step in path[:-1]:
+            target = target[step]
+        target[path[-1]] = value
+    return stable
+
+
+def _atomic_write(path: str, data: bytes):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class PayloadStore:
+    """Content-addressed gzip objects plus per-run manifests"""
+
+    def __init__(self, root: str = PAYLOAD_DIR):
+        self.root = root
+        self.objects_dir = os.path.join(root, 'objects')
+        self.manifests_dir = os.path.join(root, 'manifests')
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], digest + '.json.gz')
+
+    def put(self, payload) -> Tuple[str, List]:
+        """Store a payload once; returns (content hash, volatile patch for the manifest)"""
+        stable, patch = split_volatile(payload)
+        digest = payload_hash(stable)
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            body = json.dumps(stable, sort_keys=True, default=str, separators=(',', ':'))
+            _atomic_write(path, gzip.compress(body.encode('utf-8'), mtime=0))
+        return digest, patch
+
+    def get(self, digest: str):
+        with gzip.open(self._object_path(digest), 'rt', encoding='utf-8') as f:
+            return json.load(f)
+
+    def save_run(self, prefix: str, entity: Dict, timestamp: datetime, payloads: Dict) -> str:
+        """Store every payload of a run and write its manifest; returns the manifest path"""
+        sources = {}
+        for name, payload in payloads.items():
+            digest, patch = self.put(payload)
+            sources[name] = {'hash': digest, 'volatile': patch}
+        manifest = {'timestamp': timestamp.isoformat(), 'entity': entity, 'sources': sources}
+        path = self.manifest_path(prefix, timestamp)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        _atomic_write(path, json.dumps(manifest, default=str, separators=(',', ':')).encode('utf-8'))
+        return path
+
+    def manifest_path(self, prefix: str, timestamp: datetime) -> str:
+        return os.path.join(self.manifests_dir, prefix, timestamp.strftime('%Y%m%dT%H%M%S%f') + '.json')
+
+    def load_manifest(self, path: str) -> Dict:
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def load_run(self, path: str) -> Dict:
+        """Exact source payloads of the run a manifest describes"""
+        manifest = self.load_manifest(path)
+        return {name: apply_volatile(self.get(entry['hash']), entry['volatile'])
+                for name, entry in manifest['sources'].items()}
+
+    def manifests(self, prefix: str = None) -> List[str]:
+        """Manifest paths, oldest first (file names sort by time)"""
+        if not os.path.isdir(self.manifests_dir):
+            return []
+        prefixes = [prefix] if prefix else sorted(os.listdir(self.manifests_dir))
+        paths = []
+        for p in prefixes:
+            directory = os.path.join(self.manifests_dir, p)
+            if os.path.isdir(directory):
+                paths.extend(os.path.join(directory, f) for f in sorted(os.listdir(directory)))
+        return paths
+
+    def stats(self) -> Dict:
+        objects = object_bytes = 0
+        for dirpath, _, files in os.walk(self.objects_dir):
+            for f in files:
+                objects += 1
+                object_bytes += os.path.getsize(os.path.join(dirpath, f))
+        manifests = self.manifests()
+        return {
+            'objects': objects,
+            'object_bytes': object_bytes,
+            'manifests': len(manifests),
+            'manifest_bytes': sum(os.path.getsize(p) for p in manifests)
+        }
+
+
+if __name__ == "__main__":
+    store = PayloadStore()
+    command = sys.argv[1] if len(sys.argv) > 1 else 'stats'
+    if command == 'list':
+        for path in store.manifests(sys.argv[2] if len(sys.argv) > 2 else None):
+            manifest = store.load_manifest(path)
+            print(f"{manifest['timestamp']}  {manifest['entity']['name']:<20} "
+                  f"{len(manifest['sources'])} sources  {os.path.relpath(path, store.root)}")
+    elif command == 'show' and len(sys.argv) > 2:
+        payloads = store.load_run(sys.argv[2])
+        if len(sys.argv) > 3:
+            print(json.dumps(payloads[sys.argv[3]], indent=2, default=str))
+        else:
+            for name, payload in payloads.items():
+                print(f"{name:<22} {len(json.dumps(payload, default=str)):>10,} bytes")
+    elif command == 'stats':
+        s = store.stats()
+        print(f"📦 {s['objects']} unique payloads ({s['object_bytes']:,} bytes compressed), "
+              f"{s['manifests']} run manifests ({s['manifest_bytes']:,} bytes)")
+    else:
+        print(__doc__)
@@ -5,12 +5,88 @@ Fetches real-time data from multiple sources based on sources.txt framework
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+import threading
+import time
 import json
 import os
 from typing import Dict, List, Optional
 
-def fetch_tesla_news(api_key=None):
+# Default monitored entity - other AV programs can be listed in config.ENTITIES
+DEFAULT_ENTITY = {
+    'name': 'Tesla',
+    'ticker': 'TSLA',
+    'cik': '0001318605',
+    'keywords': ['robotaxi', 'FSD', 'autonomous'],
+    'nhtsa_make': 'TESLA'
+}
+
+# Running totals of HTTP traffic, used for per-indicator cost accounting
+NETWORK_STATS = {'calls': 0, 'bytes': 0}
+_stats_lock = threading.Lock()
+# Traffic of the prefetch running on this thread (see SourcePool.prefetch)
+_fetch_stats = threading.local()
+
+# One connection pool shared by every fetch (and every entity) in a run
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+
+class RateLimiter:
+    """Thread-safe token bucket: `rate` requests per second with bursts up to `burst`"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            wait = 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+            self.tokens -= 1
+        if wait:
+            time.sleep(wait)
+
+
+# Per-host limits (requests/second, burst) based on each provider's published fair-use policy
+RATE_LIMITERS = {
+    'data.sec.gov': RateLimiter(10, 10),
+    'finnhub.io': RateLimiter(1, 30),
+    'newsapi.org': RateLimiter(5, 5),
+}
+
+
+def _http_get(url, **kwargs):
+    """Rate-limited GET on the shared session that records call attempts and response size"""
+    limiter = RATE_LIMITERS.get(urlparse(url).hostname)
+    if limiter:
+        limiter.acquire()
+    with _stats_lock:
+        NETWORK_STATS['calls'] += 1
+    fetch_cost = getattr(_fetch_stats, 'cost', None)
+    if fetch_cost is not None:
+        fetch_cost['network_calls'] += 1
+    response = SESSION.get(url, **kwargs)
+    with _stats_lock:
+        NETWORK_STATS['bytes'] += len(response.content or b'')
+    if fetch_cost is not None:
+        fetch_cost['network_bytes'] += len(response.content or b'')
+    return response
+
+
+def _news_query(company, keywords):
+    return f"{company} AND ({' OR '.join(keywords)})"
+
+
+def fetch_tesla_news(api_key=None, company='Tesla', keywords=('robotaxi', 'FSD', 'autonomous')):
     """Fetch Tesla news from News API (Source: sources.txt #6 - News Sentiment)"""
     if not api_key:
         return {'error': 'No API key'}
@@ -18,13 +94,13 @@ def fetch_tesla_news(api_key=None):
     try:
         url = 'https://newsapi.org/v2/everything'
         params = {
-            'q': 'Tesla AND (robotaxi OR FSD OR autonomous)',
+            'q': _news_query(company, keywords),
             'from': (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d'),
             'sortBy': 'relevancy',
             'apiKey': api_key
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = _http_get(url, params=params, timeout=10)
         data = response.json()
         
         if response.status_code == 200:
@@ -64,7 +140,7 @@ def fetch_tesla_news(api_key=None):
         return {'error': str(e)}
 
 
-def fetch_sec_insider_trading(ticker='TSLA'):
+def fetch_sec_insider_trading(ticker='TSLA', cik='0001318605'):
     """
     Fetch insider trading data from SEC
     Source: sources.txt #8 - Financial Market Signals
@@ -72,7 +148,7 @@ def fetch_sec_insider_trading(ticker='TSLA'):
     """
     try:
         # SEC Edgar API endpoint for company filings
-        url = f'https://data.sec.gov/submissions/CIK0001318605.json'
+        url = f'https://data.sec.gov/submissions/CIK{cik}.json'
         
         headers = {
             'User-Agent': 'Tesla Monitor Research Tool contact@example.com',
@@ -80,7 +156,7 @@ def fetch_sec_insider_trading(ticker='TSLA'):
             'Host': 'data.sec.gov'
         }
         
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _http_get(url, headers=headers, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
@@ -252,7 +328,7 @@ def fetch_cpuc_deployment_data():
         return {'error': str(e)}
 
 
-def fetch_nhtsa_investigations():
+def fetch_nhtsa_investigations(make='TESLA'):
     """
     Check NHTSA for Tesla investigations
     Source: sources.txt #1 - Regulatory & Safety Data (Most Critical)
@@ -265,10 +341,10 @@ def fetch_nhtsa_investigations():
         url = 'https://api-odi.nhtsa.gov/products/vehicle'
         params = {
             'modelYear': '2024',
-            'make': 'TESLA'
+            'make': make
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = _http_get(url, params=params, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
@@ -416,15 +492,15 @@ def fetch_price_target_tracking(api_key, ticker='TSLA'):
         
         # Get price target consensus
         target_url = f'{base_url}/stock/price-target?symbol={ticker}&token={api_key}'
-        target_response = requests.get(target_url, timeout=10)
+        target_response = _http_get(target_url, timeout=10)
         
         # Get recommendation trends (last 3 months)
         rec_url = f'{base_url}/stock/recommendation?symbol={ticker}&token={api_key}'
-        rec_response = requests.get(rec_url, timeout=10)
+        rec_response = _http_get(rec_url, timeout=10)
         
         # Get current price for comparison
         quote_url = f'{base_url}/quote?symbol={ticker}&token={api_key}'
-        quote_response = requests.get(quote_url, timeout=10)
+        quote_response = _http_get(quote_url, timeout=10)
         
         if target_response.status_code == 200:
             target_data = target_response.json()
@@ -504,29 +580,29 @@ def fetch_finnhub_data(api_key, ticker='TSLA'):
         
         # 1. Get quote (price, change, etc.)
         quote_url = f'{base_url}/quote?symbol={ticker}&token={api_key}'
-        quote_response = requests.get(quote_url, timeout=10)
+        quote_response = _http_get(quote_url, timeout=10)
         
         if quote_response.status_code == 200:
             quote_data = quote_response.json()
             
             # 2. Get company profile
             profile_url = f'{base_url}/stock/profile2?symbol={ticker}&token={api_key}'
-            profile_response = requests.get(profile_url, timeout=10)
+            profile_response = _http_get(profile_url, timeout=10)
             profile_data = profile_response.json() if profile_response.status_code == 200 else {}
             
             # 3. Get recommendation trends (analyst ratings)
             rec_url = f'{base_url}/stock/recommendation?symbol={ticker}&token={api_key}'
-            rec_response = requests.get(rec_url, timeout=10)
+            rec_response = _http_get(rec_url, timeout=10)
             rec_data = rec_response.json() if rec_response.status_code == 200 else []
             
             # 4. Get basic financials (including shares outstanding for calculations)
             metrics_url = f'{base_url}/stock/metric?symbol={ticker}&metric=all&token={api_key}'
-            metrics_response = requests.get(metrics_url, timeout=10)
+            metrics_response = _http_get(metrics_url, timeout=10)
             metrics_data = metrics_response.json() if metrics_response.status_code == 200 else {}
             
             # 5. Get earnings calendar (for next earnings date)
             earnings_url = f'{base_url}/calendar/earnings?symbol={ticker}&from=2024-01-01&to=2025-12-31&token={api_key}'
-            earnings_response = requests.get(earnings_url, timeout=10)
+            earnings_response = _http_get(earnings_url, timeout=10)
             earnings_data = earnings_response.json() if earnings_response.status_code == 200 else {}
             
             # Parse latest recommendation
@@ -581,7 +657,7 @@ def fetch_finnhub_data(api_key, ticker='TSLA'):
         return {'error': f"Finnhub API error: {str(e)}"}
 
 
-def fetch_executive_departures(api_key):
+def fetch_executive_departures(api_key, company='Tesla'):
     """
     Track executive departures via News API
     Source: sources.txt - Red flag scorecard (3 points per departure)
@@ -589,13 +665,13 @@ def fetch_executive_departures(api_key):
     try:
         url = 'https://newsapi.org/v2/everything'
         params = {
-            'q': 'Tesla AND (executive OR VP OR director OR "leaves Tesla" OR departure OR resigned)',
+            'q': f'{company} AND (executive OR VP OR director OR "leaves {company}" OR departure OR resigned)',
             'from': (datetime.now() - timedelta(days=90)).strftime('%Y-%m-%d'),
             'sortBy': 'relevancy',
             'apiKey': api_key
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = _http_get(url, params=params, timeout=10)
         data = response.json()
         
         if response.status_code == 200:
@@ -630,7 +706,7 @@ def fetch_executive_departures(api_key):
         return {'error': str(e)}
 
 
-def fetch_earnings_timeline_data(api_key):
+def fetch_earnings_timeline_data(api_key, company='Tesla'):
     """
     Track Tesla earnings calls for timeline mentions
     Source: sources.txt - Monitor robotaxi timeline promises
@@ -638,13 +714,13 @@ def fetch_earnings_timeline_data(api_key):
     try:
         url = 'https://newsapi.org/v2/everything'
         params = {
-            'q': 'Tesla AND (earnings OR "earnings call") AND (robotaxi OR FSD OR "full self-driving" OR timeline)',
+            'q': f'{company} AND (earnings OR "earnings call") AND (robotaxi OR FSD OR "full self-driving" OR timeline)',
             'from': (datetime.now() - timedelta(days=120)).strftime('%Y-%m-%d'),
             'sortBy': 'relevancy',
             'apiKey': api_key
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = _http_get(url, params=params, timeout=10)
         data = response.json()
         
         if response.status_code == 200:
@@ -679,6 +755,125 @@ def fetch_earnings_timeline_data(api_key):
         return {'error': str(e)}
 
 
+# Source name -> (fetch function, config key it requires or None, {kwarg: entity field})
+# Names match the keys returned by fetch_all_data_sources(). Sources with no
+# entity fields are the same for every entity and are fetched once per run.
+SOURCE_FETCHERS = {
+    'news': (fetch_tesla_news, 'news_api_key', {'company': 'name', 'keywords': 'keywords'}),
+    'insider_trading': (fetch_sec_insider_trading, None, {'ticker': 'ticker', 'cik': 'cik'}),
+    'nhtsa': (fetch_nhtsa_investigations, None, {'make': 'nhtsa_make'}),
+    'competitors': (fetch_competitor_progress, None, {}),
+    'finnhub': (fetch_finnhub_data, 'finnhub_api_key', {'ticker': 'ticker'}),
+    'executive_departures': (fetch_executive_departures, 'news_api_key', {'company': 'name'}),
+    'earnings_timeline': (fetch_earnings_timeline_data, 'news_api_key', {'company': 'name'}),
+    'dmv_data': (fetch_ca_dmv_disengagement_data, None, {}),
+    'price_targets': (fetch_price_target_tracking, 'finnhub_api_key', {'ticker': 'ticker'}),
+    'nhtsa_crashes': (fetch_nhtsa_crash_data, None, {}),
+    'cpuc_deployment': (fetch_cpuc_deployment_data, None, {}),
+}
+
+
+def _source_kwargs(name, entity):
+    """Keyword arguments a source needs for this entity"""
+    _, _, params = SOURCE_FETCHERS[name]
+    return {kwarg: entity[field] for kwarg, field in params.items() if entity.get(field) is not None}
+
+
+def fetch_source(name, config, entity=None):
+    """Fetch a single named source, returning an error dict if it is unavailable"""
+    fetch, key_name, params = SOURCE_FETCHERS[name]
+    entity = entity or DEFAULT_ENTITY
+    kwargs = _source_kwargs(name, entity)
+    if len(kwargs) < len(params):
+        missing = sorted(set(params.values()) - set(k for k, v in entity.items() if v is not None))
+        return {'error': f"{entity['name']} has no {', '.join(missing)} configured"}
+    try:
+        if key_name:
+            if not config.get(key_name):
+                return {'error': f'No {key_name} configured'}
+            return fetch(config[key_name], **kwargs)
+        return fetch(**kwargs)
+    except Exception as e:
+        return {'error': str(e)}
+
+
+class SourcePool:
+    """Per-run memo of source payloads shared by every monitored entity.
+
+    Entity-independent sources are fetched once no matter how many entities
+    are scored; prefetch() runs the remaining fetches concurrently over the
+    shared session and rate limiters. The time, calls and bytes of each
+    prefetched source are kept so they can be charged to the indicators that
+    requested it (prefetched_cost).
+    """
+
+    def __init__(self, config, max_workers=8):
+        self.config = config
+        self.max_workers = max_workers
+        self.payloads = {}
+        self.fetch_costs = {}
+        self.claims = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def _key(self, name, entity):
+        kwargs = _source_kwargs(name, entity or DEFAULT_ENTITY)
+        return (name, json.dumps(kwargs, sort_keys=True, default=str))
+
+    def get(self, name, entity=None):
+        """Fetch a source once; concurrent callers for the same key wait for the first"""
+        key = self._key(name, entity)
+        with self._lock:
+            if key in self.payloads:
+                return self.payloads[key]
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in self.payloads:
+                self.payloads[key] = fetch_source(name, self.config, entity)
+        return self.payloads[key]
+
+    def seed(self, name, entity, payload):
+        """Use a known payload (e.g. replayed from the payload store) instead of fetching"""
+        self.payloads[self._key(name, entity)] = payload
+
+    def _prefetch_one(self, key, name, entity):
+        cost = {'seconds': 0.0, 'network_calls': 0, 'network_bytes': 0}
+        _fetch_stats.cost = cost
+        started = time.perf_counter()
+        try:
+            self.get(name, entity)
+        finally:
+            _fetch_stats.cost = None
+            cost['seconds'] = time.perf_counter() - started
+            self.fetch_costs[key] = cost
+
+    def prefetch(self, requests_needed):
+        """Fetch (source name, entity) pairs in parallel, skipping ones already shared.
+
+        Every pair counts as one claim on its source (one per indicator that
+        declares it), so a shared fetch's cost is split between its claimants.
+        """
+        unique = {}
+        for name, entity in requests_needed:
+            key = self._key(name, entity)
+            unique.setdefault(key, (name, entity))
+            self.claims[key] = self.claims.get(key, 0) + 1
+        pending = [(key,) + pair for key, pair in unique.items() if key not in self.payloads]
+        if not pending:
+            return
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(lambda args: self._prefetch_one(*args), pending))
+
+    def prefetched_cost(self, name, entity=None) -> Optional[Dict]:
+        """One claimant's share of a prefetched source's cost, or None if it was not prefetched"""
+        key = self._key(name, entity)
+        cost = self.fetch_costs.get(key)
+        if cost is None:
+            return None
+        share = max(self.claims.get(key, 1), 1)
+        return {k: v / share for k, v in cost.items()}
+
+
 def fetch_all_data_sources(config):
     """
     Fetch data from all available sources
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tesla Robotaxi Monitor - Results Export
+Machine-readable results and history for downstream tooling
+
+Each run writes, next to the human-readable report:
+
+    <prefix>_results.json   Overall scores plus every indicator's score,
+                            weight, weighted score and sources, the
+                            indicators that do not apply to the entity, and
+                            the freshness of every source payload the run used
+    <prefix>_history.csv    One row per recorded run: time, overall and
+                            each indicator's score (empty = not scored)
+    <prefix>_history.npz    The same columns as NumPy arrays ('time' is
+                            datetime64[us], scores are float32 with NaN gaps)
+
+Scores are the floats the monitor computed, not figures parsed back out of
+the report, so tools reading these files do not depend on its wording.
+"""
+
+import csv
+import io
+import json
+import os
+from datetime import datetime
+from typing import Dict
+
+import numpy as np
+
+from indicator_cache import VOLATILE_KEYS, payload_hash
+
+RESULTS_VERSION = 1
+
+
+def _freshness(payload, now: datetime) -> Dict:
+    """Status, age and content hash of one source payload"""
+    entry = {'hash': payload_hash(payload)[:16]}
+    if isinstance(payload, dict) and payload.get('error'):
+        entry['status'] = 'error'
+        entry['error'] = str(payload['error'])
+    else:
+        entry['status'] = 'ok'
+    if isinstance(payload, dict):
+        stamps = [payload[key] for key in sorted(VOLATILE_KEYS) if isinstance(payload.get(key), str)]
+        for stamp in stamps:
+            try:
+                updated = datetime.fromisoformat(stamp)
+            except ValueError:
+                continue
+            entry['last_updated'] = updated.isoformat()
+            entry['age_seconds'] = round((now - updated).total_seconds(), 1)
+            break
+        if payload.get('source'):
+            entry['source'] = payload['source']
+    return entry
+
+
+def results_document(entity: Dict, results: Dict, plugins, source_payloads: Dict) -> Dict:
+    """Everything a run scored, as plain JSON types"""
+    overall = results['overall']
+    generated = overall.get('timestamp') or datetime.now()
+    indicators = {}
+    for plugin in plugins:
+        result = results.get(plugin.name)
+        if result is None:
+            continue
+        indicators[plugin.name] = {
+            'title': plugin.title,
+            'score': float(result['score']),
+            'weight': float(result['weight']),
+            'weighted_score': float(result['weighted_score']),
+            'changed': bool(result.get('changed', True)),
+            'sources': list(plugin.sources),
+        }
+    return {
+        'version': RESULTS_VERSION,
+        'entity': {key: entity.get(key) for key in ('name', 'ticker', 'output_prefix')},
+        'timestamp': generated.isoformat(),
+        'overall': {
+            'success_score': float(overall['success_score']),
+            'failure_risk': float(overall['failure_risk']),
+            'changed_indicators': list(overall.get('changed_indicators', [])),
+        },
+        'not_applicable': list(overall.get('not_applicable', [])),
+        'indicators': indicators,
+        'sources': {name: _freshness(payload, generated) for name, payload in sorted(source_payloads.items())},
+    }
+
+
+def _atomic_write(path: str, data: bytes):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def write_results(path: str, document: Dict):
+    _atomic_write(path, json.dumps(document, indent=2).encode('utf-8'))
+
+
+def load_results(path: str) -> Dict:
+    """A results file, checked for a version this code understands"""
+    with open(path, 'r') as f:
+        document = json.load(f)
+    if document.get('version') != RESULTS_VERSION:
+        raise ValueError(f"Unsupported results version {document.get('version')!r} in {path}")
+    return document
+
+
+def write_history(csv_path: str, npz_path: str, times, columns: Dict[str, np.ndarray]):
+    """History as CSV (overall first, then indicators by name) and as an .npz of the same columns"""
+    names = ['overall'] + sorted(name for name in columns if name != 'overall')
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator='\n')
+    writer.writerow(['time'] + names)
+    stamps = np.datetime_as_string(np.asarray(times, dtype='datetime64[s]'))
+    for i, stamp in enumerate(stamps):
+        writer.writerow([stamp] + ['' if np.isnan(columns[name][i]) else f'{columns[name][i]:.6g}'
+                                   for name in names])
+    _atomic_write(csv_path, out.getvalue().encode('utf-8'))
+
+    arrays = {name: np.asarray(columns[name], dtype=np.float32) for name in names}
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, time=np.asarray(times, dtype='datetime64[us]'), **arrays)
+    _atomic_write(npz_path, buffer.getvalue())
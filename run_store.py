@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Tesla Robotaxi Monitor - Run Store
+SQLite time series of every run: overall scores, per-indicator scores and
+weights, and references to the raw source payloads they were computed from
+
+Tables:
+    runs              One row per entity per run, with its payload manifest
+                      (path under output/payloads/manifests/)
+    indicator_scores  Score, weight and detail fields of each indicator in a run
+    source_payloads   Each source an entity used in a run: the full payload's
+                      hash and the payload_store object holding its body
+
+Payload bodies live only in the content-addressed payload store, so the
+database grows by a few rows per run however large the payloads are.
+source_history() rebuilds them from the object and the run's manifest.
+
+Query from the command line:
+    python3 run_store.py runs [--entity Tesla] [--since 2025-01-01] [--until ...]
+    python3 run_store.py indicator safety_incidents [--entity Tesla] [--since ...]
+    python3 run_store.py source nhtsa [--entity Tesla] [--since ...]
+"""
+
+import json
+import os
+import sqlite3
+from datetime import date, datetime, timedelta
+from typing import Dict, List
+
+from payload_store import PayloadStore, apply_volatile
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+RUNS_DB = os.path.join(SCRIPT_DIR, 'output', 'robotaxi_runs.db')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    entity TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    success_score REAL NOT NULL,
+    failure_risk REAL NOT NULL,
+    manifest TEXT
+);
+CREATE TABLE IF NOT EXISTS indicator_scores (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    indicator TEXT NOT NULL,
+    score REAL NOT NULL,
+    weight REAL NOT NULL,
+    weighted_score REAL NOT NULL,
+    input_hash TEXT,
+    changed INTEGER NOT NULL DEFAULT 1,
+    details TEXT,
+    PRIMARY KEY (run_id, indicator)
+);
+CREATE TABLE IF NOT EXISTS source_payloads (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    source TEXT NOT NULL,
+    payload_hash TEXT,
+    object_hash TEXT,
+    PRIMARY KEY (run_id, source)
+);
+CREATE INDEX IF NOT EXISTS idx_runs_entity_time ON runs(entity, timestamp);
+CREATE INDEX IF NOT EXISTS idx_runs_time ON runs(timestamp);
+CREATE INDEX IF NOT EXISTS idx_indicator_scores_indicator ON indicator_scores(indicator, run_id);
+CREATE INDEX IF NOT EXISTS idx_source_payloads_source ON source_payloads(source, run_id);
+"""
+
+
+def _date_only(value):
+    """The day of a date-only bound (a date or 'YYYY-MM-DD'), None for a date and time"""
+    if isinstance(value, datetime):
+        return None
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(value) if len(value) == 10 else None
+    except ValueError:
+        return None
+
+
+def _time_filter(entity: str = None, since=None, until=None):
+    """WHERE clause fragments for the common entity / time range filters on runs"""
+    clauses, params = [], []
+    if entity:
+        clauses.append('r.entity = ?')
+        params.append(entity)
+    if since:
+        clauses.append('r.timestamp >= ?')
+        params.append(since.isoformat() if isinstance(since, date) else since)
+    if until:
+        day = _date_only(until)
+        if day:  # Inclusive of the whole day, not just its midnight
+            clauses.append('r.timestamp < ?')
+            params.append((day + timedelta(days=1)).isoformat())
+        else:
+            clauses.append('r.timestamp <= ?')
+            params.append(until.isoformat() if isinstance(until, datetime) else until)
+    return (' AND ' + ' AND '.join(clauses)) if clauses else '', params
+
+
+class RunStore:
+    """Indexed SQLite store of runs, indicator scores and source payloads"""
+
+    def __init__(self, path: str = RUNS_DB, payloads: PayloadStore = None):
+        self.path = path
+        self.payloads = payloads or PayloadStore()
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        self.conn.execute('PRAGMA journal_mode = WAL')
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def record_run(self, entity: str, results: Dict, manifest: str = None,
+                   payload_hashes: Dict = None) -> int:
+        """Store one scored run (the dict from calculate_failure_risk_score) in a single transaction.
+
+        manifest is the run's payload_store manifest (PayloadStore.save_run); payload
+        bodies are referenced through it, never copied into the database.
+        """
+        overall = results['overall']
+        timestamp = overall['timestamp']
+        if isinstance(timestamp, datetime):
+            timestamp = timestamp.isoformat()
+        sources = self.payloads.load_manifest(manifest)['sources'] if manifest else {}
+        with self.conn:
+            cur = self.conn.execute(
+                'INSERT INTO runs (entity, timestamp, success_score, failure_risk, manifest) VALUES (?, ?, ?, ?, ?)',
+                (entity, timestamp, overall['success_score'], overall['failure_risk'],
+                 os.path.relpath(manifest, self.payloads.manifests_dir) if manifest else None))
+            run_id = cur.lastrowid
+            self.conn.executemany(
+                'INSERT INTO indicator_scores (run_id, indicator, score, weight, weighted_score, '
+                'input_hash, changed, details) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                [(run_id, name, r['score'], r['weight'], r['weighted_score'], r.get('input_hash'),
+                  int(r.get('changed', True)),
+                  json.dumps(r['details'].to_dict() if hasattr(r['details'], 'to_dict') else str(r['details']),
+                             default=str))
+                 for name, r in results.items() if name != 'overall'])
+            self.conn.executemany(
+                'INSERT INTO source_payloads (run_id, source, payload_hash, object_hash) VALUES (?, ?, ?, ?)',
+                [(run_id, source, (payload_hashes or {}).get(source), entry['hash'])
+                 for source, entry in sources.items()])
+        return run_id
+
+    def delete_runs(self, run_ids: List[int]):
+        """Delete runs (their indicator and payload rows cascade) and give the space back to the disk"""
+        with self.conn:
+            self.conn.executemany('DELETE FROM runs WHERE id = ?', [(run_id,) for run_id in run_ids])
+        self.conn.execute('VACUUM')
+
+    def runs(self, entity: str = None, since=None, until=None) -> List[Dict]:
+        """Overall scores, oldest first"""
+        where, params = _time_filter(entity, since, until)
+        rows = self.conn.execute(
+            f'SELECT r.* FROM runs r WHERE 1=1{where} ORDER BY r.timestamp', params)
+        return [dict(row) for row in rows]
+
+    def indicator_series(self, indicator: str, entity: str = None, since=None, until=None) -> List[Dict]:
+        """One indicator's score, weight and details over time, oldest first"""
+        where, params = _time_filter(entity, since, until)
+        rows = self.conn.execute(
+            'SELECT r.entity, r.timestamp, s.score, s.weight, s.weighted_score, s.changed, s.details '
+            'FROM indicator_scores s JOIN runs r ON r.id = s.run_id '
+            f'WHERE s.indicator = ?{where} ORDER BY r.timestamp', [indicator] + params)
+        return [dict(row, details=json.loads(row['details'])) for row in rows]
+
+    def run_indicators(self, run_id: int) -> Dict[str, Dict]:
+        """All indicator rows of one run, keyed by indicator name"""
+        rows = self.conn.execute(
+            'SELECT indicator, score, weight, weighted_score, input_hash, changed, details '
+            'FROM indicator_scores WHERE run_id = ?', (run_id,))
+        return {row['indicator']: dict(row, details=json.loads(row['details'])) for row in rows}
+
+    def load_payload(self, manifest: str, source: str, object_hash: str):
+        """A source payload as the run saw it (object plus the manifest's volatile fields); None if pruned"""
+        try:
+            entry = self.payloads.load_manifest(os.path.join(self.payloads.manifests_dir, manifest))['sources'][source]
+            return apply_volatile(self.payloads.get(object_hash or entry['hash']), entry['volatile'])
+        except (OSError, KeyError, TypeError, ValueError):
+            return None
+
+    def source_history(self, source: str, entity: str = None, since=None, until=None) -> List[Dict]:
+        """Raw payloads of one source over time, oldest first (payload None once pruned from the payload store)"""
+        where, params = _time_filter(entity, since, until)
+        rows = self.conn.execute(
+            'SELECT r.entity, r.timestamp, r.manifest, p.payload_hash, p.object_hash '
+            'FROM source_payloads p JOIN runs r ON r.id = p.run_id '
+            f'WHERE p.source = ?{where} ORDER BY r.timestamp', [source] + params)
+        return [dict(row, payload=self.load_payload(row['manifest'], source, row['object_hash'])) for row in rows]
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Query the robotaxi run store')
+    parser.add_argument('table', choices=['runs', 'indicator', 'source'])
+    parser.add_argument('name', nargs='?', help='Indicator or source name')
+    parser.add_argument('--entity')
+    parser.add_argument('--since', help='ISO date/time (inclusive)')
+    parser.add_argument('--until', help='ISO date/time (inclusive; a date includes the whole day)')
+    parser.add_argument('--db', default=RUNS_DB)
+    args = parser.parse_args()
+
+    if args.table != 'runs' and not args.name:
+        parser.error(f"'{args.table}' needs an indicator or source name")
+    if not os.path.exists(args.db):
+        print(f"ℹ️  No run store at {args.db} yet - run tesla_robotaxi_monitor.py first")
+        return
+
+    with RunStore(args.db) as store:
+        if args.table == 'runs':
+            for row in store.runs(args.entity, args.since, args.until):
+                print(f"{row['timestamp']}  {row['entity']:<20} Success: {row['success_score']:5.1f}%  "
+                      f"Failure Risk: {row['failure_risk']:5.1f}%")
+        elif args.table == 'indicator':
+            for row in store.indicator_series(args.name, args.entity, args.since, args.until):
+                print(f"{row['timestamp']}  {row['entity']:<20} {row['score']:6.1f} x {row['weight']:.2f}"
+                      f"{'' if row['changed'] else '  (cached)'}")
+        else:
+            for row in store.source_history(args.name, args.entity, args.since, args.until):
+                size = 'pruned' if row['payload'] is None else f"{len(json.dumps(row['payload'])):,} bytes"
+                print(f"{row['timestamp']}  {row['entity']:<20} {row['payload_hash'] or ''}  {size}")
+
+
+if __name__ == "__main__":
+    main()
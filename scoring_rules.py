@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Tesla Robotaxi Monitor - Scoring Rules
+Declarative threshold rules compiled into a vectorized NumPy evaluator
+
+Each indicator has a list of rule chains. A chain behaves like an if/elif
+ladder: the first matching rule adjusts the score and the rest are skipped.
+Chains are applied in order. A matching rule sets
+
+    score = clamp(score + delta, floor, ceiling)
+
+Rules whose input is missing (None/NaN) never match. Override any
+indicator's chains with SCORING_RULES in config.py - no code change needed.
+"""
+
+import copy
+import json
+import operator
+from typing import Dict, List
+
+import numpy as np
+
+DEFAULT_RULES = {
+    'safety_incidents': [
+        # NHTSA SGO crash counts (12 months)
+        [
+            {'input': 'fatalities', 'op': '>', 'value': 3, 'delta': -20, 'floor': 30},
+            {'input': 'crashes', 'op': '>', 'value': 500, 'delta': -15, 'floor': 40},
+            {'input': 'crashes', 'op': '>', 'value': 100, 'delta': -10, 'floor': 50},
+        ],
+        # News safety mentions (less weight since we have NHTSA)
+        [
+            {'input': 'safety_mentions', 'op': '>', 'value': 15, 'delta': -10, 'floor': 30},
+            {'input': 'safety_mentions', 'op': '>', 'value': 10, 'delta': -5, 'floor': 50},
+        ],
+    ],
+    'timeline_slippage': [
+        [{'input': 'credibility_concern', 'op': '==', 'value': True, 'delta': -10, 'floor': 0}],
+        [{'input': 'delay_mentions', 'op': '>', 'value': 3, 'delta': -5, 'floor': 0}],
+    ],
+    'insider_selling': [
+        [
+            {'input': 'activity', 'op': '==', 'value': 'HIGH', 'delta': -15, 'floor': 25},
+            {'input': 'activity', 'op': '==', 'value': 'MODERATE', 'delta': -5, 'floor': 35},
+        ],
+    ],
+    'market_confidence': [
+        # Price target upside: trading >10% above target / >20% below target
+        [
+            {'input': 'upside', 'op': '<', 'value': -10, 'delta': -15, 'floor': 30},
+            {'input': 'upside', 'op': '>', 'value': 20, 'delta': 10, 'ceiling': 80},
+        ],
+    ],
+}
+
+OPERATORS = {
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+
+def _as_array(values, categorical: bool, size: int) -> np.ndarray:
+    """Broadcast an input to an array; numeric None becomes NaN so it never matches"""
+    if categorical:
+        arr = np.empty(size, dtype=object)
+        arr[:] = values
+        return arr
+    if np.isscalar(values) or values is None:
+        values = [values] * size
+    return np.array([np.nan if v is None else v for v in values], dtype=float)
+
+
+class RuleSet:
+    """Rule table compiled into per-indicator lists of (conditions, adjustments)"""
+
+    def __init__(self, table: Dict):
+        self.table = table
+        self.compiled = {name: [self._compile_chain(chain) for chain in chains]
+                         for name, chains in table.items()}
+
+    @staticmethod
+    def _compile_chain(chain: List[Dict]):
+        compiled = []
+        for rule in chain:
+            if rule['op'] not in OPERATORS:
+                raise ValueError(f"Unknown rule operator {rule['op']!r} in {rule}")
+            compiled.append((
+                rule['input'],
+                OPERATORS[rule['op']],
+                rule['value'],
+                isinstance(rule['value'], str),
+                float(rule.get('delta', 0)),
+                -np.inf if rule.get('floor') is None else float(rule['floor']),
+                np.inf if rule.get('ceiling') is None else float(rule['ceiling']),
+            ))
+        return compiled
+
+    def evaluate(self, indicator: str, scores, inputs: Dict) -> np.ndarray:
+        """Apply an indicator's rules to arrays of base scores and inputs at once"""
+        scores = np.array(scores, dtype=float, ndmin=1)
+        for chain in self.compiled.get(indicator, []):
+            conditions, choices = [], []
+            for name, op, value, categorical, delta, floor, ceiling in chain:
+                if name not in inputs:
+                    continue
+                x = _as_array(inputs[name], categorical, scores.size)
+                conditions.append(np.asarray(op(x, value), dtype=bool))
+                choices.append(np.clip(scores + delta, floor, ceiling))
+            if conditions:
+                scores = np.select(conditions, choices, default=scores)
+        return scores
+
+    def apply(self, indicator: str, score, **inputs):
+        """Scalar convenience wrapper used by the indicator plugins"""
+        result = float(self.evaluate(indicator, [score], inputs)[0])
+        if isinstance(score, int) and result.is_integer():
+            return int(result)
+        return result
+
+    def rules_for(self, indicator: str) -> List:
+        return self.table.get(indicator, [])
+
+
+def load_rules(overrides: Dict = None) -> RuleSet:
+    """Default rule table with per-indicator overrides from config.SCORING_RULES"""
+    table = copy.deepcopy(DEFAULT_RULES)
+    if overrides:
+        table.update(copy.deepcopy(overrides))
+    return RuleSet(table)
+
+
+if __name__ == "__main__":
+    print(json.dumps(DEFAULT_RULES, indent=2))
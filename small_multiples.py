@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tesla Robotaxi Monitor - Small Multiples
+Per-indicator history charts drawn on one reusable, blitted figure
+
+The figure, its grid of axes and everything static on them (risk zones,
+titles, ticks, grid) are drawn once per layout and kept as a background
+raster. Each update restores that background, moves every panel's line
+with set_data(), draws only the lines, latest points and value labels on top, and writes
+the Agg buffer straight to PNG. Nothing is laid out or redrawn twice.
+
+For the background to stay valid the x axes are fixed: they show days
+before the latest run, over a window that only changes when the history
+outgrows it (a week, a month, a quarter, a year, then whole years).
+Figures are cached per layout and window for the life of the process.
+"""
+
+import math
+import os
+from typing import Callable, Dict
+
+import numpy as np
+
+from downsample import lttb
+
+# Panel size (inches), grid width and raster resolution
+PANEL_WIDTH, PANEL_HEIGHT = 4.0, 2.4
+GRID_COLUMNS = 3
+DPI = 100
+# Figure-level title above and axis label below the grid (inches)
+TITLE_SPACE, AXIS_SPACE = 0.45, 0.55
+
+# Most points per panel line - about one per horizontal pixel
+PANEL_POINTS = int(PANEL_WIDTH * DPI)
+
+# x-axis windows (days before the latest run), smallest that fits the history
+WINDOW_DAYS = (7, 30, 90, 365)
+
+LINE_COLOR = '#2E86DE'
+ZONES = ((70, 100, 'green'), (50, 70, 'yellow'), (30, 50, 'orange'), (0, 30, 'red'))
+
+_FIGURES = {}
+
+
+def window_for(span_days: float) -> int:
+    """x-axis window (days) for a history spanning span_days"""
+    for days in WINDOW_DAYS:
+        if span_days <= days:
+            return days
+    return 365 * math.ceil(span_days / 365)
+
+
+class SmallMultiples:
+    """A grid of indicator history panels that is drawn once and updated by blitting"""
+
+    def __init__(self, titles: Dict[str, str], window_days: int, setup: Callable = None):
+        if setup is not None:
+            setup()
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        self.window_days = window_days
+        rows = math.ceil(len(titles) / GRID_COLUMNS)
+        height = rows * PANEL_HEIGHT + TITLE_SPACE + AXIS_SPACE
+        self.figure = Figure(figsize=(GRID_COLUMNS * PANEL_WIDTH, height), dpi=DPI)
+        self.canvas = FigureCanvasAgg(self.figure)
+        # Fixed margins and ticks: no layout engine or tick search on the one full draw
+        axes = self.figure.subplots(rows, GRID_COLUMNS, sharex=True, sharey=True, squeeze=False, gridspec_kw=dict(
+            left=0.04, right=0.99, top=1 - TITLE_SPACE / height, bottom=AXIS_SPACE / height,
+            wspace=0.08, hspace=0.3)).ravel()
+        ticks = np.linspace(-window_days, 0, 6)
+        self.panels = {}
+        for ax, (name, title) in zip(axes, titles.items()):
+            for low, high, color in ZONES:
+                ax.axhspan(low, high, alpha=0.1, color=color, linewidth=0)
+            ax.set_title(title, fontsize=10, fontweight='bold')
+            ax.set_xlim(-window_days, 0)
+            ax.set_ylim(0, 100)
+            ax.set_xticks(ticks, [f'{tick:g}' for tick in ticks.round(1)])
+            ax.set_yticks(range(0, 101, 20))
+            ax.tick_params(labelsize=8)
+            ax.grid(True, alpha=0.3, linestyle=':', linewidth=0.5)
+            line, = ax.plot([], [], color=LINE_COLOR, linewidth=1.2, animated=True)
+            latest, = ax.plot([], [], 'o', color=LINE_COLOR, markersize=4, animated=True)
+            value = ax.text(0.97, 0.92, '', transform=ax.transAxes, ha='right', va='top', fontsize=9,
+                            fontweight='bold', animated=True)
+            self.panels[name] = (ax, line, latest, value)
+        for ax in axes[len(titles):]:
+            ax.set_visible(False)
+        self.figure.supxlabel(f'Days before latest run ({window_days}-day window)', fontsize=9, y=0.01, va='bottom')
+        self.figure.suptitle('Indicator History', fontsize=12, fontweight='bold', y=0.995, va='top')
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+
+    def update(self, times, columns: Dict[str, np.ndarray]):
+        """Redraw every panel's line from (times, {name: scores}) over the static background"""
+        times = np.asarray(times, dtype='datetime64[us]')
+        days = (times - times[-1]).astype('timedelta64[s]').astype(float) / 86400 if len(times) else times
+        self.canvas.restore_region(self.background)
+        for name, (ax, line, latest, value) in self.panels.items():
+            scores = np.asarray(columns.get(name, ()), dtype=float)
+            valid = np.flatnonzero(~np.isnan(scores)) if len(scores) == len(times) else np.array([], dtype=int)
+            x, y = days[valid], scores[valid]
+            if len(y) > PANEL_POINTS:
+                keep = lttb(x, y, PANEL_POINTS)
+                x, y = x[keep], y[keep]
+            line.set_data(x, y)
+            latest.set_data(x[-1:], y[-1:])  # Visible even when an indicator has a single run
+            value.set_text(f'{y[-1]:.1f}' if len(y) else 'no data')
+            for artist in (line, latest, value):
+                ax.draw_artist(artist)
+        self.canvas.blit(self.figure.bbox)
+
+    def save(self, path: str, compress_level: int = 6):
+        """Write the current canvas buffer (no re-render)"""
+        from PIL import Image
+        width, height = self.canvas.get_width_height(physical=True)
+        image = Image.frombuffer('RGBA', (width, height), self.canvas.buffer_rgba(), 'raw', 'RGBA', 0, 1)
+        tmp_path = path + '.tmp'
+        image.convert('RGB').save(tmp_path, format='PNG', dpi=(DPI, DPI), compress_level=compress_level)
+        os.replace(tmp_path, path)
+
+
+def small_multiples(titles: Dict[str, str], window_days: int, setup: Callable = None) -> SmallMultiples:
+    """The cached figure for this layout and window (built on first use)"""
+    key = (tuple(titles.items()), window_days)
+    if key not in _FIGURES:
+        _FIGURES[key] = SmallMultiples(titles, window_days, setup=setup)
+    return _FIGURES[key]
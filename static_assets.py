@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Tesla Robotaxi Monitor - Static Assets
+Minified, precompressed HTML outputs with a content-hash manifest
+
+publish_html() minifies the page and writes it with precompressed siblings
+(.gz always, .br when the optional brotli package is installed) so a static
+host can serve them as they are. Compression is deterministic (no
+timestamps in the gzip header), so an unchanged page produces identical
+bytes - nothing new to commit or archive.
+
+Every published file is recorded in <directory>/assets.json:
+
+    {"tesla_robotaxi_dashboard.html": {
+        "sha256": ..., "size": ...,
+        "encodings": {"gzip": {"file": "...html.gz", "sha256": ..., "size": ...},
+                      "br": {...}}}}
+
+The sha256 is that of the file as written, the same hash archive.py
+catalogs (python3 archive.py query --file-hash <sha256>). When a page's
+hash matches the manifest and its siblings are in place, nothing is
+compressed again.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+from typing import Dict
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MANIFEST_NAME = 'assets.json'
+
+# Encoding -> (file suffix, compress); brotli only when installed
+ENCODINGS = {'gzip': ('.gz', lambda data: gzip.compress(data, compresslevel=9, mtime=0))}
+if brotli is not None:
+    ENCODINGS['br'] = ('.br', lambda data: brotli.compress(data, quality=11))
+ALL_SUFFIXES = ('.gz', '.br')
+
+# Blocks whose whitespace is significant (or handled separately)
+_PROTECTED = re.compile(r'(<(pre|textarea|script|style)\b[^>]*>.*?</\2\s*>)', re.S | re.I)
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACE = re.compile(r'\s*([{};,>])\s*')
+
+
+def _minify_css(css: str) -> str:
+    css = _CSS_COMMENT.sub('', css)
+    css = re.sub(r'\s+', ' ', css)
+    css = _CSS_SPACE.sub(r'\1', css)
+    css = re.sub(r':\s+', ':', css)  # Only after colons - "a :hover" and "a:hover" differ
+    return css.replace(';}', '}').strip()
+
+
+def _minify_script(script: str) -> str:
+    # Line breaks are kept (automatic semicolon insertion); indentation, blank lines
+    # and whole-line comments go
+    lines = (line.strip() for line in script.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+
+def _minify_block(block: str, tag: str) -> str:
+    tag = tag.lower()
+    if tag not in ('style', 'script'):
+        return block
+    open_end = block.index('>') + 1
+    close_start = block.lower().rindex('</')
+    body = block[open_end:close_start]
+    if tag == 'style':
+        body = _minify_css(body)
+    elif 'application/json' not in block[:open_end].lower():
+        body = _minify_script(body)
+    return block[:open_end] + body + block[close_start:]
+
+
+def minify_html(text: str) -> str:
+    """Drop formatting whitespace and CSS/JS indentation; <pre> and <textarea> are left alone"""
+    out = []
+    pos = 0
+    for match in _PROTECTED.finditer(text):
+        out.append(_minify_markup(text[pos:match.start()]))
+        out.append(_minify_block(match.group(1), match.group(2)))
+        pos = match.end()
+    out.append(_minify_markup(text[pos:]))
+    return ''.join(out).strip()
+
+
+def _minify_markup(markup: str) -> str:
+    # Whitespace with a line break between tags is indentation; other runs become one space
+    markup = re.sub(r'>\s*\n\s*<', '><', markup)
+    return re.sub(r'\s+', ' ', markup)
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_manifest(directory: str) -> Dict:
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write(path: str, data: bytes):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _is_current(entry: Dict, directory: str, sha256: str) -> bool:
+    if not entry or entry.get('sha256') != sha256 or set(entry.get('encodings', {})) != set(ENCODINGS):
+        return False
+    return all(os.path.exists(os.path.join(directory, encoded['file'])) and
+               os.path.getsize(os.path.join(directory, encoded['file'])) == encoded['size']
+               for encoded in entry['encodings'].values())
+
+
+def publish_html(path: str, text: str, minify: bool = True) -> Dict:
+    """Write a (minified) page plus precompressed siblings; returns its manifest entry"""
+    directory, name = os.path.split(path)
+    data = (minify_html(text) if minify else text).encode('utf-8')
+    sha256 = _digest(data)
+    manifest = load_manifest(directory)
+    entry = manifest.get(name)
+    if _is_current(entry, directory, sha256) and os.path.exists(path) and os.path.getsize(path) == len(data):
+        return dict(entry, compressed=False)
+
+    _write(path, data)
+    entry = {'sha256': sha256, 'size': len(data), 'encodings': {}}
+    for encoding, (suffix, compress) in ENCODINGS.items():
+        encoded = compress(data)
+        _write(path + suffix, encoded)
+        entry['encodings'][encoding] = {'file': name + suffix, 'sha256': _digest(encoded), 'size': len(encoded)}
+    # A sibling from an encoding that is no longer produced would be served stale
+    for suffix in ALL_SUFFIXES:
+        if suffix not in (s for s, _ in ENCODINGS.values()) and os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+    manifest[name] = entry
+    _write(os.path.join(directory, MANIFEST_NAME), json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
+    return dict(entry, compressed=True)
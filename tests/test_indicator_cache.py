@@ -0,0 +1,50 @@
+"""Indicator cache invalidation when scoring code changes"""
+
+import importlib
+import sys
+
+from indicator_cache import IndicatorCache, _module_digests, code_fingerprint, payload_hash
+
+PLUGIN = '''
+THRESHOLD = {threshold}
+
+
+def _adjust(score):
+    return score - THRESHOLD
+
+
+def check(inputs):
+    return _adjust(inputs['score'])
+'''
+
+
+class _Details:
+    def to_dict(self):
+        return {}
+
+
+def _load_check(tmp_path, monkeypatch, threshold):
+    (tmp_path / 'fingerprint_plugin.py').write_text(PLUGIN.format(threshold=threshold))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    sys.modules.pop('fingerprint_plugin', None)
+    _module_digests.pop('fingerprint_plugin', None)  # A new process would hash the edited file
+    return importlib.import_module('fingerprint_plugin').check
+
+
+def test_editing_a_helper_or_threshold_invalidates_the_entry(tmp_path, monkeypatch):
+    cache = IndicatorCache(str(tmp_path / 'cache.json'))
+    inputs = {'score': 50}
+    check = _load_check(tmp_path, monkeypatch, threshold=10)
+    before = payload_hash({'code': code_fingerprint(check), 'inputs': inputs})
+    cache.put('plugin', before, check(inputs), _Details())
+    assert cache.get('plugin', before) is not None
+
+    check = _load_check(tmp_path, monkeypatch, threshold=20)  # check() itself is unchanged
+    after = payload_hash({'code': code_fingerprint(check), 'inputs': inputs})
+    assert after != before
+    assert cache.get('plugin', after) is None
+
+
+def test_fingerprint_is_stable_without_edits(tmp_path, monkeypatch):
+    first = code_fingerprint(_load_check(tmp_path, monkeypatch, threshold=10))
+    assert code_fingerprint(_load_check(tmp_path, monkeypatch, threshold=10)) == first
@@ -0,0 +1,29 @@
+"""Run store time range filters"""
+
+from datetime import date, datetime
+
+from payload_store import PayloadStore
+from run_store import RunStore
+
+
+def _store(tmp_path, *timestamps):
+    store = RunStore(str(tmp_path / 'runs.db'), PayloadStore(str(tmp_path / 'payloads')))
+    with store.conn:
+        store.conn.executemany(
+            "INSERT INTO runs (entity, timestamp, success_score, failure_risk) VALUES ('Tesla', ?, 50, 50)",
+            [(ts,) for ts in timestamps])
+    return store
+
+
+def test_until_date_includes_the_whole_day(tmp_path):
+    with _store(tmp_path, '2025-01-30T23:00:00', '2025-01-31T00:00:00',
+                '2025-01-31T18:30:00.123456', '2025-02-01T00:00:00') as store:
+        for until in ('2025-01-31', date(2025, 1, 31)):
+            assert [r['timestamp'] for r in store.runs(until=until)] == [
+                '2025-01-30T23:00:00', '2025-01-31T00:00:00', '2025-01-31T18:30:00.123456']
+
+
+def test_until_time_is_inclusive_to_the_instant(tmp_path):
+    with _store(tmp_path, '2025-01-31T12:00:00', '2025-01-31T12:00:01') as store:
+        assert len(store.runs(until='2025-01-31T12:00:00')) == 1
+        assert len(store.runs(until=datetime(2025, 1, 31, 12))) == 1
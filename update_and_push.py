@@ -4,7 +4,7 @@ Tesla Robotaxi Monitor - Auto Update & Push Script
 
 This script:
 1. Runs the monitoring system
-2. Extracts current scores from the output
+2. Reads current scores from the structured results file
 3. Updates README.md with latest data
 4. Commits and pushes all changes to GitHub
 
@@ -14,18 +14,19 @@ Usage:
     ./update_and_push.py (if chmod +x)
 """
 
+import glob
 import os
 import sys
-import json
 import subprocess
 import re
 from datetime import datetime
+from history_store import HistoryStore
+from results_export import load_results
 
 # Paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 README_PATH = os.path.join(SCRIPT_DIR, 'README.md')
-REPORT_PATH = os.path.join(SCRIPT_DIR, 'output', 'tesla_robotaxi_report.txt')
-HISTORY_PATH = os.path.join(SCRIPT_DIR, 'output', 'tesla_robotaxi_history.json')
+RESULTS_PATH = os.path.join(SCRIPT_DIR, 'output', 'tesla_robotaxi_results.json')
 
 def print_header(text):
     """Print formatted header"""
@@ -62,67 +63,35 @@ def run_monitor():
         return False
 
 def extract_scores():
-    """Extract scores from the monitoring report"""
-    print_header("📊 STEP 2: Extracting Current Scores")
+    """Read current scores from the monitor's structured results file"""
+    print_header("📊 STEP 2: Reading Current Scores")
     
-    if not os.path.exists(REPORT_PATH):
-        print(f"❌ Report file not found: {REPORT_PATH}")
+    if not os.path.exists(RESULTS_PATH):
+        print(f"❌ Results file not found: {RESULTS_PATH}")
         return None
     
     try:
-        with open(REPORT_PATH, 'r') as f:
-            content = f.read()
+        document = load_results(RESULTS_PATH)
         
-        # Extract overall scores
-        failure_risk_match = re.search(r'FAILURE RISK:\s*([0-9.]+)%', content)
-        success_score_match = re.search(r'OVERALL SUCCESS SCORE:\s*([0-9.]+)/100', content)
+        failure_risk = round(document['overall']['failure_risk'], 1)
+        success_score = round(document['overall']['success_score'], 1)
         
-        if not failure_risk_match or not success_score_match:
-            print("❌ Could not find overall scores in report")
-            return None
-        
-        failure_risk = float(failure_risk_match.group(1))
-        success_score = float(success_score_match.group(1))
-        
-        # Extract individual indicator scores
+        # Indicator title -> score and weight, in the monitor's display order
         scores = {}
-        
-        # Pattern to match indicator sections and their scores
-        indicator_pattern = r'([A-Z][A-Z\s]+)\n-+\nScore:\s*([0-9.]+)/100'
-        matches = re.finditer(indicator_pattern, content)
-        
-        for match in matches:
-            indicator_name = match.group(1).strip()
-            score = float(match.group(2))
-            
-            # Normalize indicator names
-            if 'REGULATORY' in indicator_name:
-                scores['Regulatory Sentiment'] = score
-            elif 'SAFETY' in indicator_name:
-                scores['Safety Incidents'] = score
-            elif 'TIMELINE' in indicator_name:
-                scores['Timeline Slippage'] = score
-            elif 'COMPETITOR' in indicator_name:
-                scores['Competitor Progress'] = score
-            elif 'INSIDER' in indicator_name:
-                scores['Insider Selling'] = score
-            elif 'NEWS' in indicator_name:
-                scores['News Sentiment'] = score
-            elif 'TECHNICAL' in indicator_name:
-                scores['Technical Progress'] = score
-            elif 'MARKET' in indicator_name:
-                scores['Market Confidence'] = score
-            elif 'EXECUTIVE' in indicator_name:
-                scores['Executive Departures'] = score
+        weights = {}
+        for indicator in document['indicators'].values():
+            scores[indicator['title']] = round(indicator['score'], 1)
+            weights[indicator['title']] = f"{indicator['weight'] * 100:.0f}%"
         
         result = {
             'failure_risk': failure_risk,
             'success_score': success_score,
             'scores': scores,
-            'timestamp': datetime.now().isoformat()
+            'weights': weights,
+            'timestamp': document['timestamp']
         }
         
-        print(f"✅ Extracted scores:")
+        print(f"✅ Read scores from {os.path.basename(RESULTS_PATH)}:")
         print(f"   Failure Risk: {failure_risk}%")
         print(f"   Success Score: {success_score}/100")
         print(f"   Individual indicators: {len(scores)}")
@@ -130,7 +99,7 @@ def extract_scores():
         return result
         
     except Exception as e:
-        print(f"❌ Error extracting scores: {e}")
+        print(f"❌ Error reading scores: {e}")
         return None
 
 def update_readme(scores_data):
@@ -177,41 +146,23 @@ def update_readme(scores_data):
         
         # Update indicator table
         table_rows = []
-        indicator_order = [
-            'Regulatory Sentiment', 'Safety Incidents', 'Timeline Slippage',
-            'Competitor Progress', 'Insider Selling', 'News Sentiment',
-            'Technical Progress', 'Market Confidence', 'Executive Departures'
-        ]
-        
-        weights = {
-            'Regulatory Sentiment': '20%',
-            'Safety Incidents': '20%',
-            'Timeline Slippage': '15%',
-            'Competitor Progress': '10%',
-            'Insider Selling': '10%',
-            'News Sentiment': '10%',
-            'Technical Progress': '10%',
-            'Market Confidence': '5%',
-            'Executive Departures': '0%'
-        }
+        weights = scores_data['weights']
         
-        for indicator in indicator_order:
-            if indicator in scores:
-                score = scores[indicator]
-                weight = weights.get(indicator, '0%')
-                
-                # Add emoji based on score
-                if score < 40:
-                    emoji = ' 🚨'
-                elif score < 50:
-                    emoji = ''
-                else:
-                    emoji = ''
-                
-                if indicator == 'Executive Departures':
-                    table_rows.append(f"| {indicator} | {weight} | Red Flag Indicator |")
-                else:
-                    table_rows.append(f"| {indicator} | {weight} | {score}/100{emoji} |")
+        for indicator, score in scores.items():
+            weight = weights.get(indicator, '0%')
+            
+            # Add emoji based on score
+            if score < 40:
+                emoji = ' 🚨'
+            elif score < 50:
+                emoji = ''
+            else:
+                emoji = ''
+            
+            if indicator == 'Executive Departures':
+                table_rows.append(f"| {indicator} | {weight} | Red Flag Indicator |")
+            else:
+                table_rows.append(f"| {indicator} | {weight} | {score}/100{emoji} |")
         
         # Replace table
         table_pattern = r'\| Indicator \| Weight \| Current Score \|\n\|[-|]+\|\n(?:\|.*\|\n)+'
@@ -235,6 +186,19 @@ def update_readme(scores_data):
         traceback.print_exc()
         return False
 
+def compact_history():
+    """Fold each history log into its JSON checkpoint so the published history is complete"""
+    try:
+        import config
+        mode = getattr(config, 'HISTORY_COMPACTION', 'full')
+    except ImportError:
+        mode = 'full'
+    for log_path in glob.glob(os.path.join(SCRIPT_DIR, 'output', '*_history.log')):
+        try:
+            HistoryStore(os.path.splitext(log_path)[0] + '.json', mode).compact()
+        except Exception as e:
+            print(f"⚠️  Could not compact {os.path.basename(log_path)}: {e}")
+
 def commit_and_push():
     """Commit and push changes to GitHub"""
     print_header("🚀 STEP 4: Committing and Pushing to GitHub")
@@ -262,13 +226,10 @@ def commit_and_push():
         # Create commit message with timestamp and scores
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
         
-        # Try to get failure risk from history
+        # Failure risk from the results file
         try:
-            with open(HISTORY_PATH, 'r') as f:
-                history = json.load(f)
-                latest_score = history['scores'][-1] if history['scores'] else 'N/A'
-            failure_risk = f"{100 - latest_score:.1f}%" if isinstance(latest_score, (int, float)) else 'N/A'
-        except:
+            failure_risk = f"{load_results(RESULTS_PATH)['overall']['failure_risk']:.1f}%"
+        except Exception:
             failure_risk = 'N/A'
         
         commit_message = f"""Update monitoring data and README - {timestamp}
@@ -325,7 +286,7 @@ def main():
     # Step 2: Extract scores
     scores_data = extract_scores()
     if not scores_data:
-        print("\n❌ FAILED: Could not extract scores from report")
+        print("\n❌ FAILED: Could not read scores from results file")
         sys.exit(1)
     
     # Step 3: Update README
@@ -334,6 +295,7 @@ def main():
         sys.exit(1)
     
     # Step 4: Commit and push
+    compact_history()
     if not commit_and_push():
         print("\n❌ FAILED: Could not commit and push changes")
         sys.exit(1)